@@ -15,7 +15,7 @@ class ResponseFormat(str, Enum):
 
 class SearchCompanyInput(BaseModel):
     """Input for searching company information on the web."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid", frozen=True)
 
     company_name: str = Field(
         ...,
@@ -36,7 +36,7 @@ class SearchCompanyInput(BaseModel):
 
 class AnalyzeRFPInput(BaseModel):
     """Input for analyzing an RFP document text."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid", frozen=True)
 
     rfp_text: str = Field(
         ...,
@@ -51,7 +51,7 @@ class AnalyzeRFPInput(BaseModel):
 
 class SearchLinkedInInput(BaseModel):
     """Input for searching company profiles on LinkedIn."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid", frozen=True)
 
     company_name: str = Field(
         ...,
@@ -73,6 +73,8 @@ class SearchLinkedInInput(BaseModel):
 
 class CompanyProfile(BaseModel):
     """Structured company information."""
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     sector: Optional[str] = None
     description: Optional[str] = None
@@ -87,6 +89,8 @@ class CompanyProfile(BaseModel):
 
 class RFPAnalysis(BaseModel):
     """Structured RFP analysis result."""
+    model_config = ConfigDict(defer_build=True)
+
     project_summary: str
     key_requirements: list[str] = Field(default_factory=list)
     technical_requirements: list[str] = Field(default_factory=list)
@@ -0,0 +1,44 @@
+"""Local reranker that keeps only the most relevant Tavily results.
+
+Scores (query, content) pairs with a small ONNX cross-encoder from the
+optional `fastembed` package in a single batched call. Without fastembed it
+falls back to the relevance score Tavily already returns per result.
+"""
+
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+RERANK_MODEL = "Xenova/ms-marco-MiniLM-L-6-v2"
+
+
+@lru_cache(maxsize=1)
+def _get_cross_encoder():
+    """Load the cross-encoder once, or return None if fastembed is missing."""
+    try:
+        from fastembed.rerank.cross_encoder import TextCrossEncoder
+    except ImportError:
+        logger.info("fastembed is not installed; ranking by Tavily score instead.")
+        return None
+    return TextCrossEncoder(model_name=RERANK_MODEL)
+
+
+def score_batch(query: str, results: list[dict[str, Any]]) -> list[float]:
+    """Relevance score per result, higher is better."""
+    encoder = _get_cross_encoder()
+    if encoder is None:
+        return [r.get("score") or 0.0 for r in results]
+    documents = [r.get("content") or "" for r in results]
+    return list(encoder.rerank(query, documents))
+
+
+async def top_results(query: str, results: list[dict[str, Any]], k: int) -> list[dict[str, Any]]:
+    """Return the `k` results most relevant to `query`, best first."""
+    if len(results) <= k:
+        return results
+    scores = await asyncio.to_thread(score_batch, query, results)
+    ranked = sorted(range(len(results)), key=lambda i: scores[i], reverse=True)
+    return [results[i] for i in ranked[:k]]
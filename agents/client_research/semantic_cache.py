@@ -0,0 +1,90 @@
+"""Semantic cache for near-duplicate Claude prompts in the Client Research Agent.
+
+Embeds the user content with a small local model and returns a stored
+response when a previous prompt (under the same system prompt) is close
+enough by cosine similarity. Requires the optional `fastembed` package;
+without it every lookup is a miss.
+"""
+
+import asyncio
+import logging
+import threading
+from functools import lru_cache
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+MAX_ENTRIES_PER_PROMPT = 256
+
+# system_prompt -> (normalized embedding rows, responses), kept in insertion order.
+# Lookups run in worker threads while stores run on the event loop, so every
+# access goes through the lock.
+_entries: dict[str, tuple[list, list[str]]] = {}
+_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_embedder():
+    """Load the embedding model once, or return None if fastembed is missing."""
+    try:
+        from fastembed import TextEmbedding
+    except ImportError:
+        logger.warning("fastembed is not installed; semantic cache disabled.")
+        return None
+    return TextEmbedding(model_name=EMBEDDING_MODEL)
+
+
+def _embed(text: str):
+    """Return a unit-length embedding for `text`, or None without an embedder."""
+    embedder = _get_embedder()
+    if embedder is None:
+        return None
+    import numpy as np
+
+    vector = np.asarray(next(iter(embedder.embed([text]))), dtype=np.float32)
+    return vector / (np.linalg.norm(vector) or 1.0)
+
+
+def _lookup(system_prompt: str, user_content: str):
+    vector = _embed(user_content)
+    if vector is None:
+        return None, None
+    with _lock:
+        # Snapshot both lists together so an eviction can't misalign them
+        vectors, responses = (list(rows) for rows in _entries.get(system_prompt, ([], [])))
+    if vectors:
+        import numpy as np
+
+        scores = np.stack(vectors) @ vector
+        best = int(scores.argmax())
+        if scores[best] >= settings.semantic_cache_threshold:
+            return responses[best], vector
+    return None, vector
+
+
+def _store(system_prompt: str, vector, response: str) -> None:
+    with _lock:
+        vectors, responses = _entries.setdefault(system_prompt, ([], []))
+        vectors.append(vector)
+        responses.append(response)
+        if len(vectors) > MAX_ENTRIES_PER_PROMPT:
+            del vectors[0], responses[0]
+
+
+async def lookup(system_prompt: str, user_content: str):
+    """Return (cached_response, embedding); the response is None on a miss.
+
+    The embedding is handed back so `store` can reuse it after the API call.
+    """
+    if not settings.semantic_cache_enabled:
+        return None, None
+    return await asyncio.to_thread(_lookup, system_prompt, user_content)
+
+
+def store(system_prompt: str, vector, response: str) -> None:
+    """Remember a response under the embedding returned by `lookup`."""
+    if vector is None:
+        return
+    _store(system_prompt, vector, response)
@@ -6,12 +6,6 @@ Exposes tools for researching client companies:
 - search_linkedin_company: LinkedIn profile and decision maker search
 """
 
-import sys
-import os
-
-# Add project root to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
-
 from mcp.server.fastmcp import FastMCP
 
 from agents.client_research.models import (
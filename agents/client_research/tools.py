@@ -4,12 +4,25 @@ Contains the business logic for each tool, separated from the MCP server
 definition for testability and reusability.
 """
 
-import json
-import httpx
+import asyncio
+import re
+import time
 from typing import Any
 
+import httpx
+import orjson
+from pydantic import ValidationError
+
 from config.settings import settings
-from shared.utils import format_json_response, handle_api_error
+from shared import llm_cache
+from shared.utils import (
+    backoff_delay,
+    format_json_response,
+    get_http_client,
+    handle_api_error,
+    retry_delay,
+)
+from agents.client_research import reranker, semantic_cache
 from agents.client_research.models import (
     CompanyProfile,
     RFPAnalysis,
@@ -20,63 +33,149 @@ from agents.client_research.models import (
 
 TAVILY_API_URL = "https://api.tavily.com/search"
 TAVILY_TIMEOUT = 30.0
+TAVILY_STATIC_BODY = {
+    "api_key": settings.tavily_api_key,
+    "include_answer": True,
+    "include_raw_content": False,
+    "search_depth": "advanced",
+}
+MAX_SOURCE_CHARS = 1200
+RERANK_TOP_K = 2  # sources per query passed on to Claude
+
+# Inputs below these limits are rejected before any API call
+MIN_RFP_CHARS = 200
+MIN_RFP_WORDS = 20
+NO_WORD_CHARS = re.compile(r"[\W_]+")
 
 ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
 ANTHROPIC_MODEL = "claude-haiku-4-5-20251001"
 ANTHROPIC_TIMEOUT = 60.0
+ANTHROPIC_RETRY_DEADLINE = 180.0  # overall budget for one call, including retries
+ANTHROPIC_HEADERS = {
+    "x-api-key": settings.anthropic_api_key,
+    "anthropic-version": "2023-06-01",
+    "content-type": "application/json",
+}
+
+
+# ── System Prompts ─────────────────────────────────────────────────
+# Kept at module level so the text is byte-identical across calls, which
+# Anthropic prompt caching requires for a cache hit.
+
+COMPANY_PROFILE_PROMPT = """You are a business research analyst. Extract structured company 
+information from search results. Respond ONLY with a valid JSON object matching this schema:
+{
+    "name": "string",
+    "sector": "string or null",
+    "description": "brief company description",
+    "size": "estimated employee count/range or null",
+    "location": "headquarters location or null",
+    "website": "main website URL or null",
+    "funding": "funding info or null",
+    "technologies": ["list of technologies they use or offer"],
+    "key_people": ["CEO: Name", "CTO: Name"],
+    "recent_news": ["brief news items"]
+}
+Do NOT include markdown backticks. Return ONLY the JSON object."""
+
+RFP_ANALYSIS_PROMPT = """You are an expert proposal analyst. Analyze the RFP document and 
+extract structured information. Respond ONLY with a valid JSON object matching this schema:
+{
+    "project_summary": "2-3 sentence summary of what the client needs",
+    "key_requirements": ["list of main business requirements"],
+    "technical_requirements": ["list of technical requirements"],
+    "budget_indicators": "any budget mentions or constraints, or null",
+    "timeline_indicators": "any timeline/deadline info, or null",
+    "evaluation_criteria": ["how proposals will be evaluated"],
+    "risks_and_concerns": ["potential risks or red flags"]
+}
+Do NOT include markdown backticks. Return ONLY the JSON object."""
+
+LINKEDIN_PROMPT = """You are a business intelligence analyst. From LinkedIn search results, 
+extract company and people information. Respond ONLY with a valid JSON object:
+{
+    "company_linkedin_url": "LinkedIn company page URL or null",
+    "company_summary": "brief description from LinkedIn or null",
+    "employee_count": "estimated from LinkedIn or null",
+    "industry": "industry from LinkedIn or null",
+    "decision_makers": [
+        {"name": "Full Name", "role": "Title", "linkedin_url": "URL or null"}
+    ],
+    "insights": ["any useful insights from LinkedIn presence"]
+}
+Do NOT include markdown backticks. Return ONLY the JSON object."""
 
 
 # ── Tavily Web Search ──────────────────────────────────────────────
 
 async def search_web(query: str, max_results: int = 5) -> list[dict[str, Any]]:
     """Search the web using Tavily API."""
-    async with httpx.AsyncClient(timeout=TAVILY_TIMEOUT) as client:
-        response = await client.post(
-            TAVILY_API_URL,
-            json={
-                "api_key": settings.tavily_api_key,
-                "query": query,
-                "max_results": max_results,
-                "include_answer": True,
-                "include_raw_content": False,
-                "search_depth": "advanced",
-            },
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("results", []), data.get("answer", "")
+    client = get_http_client("tavily", TAVILY_TIMEOUT)
+    response = await client.post(
+        TAVILY_API_URL,
+        content=orjson.dumps({**TAVILY_STATIC_BODY, "query": query, "max_results": max_results}),
+        headers={"content-type": "application/json"},
+    )
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    return data.get("results", []), data.get("answer", "")
 
 
 # ── Claude Analysis ────────────────────────────────────────────────
 
 async def analyze_with_claude(system_prompt: str, user_content: str) -> str:
-    """Send content to Claude for analysis with retry on rate limits."""
+    """Send content to Claude for analysis, retrying rate limits and transient failures."""
+    cache_key = llm_cache.make_key(ANTHROPIC_MODEL, system_prompt, user_content)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    cached, embedding = await semantic_cache.lookup(system_prompt, user_content)
+    if cached is not None:
+        return cached
+
+    client = get_http_client("anthropic", ANTHROPIC_TIMEOUT, http2=True)
+    # Serialized once so every retry resends the same bytes
+    body = orjson.dumps({
+        "model": ANTHROPIC_MODEL,
+        "max_tokens": 2000,
+        "system": [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+        "messages": [{"role": "user", "content": user_content}],
+    })
+    deadline = time.monotonic() + ANTHROPIC_RETRY_DEADLINE
     max_retries = 5
     for attempt in range(max_retries):
-        async with httpx.AsyncClient(timeout=ANTHROPIC_TIMEOUT) as client:
+        delay = backoff_delay(attempt)
+        try:
             response = await client.post(
                 ANTHROPIC_API_URL,
-                headers={
-                    "x-api-key": settings.anthropic_api_key,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": ANTHROPIC_MODEL,
-                    "max_tokens": 2000,
-                    "system": system_prompt,
-                    "messages": [{"role": "user", "content": user_content}],
-                },
+                headers=ANTHROPIC_HEADERS,
+                content=body,
             )
-            if response.status_code == 429:
-                import asyncio
-                wait_time = (attempt + 1) * 15
-                await asyncio.sleep(wait_time)
-                continue
-            response.raise_for_status()
-            data = response.json()
-            return data["content"][0]["text"]
-    raise RuntimeError("Claude API rate limit exceeded in client research after all retries.")
+        except httpx.TransportError:
+            if attempt == max_retries - 1 or time.monotonic() + delay > deadline:
+                raise
+            await asyncio.sleep(delay)
+            continue
+
+        # 429 and 5xx are transient; any other error status fails fast
+        transient = response.status_code == 429 or response.status_code >= 500
+        if transient:
+            delay = retry_delay(response, attempt)
+        if transient and attempt < max_retries - 1 and time.monotonic() + delay < deadline:
+            await asyncio.sleep(delay)
+            continue
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        text = data["content"][0]["text"]
+        await llm_cache.store(cache_key, text)
+        semantic_cache.store(system_prompt, embedding, text)
+        return text
 
 
 # ── Tool: Search Company Info ──────────────────────────────────────
@@ -93,6 +192,12 @@ async def search_company_info(
     3. Returns a CompanyProfile
     """
     try:
+        if NO_WORD_CHARS.fullmatch(company_name):
+            return format_json_response({
+                "error": f"'{company_name}' is not a valid company name",
+                "suggestion": "Provide the company's name using letters or digits",
+            })
+
         # Build search query
         query = f"{company_name} company info sector size funding"
         if additional_context:
@@ -107,70 +212,60 @@ async def search_company_info(
                 "suggestion": "Try adding more context about the company",
             })
 
+        # Keep only the most relevant sources for Claude
+        results = await reranker.top_results(query, results, RERANK_TOP_K)
+
         # Prepare context for Claude
-        search_context = f"Tavily summary: {tavily_answer}\n\n"
+        context_parts = [f"Tavily summary: {tavily_answer}\n\n"]
         for i, r in enumerate(results, 1):
-            search_context += f"Source {i}: {r.get('title', 'N/A')}\n"
-            search_context += f"URL: {r.get('url', 'N/A')}\n"
-            search_context += f"Content: {r.get('content', 'N/A')}\n\n"
+            context_parts.append(
+                f"Source {i}: {r.get('title', 'N/A')}\n"
+                f"URL: {r.get('url', 'N/A')}\n"
+                f"Content: {(r.get('content') or 'N/A')[:MAX_SOURCE_CHARS]}\n\n"
+            )
+        search_context = "".join(context_parts)
 
         # Analyze with Claude
-        system_prompt = """You are a business research analyst. Extract structured company 
-information from search results. Respond ONLY with a valid JSON object matching this schema:
-{
-    "name": "string",
-    "sector": "string or null",
-    "description": "brief company description",
-    "size": "estimated employee count/range or null",
-    "location": "headquarters location or null",
-    "website": "main website URL or null",
-    "funding": "funding info or null",
-    "technologies": ["list of technologies they use or offer"],
-    "key_people": ["CEO: Name", "CTO: Name"],
-    "recent_news": ["brief news items"]
-}
-Do NOT include markdown backticks. Return ONLY the JSON object."""
-
         claude_response = await analyze_with_claude(
-            system_prompt,
+            COMPANY_PROFILE_PROMPT,
             f"Research this company: {company_name}\n\nSearch results:\n{search_context}",
         )
 
         # Parse Claude's response into CompanyProfile
-        profile_data = json.loads(claude_response.strip())
-        profile = CompanyProfile(**profile_data)
-
         if response_format == ResponseFormat.JSON:
-            return format_json_response(profile.model_dump())
+            # Parse and validate in a single pass
+            profile = CompanyProfile.model_validate_json(claude_response)
+            return profile.model_dump_json(indent=2)
+
+        # Markdown only reads the fields back, so skip validation
+        profile = CompanyProfile.model_construct(**orjson.loads(claude_response))
 
         # Markdown format
-        md = f"# 🏢 {profile.name}\n\n"
+        parts = [f"# 🏢 {profile.name}\n\n"]
         if profile.description:
-            md += f"{profile.description}\n\n"
+            parts.append(f"{profile.description}\n\n")
         if profile.sector:
-            md += f"**Sector:** {profile.sector}\n"
+            parts.append(f"**Sector:** {profile.sector}\n")
         if profile.size:
-            md += f"**Size:** {profile.size}\n"
+            parts.append(f"**Size:** {profile.size}\n")
         if profile.location:
-            md += f"**Location:** {profile.location}\n"
+            parts.append(f"**Location:** {profile.location}\n")
         if profile.website:
-            md += f"**Website:** {profile.website}\n"
+            parts.append(f"**Website:** {profile.website}\n")
         if profile.funding:
-            md += f"**Funding:** {profile.funding}\n"
+            parts.append(f"**Funding:** {profile.funding}\n")
         if profile.technologies:
-            md += f"\n**Technologies:** {', '.join(profile.technologies)}\n"
+            parts.append(f"\n**Technologies:** {', '.join(profile.technologies)}\n")
         if profile.key_people:
-            md += "\n**Key People:**\n"
-            for person in profile.key_people:
-                md += f"- {person}\n"
+            parts.append("\n**Key People:**\n")
+            parts.extend(f"- {person}\n" for person in profile.key_people)
         if profile.recent_news:
-            md += "\n**Recent News:**\n"
-            for news in profile.recent_news:
-                md += f"- {news}\n"
+            parts.append("\n**Recent News:**\n")
+            parts.extend(f"- {news}\n" for news in profile.recent_news)
 
-        return md
+        return "".join(parts)
 
-    except json.JSONDecodeError:
+    except (orjson.JSONDecodeError, ValidationError):
         return format_json_response({
             "error": "Failed to parse company analysis",
             "raw_response": claude_response[:500],
@@ -191,66 +286,56 @@ async def analyze_rfp_document(
     timeline, evaluation criteria, and risks.
     """
     try:
-        system_prompt = """You are an expert proposal analyst. Analyze the RFP document and 
-extract structured information. Respond ONLY with a valid JSON object matching this schema:
-{
-    "project_summary": "2-3 sentence summary of what the client needs",
-    "key_requirements": ["list of main business requirements"],
-    "technical_requirements": ["list of technical requirements"],
-    "budget_indicators": "any budget mentions or constraints, or null",
-    "timeline_indicators": "any timeline/deadline info, or null",
-    "evaluation_criteria": ["how proposals will be evaluated"],
-    "risks_and_concerns": ["potential risks or red flags"]
-}
-Do NOT include markdown backticks. Return ONLY the JSON object."""
+        if len(rfp_text) < MIN_RFP_CHARS or len(rfp_text.split()) < MIN_RFP_WORDS:
+            return format_json_response({
+                "error": "RFP text too short to analyze meaningfully",
+                "suggestion": f"Provide at least {MIN_RFP_CHARS} characters of the RFP document",
+            })
 
         claude_response = await analyze_with_claude(
-            system_prompt,
+            RFP_ANALYSIS_PROMPT,
             f"Analyze this RFP document:\n\n{rfp_text}",
         )
 
-        analysis_data = json.loads(claude_response.strip())
-        analysis = RFPAnalysis(**analysis_data)
-
         if response_format == ResponseFormat.JSON:
-            return format_json_response(analysis.model_dump())
+            # Parse and validate in a single pass
+            analysis = RFPAnalysis.model_validate_json(claude_response)
+            return analysis.model_dump_json(indent=2)
+
+        # Markdown only reads the fields back, so skip validation
+        analysis = RFPAnalysis.model_construct(**orjson.loads(claude_response))
 
         # Markdown format
-        md = "# 📋 RFP Analysis\n\n"
-        md += f"## Summary\n{analysis.project_summary}\n\n"
+        parts = ["# 📋 RFP Analysis\n\n", f"## Summary\n{analysis.project_summary}\n\n"]
 
         if analysis.key_requirements:
-            md += "## Key Requirements\n"
-            for req in analysis.key_requirements:
-                md += f"- {req}\n"
-            md += "\n"
+            parts.append("## Key Requirements\n")
+            parts.extend(f"- {req}\n" for req in analysis.key_requirements)
+            parts.append("\n")
 
         if analysis.technical_requirements:
-            md += "## Technical Requirements\n"
-            for req in analysis.technical_requirements:
-                md += f"- {req}\n"
-            md += "\n"
+            parts.append("## Technical Requirements\n")
+            parts.extend(f"- {req}\n" for req in analysis.technical_requirements)
+            parts.append("\n")
 
         if analysis.budget_indicators:
-            md += f"## Budget\n{analysis.budget_indicators}\n\n"
+            parts.append(f"## Budget\n{analysis.budget_indicators}\n\n")
 
         if analysis.timeline_indicators:
-            md += f"## Timeline\n{analysis.timeline_indicators}\n\n"
+            parts.append(f"## Timeline\n{analysis.timeline_indicators}\n\n")
 
         if analysis.evaluation_criteria:
-            md += "## Evaluation Criteria\n"
-            for criteria in analysis.evaluation_criteria:
-                md += f"- {criteria}\n"
-            md += "\n"
+            parts.append("## Evaluation Criteria\n")
+            parts.extend(f"- {criteria}\n" for criteria in analysis.evaluation_criteria)
+            parts.append("\n")
 
         if analysis.risks_and_concerns:
-            md += "## ⚠️ Risks & Concerns\n"
-            for risk in analysis.risks_and_concerns:
-                md += f"- {risk}\n"
+            parts.append("## ⚠️ Risks & Concerns\n")
+            parts.extend(f"- {risk}\n" for risk in analysis.risks_and_concerns)
 
-        return md
+        return "".join(parts)
 
-    except json.JSONDecodeError:
+    except (orjson.JSONDecodeError, ValidationError):
         return format_json_response({
             "error": "Failed to parse RFP analysis",
             "raw_response": claude_response[:500],
@@ -273,6 +358,12 @@ async def search_linkedin_company(
     publicly available LinkedIn information.
     """
     try:
+        if NO_WORD_CHARS.fullmatch(company_name):
+            return format_json_response({
+                "error": f"'{company_name}' is not a valid company name",
+                "suggestion": "Provide the company's name using letters or digits",
+            })
+
         # Search LinkedIn pages via Tavily
         queries = [
             f"site:linkedin.com/company {company_name}",
@@ -282,10 +373,21 @@ async def search_linkedin_company(
                 f"site:linkedin.com/in {company_name} CTO OR CEO OR 'VP Engineering' OR Director"
             )
 
+        # Run the searches concurrently; a failed query just contributes nothing
+        # unless every query failed, in which case the first error is reported.
+        gathered = await asyncio.gather(
+            *(search_web(query, max_results=5) for query in queries),
+            return_exceptions=True,
+        )
+        if all(isinstance(outcome, Exception) for outcome in gathered):
+            raise gathered[0]
+
         all_results = []
-        for query in queries:
-            results, _ = await search_web(query, max_results=5)
-            all_results.extend(results)
+        for query, outcome in zip(queries, gathered):
+            if isinstance(outcome, Exception):
+                continue
+            results, _ = outcome
+            all_results.extend(await reranker.top_results(query, results, RERANK_TOP_K))
 
         if not all_results:
             return format_json_response({
@@ -294,63 +396,49 @@ async def search_linkedin_company(
             })
 
         # Prepare context for Claude
-        search_context = ""
-        for i, r in enumerate(all_results, 1):
-            search_context += f"Result {i}: {r.get('title', 'N/A')}\n"
-            search_context += f"URL: {r.get('url', 'N/A')}\n"
-            search_context += f"Content: {r.get('content', 'N/A')}\n\n"
-
-        system_prompt = """You are a business intelligence analyst. From LinkedIn search results, 
-extract company and people information. Respond ONLY with a valid JSON object:
-{
-    "company_linkedin_url": "LinkedIn company page URL or null",
-    "company_summary": "brief description from LinkedIn or null",
-    "employee_count": "estimated from LinkedIn or null",
-    "industry": "industry from LinkedIn or null",
-    "decision_makers": [
-        {"name": "Full Name", "role": "Title", "linkedin_url": "URL or null"}
-    ],
-    "insights": ["any useful insights from LinkedIn presence"]
-}
-Do NOT include markdown backticks. Return ONLY the JSON object."""
+        search_context = "".join(
+            f"Result {i}: {r.get('title', 'N/A')}\n"
+            f"URL: {r.get('url', 'N/A')}\n"
+            f"Content: {(r.get('content') or 'N/A')[:MAX_SOURCE_CHARS]}\n\n"
+            for i, r in enumerate(all_results, 1)
+        )
 
         claude_response = await analyze_with_claude(
-            system_prompt,
+            LINKEDIN_PROMPT,
             f"Extract LinkedIn info for: {company_name}\n\nSearch results:\n{search_context}",
         )
 
-        data = json.loads(claude_response.strip())
+        data = orjson.loads(claude_response)
 
         if response_format == ResponseFormat.JSON:
-            return format_json_response(data)
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
 
         # Markdown format
-        md = f"# 🔗 LinkedIn Research: {company_name}\n\n"
+        parts = [f"# 🔗 LinkedIn Research: {company_name}\n\n"]
         if data.get("company_linkedin_url"):
-            md += f"**Profile:** {data['company_linkedin_url']}\n"
+            parts.append(f"**Profile:** {data['company_linkedin_url']}\n")
         if data.get("company_summary"):
-            md += f"**About:** {data['company_summary']}\n"
+            parts.append(f"**About:** {data['company_summary']}\n")
         if data.get("employee_count"):
-            md += f"**Employees:** {data['employee_count']}\n"
+            parts.append(f"**Employees:** {data['employee_count']}\n")
         if data.get("industry"):
-            md += f"**Industry:** {data['industry']}\n"
+            parts.append(f"**Industry:** {data['industry']}\n")
 
         if data.get("decision_makers"):
-            md += "\n## 👤 Decision Makers\n"
+            parts.append("\n## 👤 Decision Makers\n")
             for person in data["decision_makers"]:
-                md += f"- **{person.get('name', 'N/A')}** — {person.get('role', 'N/A')}"
+                parts.append(f"- **{person.get('name', 'N/A')}** — {person.get('role', 'N/A')}")
                 if person.get("linkedin_url"):
-                    md += f" ([LinkedIn]({person['linkedin_url']}))"
-                md += "\n"
+                    parts.append(f" ([LinkedIn]({person['linkedin_url']}))")
+                parts.append("\n")
 
         if data.get("insights"):
-            md += "\n## 💡 Insights\n"
-            for insight in data["insights"]:
-                md += f"- {insight}\n"
+            parts.append("\n## 💡 Insights\n")
+            parts.extend(f"- {insight}\n" for insight in data["insights"])
 
-        return md
+        return "".join(parts)
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return format_json_response({
             "error": "Failed to parse LinkedIn analysis",
             "raw_response": claude_response[:500],
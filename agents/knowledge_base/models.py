@@ -15,7 +15,7 @@ class ResponseFormat(str, Enum):
 
 class SearchProjectsInput(BaseModel):
     """Input for searching past projects by keywords or requirements."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid", frozen=True)
 
     query: str = Field(
         ...,
@@ -41,7 +41,7 @@ class SearchProjectsInput(BaseModel):
 
 class GetProjectDetailsInput(BaseModel):
     """Input for getting full details of a specific project."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid", frozen=True)
 
     project_id: str = Field(
         ...,
@@ -56,7 +56,7 @@ class GetProjectDetailsInput(BaseModel):
 
 class SearchTechStackInput(BaseModel):
     """Input for finding projects by technology stack."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid", frozen=True)
 
     technologies: list[str] = Field(
         ...,
@@ -76,7 +76,7 @@ class SearchTechStackInput(BaseModel):
 
 class GetCaseStudiesInput(BaseModel):
     """Input for retrieving case studies relevant to a proposal."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid", frozen=True)
 
     client_sector: str = Field(
         ...,
@@ -93,10 +93,32 @@ class GetCaseStudiesInput(BaseModel):
     )
 
 
+class GetCaseStudiesBatchInput(BaseModel):
+    """Input for retrieving case studies for several sectors at once."""
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid", frozen=True)
+
+    client_sectors: list[str] = Field(
+        ...,
+        description="Sectors to find case studies for (e.g., ['Fintech', 'Healthcare'])",
+        min_length=1,
+        max_length=10,
+    )
+    project_type: Optional[str] = Field(
+        default=None,
+        description="Type of project (e.g., 'mobile app', 'dashboard', 'platform')",
+    )
+    response_format: ResponseFormat = Field(
+        default=ResponseFormat.MARKDOWN,
+        description="Output format: 'markdown' or 'json'",
+    )
+
+
 # ── Data Models ────────────────────────────────────────────────────
 
 class ProjectSummary(BaseModel):
     """Lightweight project info for search results."""
+    model_config = ConfigDict(defer_build=True)
+
     project_id: str
     name: str
     client: str
@@ -109,6 +131,8 @@ class ProjectSummary(BaseModel):
 
 class ProjectDetail(BaseModel):
     """Full project information."""
+    model_config = ConfigDict(defer_build=True)
+
     project_id: str
     name: str
     client: str
@@ -5,13 +5,9 @@ Exposes tools for searching internal projects and documentation:
 - get_project_details: Full details of a specific project
 - search_tech_stack: Find projects by technologies used
 - get_case_studies: Retrieve relevant case studies for proposals
+- get_case_studies_batch: Case studies for several sectors in one call
 """
 
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
-
 from mcp.server.fastmcp import FastMCP
 
 from agents.knowledge_base.models import (
@@ -19,12 +15,14 @@ from agents.knowledge_base.models import (
     GetProjectDetailsInput,
     SearchTechStackInput,
     GetCaseStudiesInput,
+    GetCaseStudiesBatchInput,
 )
 from agents.knowledge_base.tools import (
     search_past_projects,
     get_project_details,
     search_tech_stack,
     get_case_studies,
+    get_case_studies_batch,
 )
 
 # ── MCP Server ─────────────────────────────────────────────────────
@@ -161,6 +159,38 @@ async def tool_case_studies(params: GetCaseStudiesInput) -> str:
     )
 
 
+@mcp.tool(
+    name="get_case_studies_batch",
+    annotations={
+        "title": "Get Case Studies for Several Sectors",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    },
+)
+async def tool_case_studies_batch(params: GetCaseStudiesBatchInput) -> str:
+    """Retrieve case studies for several client sectors in one call.
+
+    Searches all sectors concurrently, which is faster than calling
+    get_case_studies once per sector.
+
+    Args:
+        params (GetCaseStudiesBatchInput): Contains:
+            - client_sectors (list[str]): Sectors to search (e.g., ['Fintech', 'Healthcare'])
+            - project_type (Optional[str]): Type of project (e.g., 'mobile app')
+            - response_format (ResponseFormat): 'markdown' or 'json'
+
+    Returns:
+        str: Relevant case studies for each sector
+    """
+    return await get_case_studies_batch(
+        client_sectors=params.client_sectors,
+        project_type=params.project_type,
+        response_format=params.response_format,
+    )
+
+
 # ── Entrypoint ─────────────────────────────────────────────────────
 
 if __name__ == "__main__":
@@ -4,15 +4,25 @@ Uses a JSON-based project store with keyword + AI-powered relevance scoring.
 Can be upgraded to a vector database (ChromaDB, Pinecone) for semantic search.
 """
 
-import json
+import asyncio
 import os
-from typing import Any
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable
 from pathlib import Path
 
-import httpx
+import orjson
+from typing_extensions import TypedDict
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    import ahocorasick
+except ImportError:  # optional: faster multi-term keyword matching
+    ahocorasick = None
 
 from config.settings import settings
-from shared.utils import format_json_response, handle_api_error
+from shared.utils import format_json_response, get_http_client, handle_api_error
 from agents.knowledge_base.models import (
     ResponseFormat,
     ProjectSummary,
@@ -27,25 +37,136 @@ PROJECTS_FILE = DATA_DIR / "projects.json"
 ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
 ANTHROPIC_MODEL = "claude-haiku-4-5-20251001"
 ANTHROPIC_TIMEOUT = 60.0
+ANTHROPIC_HEADERS = {
+    "x-api-key": settings.anthropic_api_key,
+    "anthropic-version": "2023-06-01",
+    "content-type": "application/json",
+}
+
+MAX_RANK_CANDIDATES = 20
+CASE_STUDY_COUNT = 3
+DECISIVE_KEYWORD_MARGIN = 0.3  # lead over the runner-up needed to skip Claude ranking
+RANK_TOKENS_PER_PROJECT = 40  # one compact {"project_id", "relevance_score"} entry
+RANK_DESCRIPTION_CHARS = 200
+
+# Constant so the prefix stays byte-identical for Anthropic prompt caching
+RANKER_PROMPT = (
+    "You are a project matching engine. Given a query and a list of projects, "
+    "rank the project_ids by relevance (most relevant first) with a "
+    "relevance_score (0.0 to 1.0) for each, and report them with the rank tool."
+)
+
+# Forcing this tool makes Claude reply with schema-shaped JSON instead of free text
+RANK_TOOL = {
+    "name": "rank",
+    "description": "Report projects ordered by relevance to the query.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "rankings": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "project_id": {"type": "string"},
+                        "relevance_score": {"type": "number", "minimum": 0, "maximum": 1},
+                    },
+                    "required": ["project_id", "relevance_score"],
+                },
+            },
+        },
+        "required": ["rankings"],
+    },
+}
+
+
+class _SearchResults(TypedDict):
+    """JSON envelope returned by search_past_projects."""
+
+    query: str
+    total_found: int
+    projects: list[ProjectSummary]
+
+
+# Serializes the envelope and its summaries in one pass through pydantic-core
+_SEARCH_RESULTS_ADAPTER = TypeAdapter(_SearchResults)
 
 
 # ── Data Layer ─────────────────────────────────────────────────────
 
-def _load_projects() -> list[dict[str, Any]]:
-    """Load projects from the JSON knowledge base."""
-    if not PROJECTS_FILE.exists():
-        return []
-    with open(PROJECTS_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+@dataclass(frozen=True)
+class _ProjectStore:
+    """Parsed projects.json plus the lookup structures derived from it."""
+
+    mtime_ns: int
+    projects: list[dict[str, Any]]
+    token_index: dict[str, set[int]]  # whitespace token -> project indices
+    tech_index: dict[str, set[int]]  # lowercased technology -> project indices
+    sector_index: dict[str, list[int]]  # lowercased sector -> project indices
+    by_id: dict[str, dict[str, Any]]  # upper-cased project_id -> project
+    details: dict[str, ProjectDetail]  # upper-cased project_id -> validated detail
+    # (upper-cased project_id, format) -> rendered get_project_details output
+    rendered: dict[tuple[str, ResponseFormat], str] = field(default_factory=dict)
+
+
+_EMPTY_STORE = _ProjectStore(
+    mtime_ns=0,
+    projects=[],
+    token_index={},
+    tech_index={},
+    sector_index={},
+    by_id={},
+    details={},
+)
+
+# Rebuilt only when the file's mtime changes
+_store: _ProjectStore | None = None
 
 
-def _keyword_score(project: dict, query_terms: list[str]) -> float:
-    """Calculate a basic keyword relevance score (0.0 - 1.0).
+def _load_store() -> _ProjectStore:
+    """Load the knowledge base, reusing the last parse while the file is unchanged.
 
-    Searches across name, description, tags, tech_stack, sector,
-    and key_features for matching terms.
+    The store is shared between calls, so callers must not mutate it.
     """
-    searchable_text = " ".join([
+    global _store
+    try:
+        mtime = PROJECTS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return _EMPTY_STORE
+    if _store is None or _store.mtime_ns != mtime:
+        projects = orjson.loads(PROJECTS_FILE.read_bytes())
+        index: dict[str, set[int]] = {}
+        tech_index: dict[str, set[int]] = {}
+        sector_index: dict[str, list[int]] = {}
+        for i, project in enumerate(projects):
+            _precompute_search_fields(project)
+            for token in set(project["_search_blob"].split()):
+                index.setdefault(token, set()).add(i)
+            for tech in project["_tech_set"]:
+                tech_index.setdefault(tech, set()).add(i)
+            sector_index.setdefault(project.get("sector", "").lower(), []).append(i)
+        by_id = {p["project_id"].upper(): p for p in projects}
+        details = {}
+        for key, project in by_id.items():
+            try:
+                details[key] = ProjectDetail.model_validate(project)
+            except ValidationError:
+                pass  # reported when this project is requested
+        _store = _ProjectStore(
+            mtime_ns=mtime,
+            projects=projects,
+            token_index=index,
+            tech_index=tech_index,
+            sector_index=sector_index,
+            by_id=by_id,
+            details=details,
+        )
+    return _store
+
+
+def _precompute_search_fields(project: dict[str, Any]) -> None:
+    """Attach the lowercased search text and tech set used by the search tools."""
+    project["_search_blob"] = " ".join([
         project.get("name", ""),
         project.get("description", ""),
         project.get("sector", ""),
@@ -54,12 +175,64 @@ def _keyword_score(project: dict, query_terms: list[str]) -> float:
         " ".join(project.get("tech_stack", [])),
         " ".join(project.get("key_features", [])),
     ]).lower()
+    project["_tech_set"] = frozenset(t.lower() for t in project.get("tech_stack", []))
+
+
+@lru_cache(maxsize=256)
+def _query_terms(query: str) -> tuple[str, ...]:
+    """Lowercased search terms of a query, ignoring words of two letters or less."""
+    return tuple(t for t in query.lower().split() if len(t) > 2)
+
+
+@lru_cache(maxsize=256)
+def _term_matcher(terms: frozenset[str]) -> Callable[[str], set[str]]:
+    """Return a function giving the query terms contained in a token.
+
+    Cached so recurring queries (e.g. repeated get_case_studies sectors)
+    reuse the compiled automaton or pattern.
+
+    With the optional `pyahocorasick` package every term is found in a single
+    automaton pass per token; otherwise a precompiled alternation discards
+    non-matching tokens before the per-term substring checks.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for term in terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+        return lambda token: {term for _, term in automaton.iter(token)}
+
+    pattern = re.compile("|".join(re.escape(term) for term in terms))
 
+    def match(token: str) -> set[str]:
+        if not pattern.search(token):
+            return set()
+        return {term for term in terms if term in token}
+
+    return match
+
+
+def _keyword_hits(index: dict[str, set[int]], query_terms: tuple[str, ...]) -> dict[int, int]:
+    """Count how many query terms each project's search text contains.
+
+    Query terms never contain whitespace, so a substring match always falls
+    inside one whitespace-separated token; scanning the token vocabulary is
+    equivalent to scanning every project's text, but far smaller.
+    """
     if not query_terms:
-        return 0.0
+        return {}
+
+    matcher = _term_matcher(frozenset(query_terms))
+    term_projects: dict[str, set[int]] = {term: set() for term in query_terms}
+    for token, ids in index.items():
+        for term in matcher(token):
+            term_projects[term] |= ids
 
-    matches = sum(1 for term in query_terms if term.lower() in searchable_text)
-    return round(matches / len(query_terms), 2)
+    hits: dict[int, int] = {}
+    for term in query_terms:
+        for i in term_projects[term]:
+            hits[i] = hits.get(i, 0) + 1
+    return hits
 
 
 async def _rank_with_claude(query: str, projects: list[dict]) -> list[dict]:
@@ -73,52 +246,107 @@ async def _rank_with_claude(query: str, projects: list[dict]) -> list[dict]:
             "project_id": p["project_id"],
             "name": p["name"],
             "sector": p["sector"],
-            "description": p["description"],
+            "description": p["description"][:RANK_DESCRIPTION_CHARS],
             "tags": p.get("tags", []),
         })
 
     try:
-        async with httpx.AsyncClient(timeout=ANTHROPIC_TIMEOUT) as client:
-            response = await client.post(
-                ANTHROPIC_API_URL,
-                headers={
-                    "x-api-key": settings.anthropic_api_key,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": ANTHROPIC_MODEL,
-                    "max_tokens": 1000,
-                    "system": (
-                        "You are a project matching engine. Given a query and a list of projects, "
-                        "return a JSON array of project_ids sorted by relevance (most relevant first). "
-                        "Include a relevance_score (0.0 to 1.0) for each. "
-                        "Respond ONLY with a JSON array like: "
-                        '[{"project_id": "PRJ-001", "relevance_score": 0.95}]. '
-                        "No markdown backticks."
-                    ),
-                    "messages": [{
-                        "role": "user",
-                        "content": f"Query: {query}\n\nProjects:\n{json.dumps(summaries, indent=2)}",
-                    }],
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            rankings = json.loads(data["content"][0]["text"].strip())
+        client = get_http_client("anthropic", ANTHROPIC_TIMEOUT, http2=True)
+        response = await client.post(
+            ANTHROPIC_API_URL,
+            headers=ANTHROPIC_HEADERS,
+            timeout=ANTHROPIC_TIMEOUT,
+            content=orjson.dumps({
+                "model": ANTHROPIC_MODEL,
+                "max_tokens": min(len(projects) * RANK_TOKENS_PER_PROJECT, 400),
+                "tools": [RANK_TOOL],
+                "tool_choice": {"type": "tool", "name": "rank"},
+                "system": [
+                    {
+                        "type": "text",
+                        "text": RANKER_PROMPT,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+                "messages": [{
+                    "role": "user",
+                    # Compact JSON: indentation only adds billed prompt tokens
+                    "content": f"Query: {query}\n\nProjects:\n{orjson.dumps(summaries).decode()}",
+                }],
+            }),
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        rankings = next(
+            block["input"]["rankings"]
+            for block in data["content"]
+            if block["type"] == "tool_use"
+        )
 
-            # Map scores back to projects
-            score_map = {r["project_id"]: r["relevance_score"] for r in rankings}
-            for p in projects:
-                p["_relevance"] = score_map.get(p["project_id"], 0.0)
+        # Map scores back to projects
+        score_map = {r["project_id"]: r["relevance_score"] for r in rankings}
+        for p in projects:
+            p["_relevance"] = score_map.get(p["project_id"], 0.0)
 
-            return sorted(projects, key=lambda x: x.get("_relevance", 0), reverse=True)
+        return sorted(projects, key=lambda x: x.get("_relevance", 0), reverse=True)
 
     except Exception:
         # Fallback: return as-is if Claude ranking fails
         return projects
 
 
+def _format_search_results(
+    query: str,
+    top_results: list[dict],
+    response_format: ResponseFormat,
+) -> str:
+    """Render ranked projects as the search_past_projects response."""
+    if not top_results:
+        return format_json_response({
+            "message": "No matching projects found",
+            "query": query,
+            "suggestion": "Try broader search terms",
+        })
+
+    # Build response
+    summaries = []
+    for p in top_results:
+        summaries.append(ProjectSummary(
+            project_id=p["project_id"],
+            name=p["name"],
+            client=p["client"],
+            sector=p.get("sector", "N/A"),
+            description=p["description"],
+            tech_stack=p.get("tech_stack", []),
+            year=p.get("year", 0),
+            relevance_score=p.get("_relevance", p.get("_keyword_score", 0)),
+        ))
+
+    if response_format == ResponseFormat.JSON:
+        return _SEARCH_RESULTS_ADAPTER.dump_json(
+            {"query": query, "total_found": len(top_results), "projects": summaries},
+            indent=2,
+        ).decode()
+
+    # Markdown
+    parts = [
+        f"# 🔍 Projects matching: \"{query}\"\n\n",
+        f"Found **{len(summaries)}** relevant project(s):\n\n",
+    ]
+    for s in summaries:
+        score_pct = int(s.relevance_score * 100)
+        parts.append(
+            f"---\n### {s.name} ({s.project_id})\n"
+            f"**Client:** {s.client} | **Sector:** {s.sector} | **Year:** {s.year}\n"
+            f"**Relevance:** {score_pct}%\n\n"
+            f"{s.description}\n\n"
+            f"**Tech:** {', '.join(s.tech_stack)}\n\n"
+        )
+
+    parts.append("\n💡 Use `get_project_details` with a project ID for full information.")
+    return "".join(parts)
+
+
 # ── Tool: Search Past Projects ─────────────────────────────────────
 
 async def search_past_projects(
@@ -133,75 +361,55 @@ async def search_past_projects(
     semantic ranking of results.
     """
     try:
-        projects = _load_projects()
+        store = _load_store()
+        projects = store.projects
         if not projects:
             return format_json_response({
                 "error": "Knowledge base is empty",
                 "suggestion": "Add projects to agents/knowledge_base/data/projects.json",
             })
 
-        # Filter by sector if provided
-        if sector:
-            sector_lower = sector.lower()
-            projects = [
-                p for p in projects
-                if sector_lower in p.get("sector", "").lower()
-            ]
-
-        # Keyword pre-filter
-        query_terms = [t.strip() for t in query.lower().split() if len(t.strip()) > 2]
-        for p in projects:
-            p["_keyword_score"] = _keyword_score(p, query_terms)
-
-        # Keep projects with any keyword match, or all if none match
-        matched = [p for p in projects if p["_keyword_score"] > 0]
-        candidates = matched if matched else projects
-
-        # Rank with Claude for semantic relevance
-        ranked = await _rank_with_claude(query, candidates)
-        top_results = ranked[:max_results]
-
-        if not top_results:
-            return format_json_response({
-                "message": "No matching projects found",
-                "query": query,
-                "suggestion": "Try broader search terms",
-            })
-
-        # Build response
-        summaries = []
-        for p in top_results:
-            summaries.append(ProjectSummary(
-                project_id=p["project_id"],
-                name=p["name"],
-                client=p["client"],
-                sector=p.get("sector", "N/A"),
-                description=p["description"],
-                tech_stack=p.get("tech_stack", []),
-                year=p.get("year", 0),
-                relevance_score=p.get("_relevance", p.get("_keyword_score", 0)),
-            ))
-
-        if response_format == ResponseFormat.JSON:
-            return format_json_response({
-                "query": query,
-                "total_found": len(top_results),
-                "projects": [s.model_dump() for s in summaries],
-            })
-
-        # Markdown
-        md = f"# 🔍 Projects matching: \"{query}\"\n\n"
-        md += f"Found **{len(summaries)}** relevant project(s):\n\n"
-        for s in summaries:
-            score_pct = int(s.relevance_score * 100)
-            md += f"---\n### {s.name} ({s.project_id})\n"
-            md += f"**Client:** {s.client} | **Sector:** {s.sector} | **Year:** {s.year}\n"
-            md += f"**Relevance:** {score_pct}%\n\n"
-            md += f"{s.description}\n\n"
-            md += f"**Tech:** {', '.join(s.tech_stack)}\n\n"
-
-        md += "\n💡 Use `get_project_details` with a project ID for full information."
-        return md
+        # Keyword pre-filter: count matched terms per project via the inverted index
+        query_terms = _query_terms(query)
+        hits = _keyword_hits(store.token_index, query_terms)
+
+        sector_lower = sector.lower() if sector else None
+
+        def in_sector(p: dict) -> bool:
+            return sector_lower is None or sector_lower in p.get("sector", "").lower()
+
+        # Keep projects with any keyword match, or all if none match. Scores are
+        # written onto the projects, so work on copies of the cached dicts.
+        candidates = []
+        for i in sorted(hits):
+            if in_sector(projects[i]):
+                candidates.append({
+                    **projects[i],
+                    "_keyword_score": round(hits[i] / len(query_terms), 2),
+                })
+        if not candidates:
+            candidates = [{**p, "_keyword_score": 0.0} for p in projects if in_sector(p)]
+
+        # Only the strongest keyword matches are worth sending to Claude
+        if len(candidates) > MAX_RANK_CANDIDATES:
+            candidates.sort(key=lambda p: p["_keyword_score"], reverse=True)
+            candidates = candidates[:MAX_RANK_CANDIDATES]
+
+        # Skip Claude when one project clearly wins on keywords alone
+        by_score = sorted(candidates, key=lambda p: p["_keyword_score"], reverse=True)
+        top_score = by_score[0]["_keyword_score"] if by_score else 0.0
+        runner_up = by_score[1]["_keyword_score"] if len(by_score) > 1 else 0.0
+        if (
+            top_score > settings.semantic_ranking_threshold
+            and top_score - runner_up > DECISIVE_KEYWORD_MARGIN
+        ):
+            for p in by_score:
+                p["_relevance"] = p["_keyword_score"]
+            ranked = by_score
+        else:
+            # Rank with Claude for semantic relevance
+            ranked = await _rank_with_claude(query, candidates)
+        return _format_search_results(query, ranked[:max_results], response_format)
 
     except Exception as e:
         return handle_api_error(e)
@@ -209,50 +417,57 @@ async def search_past_projects(
 
 # ── Tool: Get Project Details ──────────────────────────────────────
 
+def _render_project_detail(detail: ProjectDetail, response_format: ResponseFormat) -> str:
+    """Format a project's full details as JSON or markdown."""
+    if response_format == ResponseFormat.JSON:
+        return format_json_response(detail.model_dump())
+
+    # Markdown
+    parts = [
+        f"# 📋 {detail.name}\n\n"
+        f"**ID:** {detail.project_id} | **Status:** {detail.status}\n"
+        f"**Client:** {detail.client} | **Sector:** {detail.sector} | **Year:** {detail.year}\n\n"
+        f"## Description\n{detail.description}\n\n"
+        "## Metrics\n"
+        f"- **Team Size:** {detail.team_size} people\n"
+        f"- **Duration:** {detail.duration_weeks} weeks\n"
+        f"- **Total Hours:** {detail.total_hours:,}h\n"
+        f"- **Budget:** €{detail.budget_eur:,}\n\n"
+        f"## Outcome\n{detail.outcome}\n\n"
+        "## Key Features\n"
+    ]
+    parts.extend(f"- {feat}\n" for feat in detail.key_features)
+    parts.append(f"\n## Tech Stack\n{', '.join(detail.tech_stack)}\n\n## Challenges\n")
+    parts.extend(f"- {ch}\n" for ch in detail.challenges)
+
+    return "".join(parts)
+
+
 async def get_project_details(
     project_id: str,
     response_format: ResponseFormat = ResponseFormat.MARKDOWN,
 ) -> str:
     """Get full details of a specific project by its ID."""
     try:
-        projects = _load_projects()
-        project = next(
-            (p for p in projects if p["project_id"].upper() == project_id.upper()),
-            None,
-        )
+        store = _load_store()
+        key = project_id.upper()
+        cached = store.rendered.get((key, response_format))
+        if cached is not None:
+            return cached
+
+        project = store.by_id.get(key)
 
         if not project:
-            available = [p["project_id"] for p in projects]
+            available = [p["project_id"] for p in store.projects]
             return format_json_response({
                 "error": f"Project '{project_id}' not found",
                 "available_ids": available,
             })
 
-        detail = ProjectDetail(**project)
-
-        if response_format == ResponseFormat.JSON:
-            return format_json_response(detail.model_dump())
-
-        # Markdown
-        md = f"# 📋 {detail.name}\n\n"
-        md += f"**ID:** {detail.project_id} | **Status:** {detail.status}\n"
-        md += f"**Client:** {detail.client} | **Sector:** {detail.sector} | **Year:** {detail.year}\n\n"
-        md += f"## Description\n{detail.description}\n\n"
-        md += f"## Metrics\n"
-        md += f"- **Team Size:** {detail.team_size} people\n"
-        md += f"- **Duration:** {detail.duration_weeks} weeks\n"
-        md += f"- **Total Hours:** {detail.total_hours:,}h\n"
-        md += f"- **Budget:** €{detail.budget_eur:,}\n\n"
-        md += f"## Outcome\n{detail.outcome}\n\n"
-        md += f"## Key Features\n"
-        for feat in detail.key_features:
-            md += f"- {feat}\n"
-        md += f"\n## Tech Stack\n{', '.join(detail.tech_stack)}\n\n"
-        md += f"## Challenges\n"
-        for ch in detail.challenges:
-            md += f"- {ch}\n"
-
-        return md
+        detail = store.details.get(key) or ProjectDetail(**project)
+        output = _render_project_detail(detail, response_format)
+        store.rendered[(key, response_format)] = output
+        return output
 
     except Exception as e:
         return handle_api_error(e)
@@ -267,20 +482,21 @@ async def search_tech_stack(
 ) -> str:
     """Find projects that use specific technologies."""
     try:
-        projects = _load_projects()
+        store = _load_store()
         search_techs = {t.lower() for t in technologies}
 
-        results = []
-        for p in projects:
-            project_techs = {t.lower() for t in p.get("tech_stack", [])}
-            matched_techs = search_techs & project_techs
-
-            if match_all and matched_techs == search_techs:
-                results.append((p, len(matched_techs)))
-            elif not match_all and matched_techs:
-                results.append((p, len(matched_techs)))
-
-        results.sort(key=lambda x: x[1], reverse=True)
+        # Walk only the projects that use a searched technology, not the whole store
+        postings = [store.tech_index.get(tech, set()) for tech in search_techs]
+        if match_all:
+            matched = set.intersection(*postings)
+            results = [(store.projects[i], len(search_techs)) for i in sorted(matched)]
+        else:
+            counts: dict[int, int] = {}
+            for ids in postings:
+                for i in ids:
+                    counts[i] = counts.get(i, 0) + 1
+            results = [(store.projects[i], count) for i, count in sorted(counts.items())]
+            results.sort(key=lambda x: x[1], reverse=True)
 
         if not results:
             return format_json_response({
@@ -305,13 +521,15 @@ async def search_tech_stack(
 
         # Markdown
         mode = "ALL of" if match_all else "any of"
-        md = f"# 🛠️ Projects using {mode}: {', '.join(technologies)}\n\n"
+        parts = [f"# 🛠️ Projects using {mode}: {', '.join(technologies)}\n\n"]
         for p, count in results:
-            md += f"### {p['name']} ({p['project_id']})\n"
-            md += f"**Matches:** {count}/{len(technologies)} technologies\n"
-            md += f"**Full Stack:** {', '.join(p['tech_stack'])}\n\n"
+            parts.append(
+                f"### {p['name']} ({p['project_id']})\n"
+                f"**Matches:** {count}/{len(technologies)} technologies\n"
+                f"**Full Stack:** {', '.join(p['tech_stack'])}\n\n"
+            )
 
-        return md
+        return "".join(parts)
 
     except Exception as e:
         return handle_api_error(e)
@@ -327,7 +545,8 @@ async def get_case_studies(
     """Find case studies relevant to a client's sector and project type.
 
     Returns completed projects with outcomes that can be used as
-    social proof in a proposal.
+    social proof in a proposal. Only projects in the client's sector are
+    ranked; a sector with no projects falls back to a free-text search.
     """
     try:
         query_parts = [client_sector]
@@ -335,12 +554,69 @@ async def get_case_studies(
             query_parts.append(project_type)
         query = " ".join(query_parts)
 
-        # Reuse search logic
-        return await search_past_projects(
-            query=query,
-            max_results=3,
-            response_format=response_format,
+        store = _load_store()
+        sector_lower = client_sector.lower()
+        in_sector = sorted(
+            i
+            for name, ids in store.sector_index.items()
+            if sector_lower in name
+            for i in ids
         )
+        if not in_sector:
+            # No project in this sector: fall back to a free-text search
+            return await search_past_projects(
+                query=query,
+                max_results=CASE_STUDY_COUNT,
+                response_format=response_format,
+            )
+
+        # Only the sector's projects are scored and ranked, ordered by how
+        # many project_type terms they mention
+        type_terms = _query_terms(project_type) if project_type else ()
+        hits = _keyword_hits(store.token_index, type_terms)
+        candidates = [
+            {**store.projects[i], "_keyword_score": round(hits.get(i, 0) / max(len(type_terms), 1), 2)}
+            for i in in_sector
+        ]
+        candidates.sort(key=lambda p: p["_keyword_score"], reverse=True)
+        ranked = await _rank_with_claude(query, candidates[:MAX_RANK_CANDIDATES])
+        return _format_search_results(query, ranked[:CASE_STUDY_COUNT], response_format)
+
+    except Exception as e:
+        return handle_api_error(e)
+
+
+# ── Tool: Get Case Studies (batch) ─────────────────────────────────
+
+async def get_case_studies_batch(
+    client_sectors: list[str],
+    project_type: str | None = None,
+    response_format: ResponseFormat = ResponseFormat.MARKDOWN,
+) -> str:
+    """Find case studies for several sectors at once.
+
+    Runs one `get_case_studies` search per sector concurrently, so their
+    Claude ranking calls overlap on the shared connection pool.
+    """
+    try:
+        sectors = list(dict.fromkeys(client_sectors))
+        results = await asyncio.gather(*(
+            get_case_studies(
+                client_sector=sector,
+                project_type=project_type,
+                response_format=response_format,
+            )
+            for sector in sectors
+        ))
+
+        if response_format == ResponseFormat.JSON:
+            return format_json_response({
+                "case_studies": {
+                    sector: orjson.loads(result) for sector, result in zip(sectors, results)
+                },
+            })
+
+        return "\n\n".join(results)
 
     except Exception as e:
-        return handle_api_error(e)
\ No newline at end of file
+        return handle_api_error(e)
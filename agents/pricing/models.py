@@ -28,6 +28,14 @@ class DiscountTier(str, Enum):
 
 # ── Tool Input Models ──────────────────────────────────────────────
 
+class RoleHours(BaseModel):
+    """One rate-card role and the hours it is needed for."""
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    role_id: str = Field(..., description="Rate card role ID, e.g. 'backend_dev'", min_length=1)
+    hours: int = Field(..., description="Hours before the complexity multiplier", ge=1)
+
+
 class EstimateProjectInput(BaseModel):
     """Input for generating a full project cost estimation."""
     model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
@@ -55,6 +63,38 @@ class EstimateProjectInput(BaseModel):
         default=ResponseFormat.MARKDOWN,
         description="Output format: 'markdown' or 'json'",
     )
+    roles_override: Optional[list[RoleHours]] = Field(
+        default=None,
+        description=(
+            "Known team to price instead of asking AI to estimate it, e.g. "
+            "[{'role_id': 'backend_dev', 'hours': 200}]. Complexity still applies."
+        ),
+        min_length=1,
+    )
+
+
+class EstimateProjectsBatchInput(BaseModel):
+    """Input for estimating several projects in one call."""
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    project_descriptions: list[str] = Field(
+        ...,
+        description="Descriptions of the projects to estimate, one per project",
+        min_length=1,
+        max_length=20,
+    )
+    complexity: Complexity = Field(
+        default=Complexity.MEDIUM,
+        description="Project complexity applied to every estimate: 'low', 'medium', 'high', 'very_high'",
+    )
+    discount_tier: DiscountTier = Field(
+        default=DiscountTier.STANDARD,
+        description="Discount tier: 'standard', 'long_term', 'strategic'",
+    )
+    response_format: ResponseFormat = Field(
+        default=ResponseFormat.MARKDOWN,
+        description="Output format: 'markdown' or 'json'",
+    )
 
 
 class EstimateFromRolesInput(BaseModel):
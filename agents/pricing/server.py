@@ -2,24 +2,22 @@
 
 Exposes tools for project cost estimation:
 - estimate_project: AI-powered full project estimation
+- estimate_projects_batch: Several estimates in one call
 - estimate_from_roles: Manual team composition pricing
 - get_rate_card: Current rates, multipliers, and discounts
 """
 
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
-
 from mcp.server.fastmcp import FastMCP
 
 from agents.pricing.models import (
     EstimateProjectInput,
+    EstimateProjectsBatchInput,
     EstimateFromRolesInput,
     GetRateCardInput,
 )
 from agents.pricing.tools import (
     estimate_project,
+    estimate_projects_batch,
     estimate_from_roles,
     get_rate_card,
 )
@@ -53,6 +51,7 @@ async def tool_estimate_project(params: EstimateProjectInput) -> str:
             - complexity (Complexity): 'low', 'medium', 'high', 'very_high'
             - discount_tier (DiscountTier): 'standard', 'long_term', 'strategic'
             - response_format (ResponseFormat): 'markdown' or 'json'
+            - roles_override (Optional[list[RoleHours]]): Known team; skips AI scope analysis
 
     Returns:
         str: Detailed cost estimation with team, phases, and totals
@@ -63,6 +62,40 @@ async def tool_estimate_project(params: EstimateProjectInput) -> str:
         complexity=params.complexity,
         discount_tier=params.discount_tier,
         response_format=params.response_format,
+        roles_override=params.roles_override,
+    )
+
+
+@mcp.tool(
+    name="estimate_projects_batch",
+    annotations={
+        "title": "Estimate Several Projects",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": False,
+    },
+)
+async def tool_estimate_projects_batch(params: EstimateProjectsBatchInput) -> str:
+    """Estimate several projects at once, e.g. alternative scopes for one client.
+
+    Each project's scope is analyzed in parallel and priced like estimate_project.
+
+    Args:
+        params (EstimateProjectsBatchInput): Contains:
+            - project_descriptions (list[str]): One description per project
+            - complexity (Complexity): 'low', 'medium', 'high', 'very_high'
+            - discount_tier (DiscountTier): 'standard', 'long_term', 'strategic'
+            - response_format (ResponseFormat): 'markdown' or 'json'
+
+    Returns:
+        str: One cost estimation per project, in input order
+    """
+    return await estimate_projects_batch(
+        project_descriptions=params.project_descriptions,
+        complexity=params.complexity,
+        discount_tier=params.discount_tier,
+        response_format=params.response_format,
     )
 
 
@@ -4,15 +4,26 @@ Uses a rate card + Claude analysis to estimate project costs
 based on scope, team composition, and complexity.
 """
 
-import json
+import asyncio
 import math
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import httpx
+import orjson
 
 from config.settings import settings
-from shared.utils import format_json_response, handle_api_error
+from shared import llm_cache
+from shared.utils import (
+    backoff_delay,
+    format_json_response,
+    get_http_client,
+    handle_api_error,
+    retry_delay,
+)
 from agents.pricing.models import (
     ResponseFormat,
     Complexity,
@@ -20,6 +31,7 @@ from agents.pricing.models import (
     RoleEstimate,
     PhaseEstimate,
     ProjectEstimate,
+    RoleHours,
 )
 
 # ── Constants ──────────────────────────────────────────────────────
@@ -30,21 +42,136 @@ RATE_CARD_FILE = DATA_DIR / "rate_card.json"
 ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
 ANTHROPIC_MODEL = "claude-haiku-4-5-20251001"
 ANTHROPIC_TIMEOUT = 60.0
+ESTIMATE_MAX_TOKENS = 800  # a full 9-role tool call with assumptions fits well inside this
+RETRY_BACKOFF_CAP = 30.0
+# Scope analyses for a multi-project estimate run in parallel, this many at a time
+SCOPE_ANALYSIS_CONCURRENCY = 4
+
+ANTHROPIC_HEADERS = {
+    "x-api-key": settings.anthropic_api_key,
+    "anthropic-version": "2023-06-01",
+    "content-type": "application/json",
+}
 
 HOURS_PER_WEEK_PER_PERSON = 40
 
 
+# ── System Prompts ─────────────────────────────────────────────────
+# Kept at module level so the text is byte-identical across calls, which
+# Anthropic prompt caching requires for a cache hit.
+
+ESTIMATOR_PROMPT = """You are an expert software project estimator.
+Analyze the project description and estimate the required team and hours,
+then report the estimate with the submit_estimate tool.
+
+Available role IDs: pm, tech_lead, backend_dev, frontend_dev, mobile_dev, ml_engineer, designer, qa, devops
+
+Be realistic. Not every project needs every role. A simple web app might need
+4-5 roles while a complex ML platform might need 7-8."""
+
+# Forcing this tool makes Claude reply with schema-shaped JSON instead of free text
+ESTIMATE_TOOL = {
+    "name": "submit_estimate",
+    "description": "Report the team, hours and duration estimated for the project.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "estimated_weeks": {"type": "integer", "minimum": 1},
+            "roles": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "role_id": {"type": "string"},
+                        "hours": {"type": "integer", "minimum": 1},
+                        "justification": {"type": "string", "description": "Brief reason"},
+                    },
+                    "required": ["role_id", "hours", "justification"],
+                },
+            },
+            "assumptions": {"type": "array", "items": {"type": "string"}},
+            "risks": {"type": "array", "items": {"type": "string"}, "description": "Cost risks to flag"},
+        },
+        "required": ["estimated_weeks", "roles", "assumptions", "risks"],
+    },
+}
+
+ESTIMATOR_SYSTEM = (
+    {
+        "type": "text",
+        "text": ESTIMATOR_PROMPT,
+        "cache_control": {"type": "ephemeral"},
+    },
+)
+
+# Generic medium estimate used when Claude analysis is unavailable. Read-only,
+# since the same object is returned for every failed analysis.
+FALLBACK_ANALYSIS: Mapping[str, Any] = MappingProxyType({
+    "estimated_weeks": 12,
+    "roles": tuple(MappingProxyType(role) for role in (
+        {"role_id": "pm", "hours": 60, "justification": "Project coordination"},
+        {"role_id": "tech_lead", "hours": 80, "justification": "Architecture"},
+        {"role_id": "backend_dev", "hours": 300, "justification": "Core development"},
+        {"role_id": "frontend_dev", "hours": 250, "justification": "UI implementation"},
+        {"role_id": "qa", "hours": 100, "justification": "Testing"},
+        {"role_id": "devops", "hours": 60, "justification": "Deployment"},
+    )),
+    "assumptions": ("Fallback estimate — Claude analysis unavailable",),
+    "risks": ("Estimate may not reflect actual project scope",),
+})
+
+
 # ── Data Layer ─────────────────────────────────────────────────────
 
+@dataclass(frozen=True)
+class _RateCardStore:
+    """Parsed rate_card.json plus a role lookup derived from it."""
+
+    mtime_ns: int
+    rate_card: dict[str, Any]
+    roles_by_id: dict[str, dict[str, Any]]
+    phases: tuple[tuple[str, str, int], ...]  # (display name, description, pct_of_total)
+
+
+# Rebuilt only when the file's mtime changes
+_store: _RateCardStore | None = None
+
+
+def _load_store() -> _RateCardStore:
+    """Load the rate card, reusing the last parse while the file is unchanged.
+
+    The store is shared between calls, so callers must not mutate it.
+    """
+    global _store
+    mtime = RATE_CARD_FILE.stat().st_mtime_ns
+    if _store is None or _store.mtime_ns != mtime:
+        rate_card = orjson.loads(RATE_CARD_FILE.read_bytes())
+        _store = _RateCardStore(
+            mtime_ns=mtime,
+            rate_card=rate_card,
+            roles_by_id={r["role_id"]: r for r in rate_card["roles"]},
+            phases=tuple(
+                (_display_name(key), info["description"], info["pct_of_total"])
+                for key, info in rate_card.get("phase_distribution", {}).items()
+            ),
+        )
+    return _store
+
+
+@lru_cache(maxsize=256)
+def _display_name(key: str) -> str:
+    """Human-readable label for a snake_case rate card key ('long_term' -> 'Long Term')."""
+    return key.replace("_", " ").title()
+
+
 def _load_rate_card() -> dict[str, Any]:
     """Load the rate card configuration."""
-    with open(RATE_CARD_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_store().rate_card
 
 
-def _get_role(rate_card: dict, role_id: str) -> dict | None:
+def _get_role(store: _RateCardStore, role_id: str) -> dict | None:
     """Find a role in the rate card by ID."""
-    return next((r for r in rate_card["roles"] if r["role_id"] == role_id), None)
+    return store.roles_by_id.get(role_id)
 
 
 def _get_discount(rate_card: dict, tier: DiscountTier) -> int:
@@ -54,67 +181,239 @@ def _get_discount(rate_card: dict, tier: DiscountTier) -> int:
 
 # ── Claude Analysis ────────────────────────────────────────────────
 
-async def _analyze_scope_with_claude(project_description: str) -> dict:
+def _scope_prompt(project_description: str) -> str:
+    """User message asking Claude to analyze one project scope."""
+    return f"Estimate this project:\n{project_description}"
+
+
+def _scope_request(project_description: str) -> dict[str, Any]:
+    """Messages API parameters for one scope analysis."""
+    return {
+        "model": ANTHROPIC_MODEL,
+        "max_tokens": ESTIMATE_MAX_TOKENS,
+        "tools": [ESTIMATE_TOOL],
+        "tool_choice": {"type": "tool", "name": ESTIMATE_TOOL["name"]},
+        "system": ESTIMATOR_SYSTEM,
+        "messages": [{"role": "user", "content": _scope_prompt(project_description)}],
+    }
+
+
+def _analysis_from_message(message: dict[str, Any]) -> dict[str, Any]:
+    """Extract the submit_estimate tool input from a Messages API response."""
+    return next(block["input"] for block in message["content"] if block["type"] == "tool_use")
+
+
+def _cached_analysis(cache_key: str) -> dict | None:
+    """Return a previously stored scope analysis, if any."""
+    cached = llm_cache.get(cache_key)
+    if cached is None:
+        return None
+    try:
+        return orjson.loads(cached)
+    except orjson.JSONDecodeError:
+        return None
+
+
+async def _analyze_scope_with_claude(project_description: str) -> Mapping[str, Any]:
     """Use Claude to analyze project scope and recommend team + hours."""
     try:
+        cache_key = llm_cache.make_key(
+            ANTHROPIC_MODEL, ESTIMATOR_PROMPT, _scope_prompt(project_description)
+        )
+        cached = _cached_analysis(cache_key)
+        if cached is not None:
+            return cached
+
+        client = get_http_client("anthropic", ANTHROPIC_TIMEOUT, http2=True)
+        # Serialized once so every retry resends the same bytes
+        body = orjson.dumps(_scope_request(project_description))
         max_retries = 5
         for attempt in range(max_retries):
-            async with httpx.AsyncClient(timeout=ANTHROPIC_TIMEOUT) as client:
+            last_attempt = attempt == max_retries - 1
+            try:
                 response = await client.post(
                     ANTHROPIC_API_URL,
-                    headers={
-                        "x-api-key": settings.anthropic_api_key,
-                        "anthropic-version": "2023-06-01",
-                        "content-type": "application/json",
-                    },
-                    json={
-                        "model": ANTHROPIC_MODEL,
-                        "max_tokens": 1500,
-                        "system": """You are an expert software project estimator.
-Analyze the project description and estimate the required team and hours.
-
-Available role IDs: pm, tech_lead, backend_dev, frontend_dev, mobile_dev, ml_engineer, designer, qa, devops
+                    headers=ANTHROPIC_HEADERS,
+                    content=body,
+                    timeout=ANTHROPIC_TIMEOUT,
+                )
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+                await asyncio.sleep(backoff_delay(attempt, cap=RETRY_BACKOFF_CAP))
+                continue
+
+            # 429 and 5xx are transient; any other error status fails fast
+            transient = response.status_code == 429 or response.status_code >= 500
+            if transient and not last_attempt:
+                await asyncio.sleep(retry_delay(response, attempt, cap=RETRY_BACKOFF_CAP))
+                continue
+
+            response.raise_for_status()
+            analysis = _analysis_from_message(orjson.loads(response.content))
+            await llm_cache.store(cache_key, orjson.dumps(analysis).decode())
+            return analysis
+    except Exception:
+        # Fallback: return a generic medium estimate
+        return FALLBACK_ANALYSIS
 
-Respond ONLY with a valid JSON object:
-{
-    "estimated_weeks": <number>,
-    "roles": [
-        {"role_id": "<role_id>", "hours": <number>, "justification": "brief reason"}
-    ],
-    "assumptions": ["list of key assumptions"],
-    "risks": ["cost risks to flag"]
-}
 
-Be realistic. Not every project needs every role. A simple web app might need
-4-5 roles while a complex ML platform might need 7-8.
-Do NOT include markdown backticks. Return ONLY the JSON.""",
-                        "messages": [{"role": "user", "content": f"Estimate this project:\n{project_description}"}],
-                    },
-                )
+async def _analyze_scopes(project_descriptions: list[str]) -> list[Mapping[str, Any]]:
+    """Analyze several scopes concurrently, in input order.
 
-                if response.status_code == 429:
-                    import asyncio
-                    await asyncio.sleep((attempt + 1) * 15)
-                    continue
+    Each one goes through `_analyze_scope_with_claude`, so cached scopes
+    cost nothing and a failed one gets the fallback analysis on its own.
+    """
+    semaphore = asyncio.Semaphore(SCOPE_ANALYSIS_CONCURRENCY)
+
+    async def analyze(description: str) -> Mapping[str, Any]:
+        async with semaphore:
+            return await _analyze_scope_with_claude(description)
+
+    return await asyncio.gather(*(analyze(description) for description in project_descriptions))
+
+
+# ── Estimate Building ──────────────────────────────────────────────
+
+def _build_role(store: _RateCardStore, role_entry: Mapping[str, Any], multiplier: float) -> RoleEstimate:
+    """Price one recommended role, scaling its hours by the complexity multiplier."""
+    role_id = role_entry["role_id"]
+    adjusted_hours = math.ceil(role_entry["hours"] * multiplier)
+
+    role_info = _get_role(store, role_id)
+    if role_info:
+        rate = role_info["hourly_rate"]
+        title = role_info["title"]
+    else:
+        rate = 80  # default
+        title = _display_name(role_id)
+
+    # Entries come from Claude's schema-checked tool call, a validated
+    # RoleHours override or the fallback, so validation is skipped
+    return RoleEstimate.model_construct(
+        role_id=role_id,
+        title=title,
+        hours=adjusted_hours,
+        hourly_rate=rate,
+        subtotal=float(adjusted_hours * rate),
+    )
+
+
+def _build_estimate(
+    store: _RateCardStore,
+    analysis: Mapping[str, Any],
+    duration_weeks: int | None,
+    complexity: Complexity,
+    discount_tier: DiscountTier,
+) -> ProjectEstimate:
+    """Price a scope analysis against the rate card.
+
+    1. Apply complexity multiplier
+    2. Calculate costs per role and phase
+    3. Apply discount if applicable
+    """
+    rate_card = store.rate_card
+    multiplier = rate_card["complexity_multipliers"].get(complexity.value, 1.0)
+    discount_pct = _get_discount(rate_card, discount_tier)
+    weeks = duration_weeks or analysis.get("estimated_weeks", 12)
+
+    # Step 1: Build role estimates with complexity multiplier
+    role_estimates = [
+        _build_role(store, role_entry, multiplier)
+        for role_entry in analysis.get("roles", [])
+    ]
+    total_hours = sum(r.hours for r in role_estimates)
+    total_cost = sum((r.subtotal for r in role_estimates), 0.0)
+
+    # Step 2: Phase breakdown
+    phase_estimates = []
+    for phase_name, description, pct in store.phases:
+        phase_hours = math.ceil(total_hours * pct / 100)
+        phase_cost = total_cost * pct / 100
+
+        phase_estimates.append(PhaseEstimate.model_construct(
+            phase=phase_name,
+            description=description,
+            pct_of_total=pct,
+            hours=phase_hours,
+            cost=round(phase_cost, 2),
+        ))
+
+    # Step 3: Apply discount
+    discount_amount = total_cost * discount_pct / 100
+    cost_after_discount = round(total_cost - discount_amount, 2)
+
+    return ProjectEstimate(
+        total_hours=total_hours,
+        total_cost=round(total_cost, 2),
+        cost_after_discount=cost_after_discount,
+        discount_pct=discount_pct,
+        complexity=complexity.value,
+        duration_weeks=weeks,
+        roles=role_estimates,
+        phases=phase_estimates,
+    )
+
+
+def _estimate_to_dict(estimate: ProjectEstimate, analysis: Mapping[str, Any]) -> dict[str, Any]:
+    """JSON payload for an estimate, including Claude's assumptions and risks."""
+    result = estimate.model_dump()
+    result["assumptions"] = analysis.get("assumptions", [])
+    result["risks"] = analysis.get("risks", [])
+    return result
+
+
+def _format_estimate_markdown(
+    store: _RateCardStore,
+    estimate: ProjectEstimate,
+    analysis: Mapping[str, Any],
+    discount_tier: DiscountTier,
+) -> str:
+    """Render an estimate as the estimate_project markdown report."""
+    multiplier = store.rate_card["complexity_multipliers"].get(estimate.complexity, 1.0)
+    parts = [
+        "# 💰 Project Cost Estimation\n\n",
+        f"**Complexity:** {_display_name(estimate.complexity)} (×{multiplier})\n",
+        f"**Duration:** {estimate.duration_weeks} weeks\n",
+        f"**Total Hours:** {estimate.total_hours:,}h\n\n",
+        # Role breakdown table
+        "## Team & Cost Breakdown\n\n",
+        "| Role | Hours | Rate/h | Subtotal |\n",
+        "|------|-------|--------|----------|\n",
+    ]
+    for r in estimate.roles:
+        parts.append(f"| {r.title} | {r.hours:,}h | €{r.hourly_rate} | €{r.subtotal:,.0f} |\n")
+    parts.append(f"| **TOTAL** | **{estimate.total_hours:,}h** | | **€{estimate.total_cost:,.0f}** |\n\n")
+
+    # Discount
+    if estimate.discount_pct > 0:
+        parts.append(
+            f"**Discount ({discount_tier.value}):** -{estimate.discount_pct}% "
+            f"→ **€{estimate.cost_after_discount:,.0f}**\n\n"
+        )
 
-                response.raise_for_status()
-                data = response.json()
-                return json.loads(data["content"][0]["text"].strip())
-    except Exception:
-        # Fallback: return a generic medium estimate
-        return {
-            "estimated_weeks": 12,
-            "roles": [
-                {"role_id": "pm", "hours": 60, "justification": "Project coordination"},
-                {"role_id": "tech_lead", "hours": 80, "justification": "Architecture"},
-                {"role_id": "backend_dev", "hours": 300, "justification": "Core development"},
-                {"role_id": "frontend_dev", "hours": 250, "justification": "UI implementation"},
-                {"role_id": "qa", "hours": 100, "justification": "Testing"},
-                {"role_id": "devops", "hours": 60, "justification": "Deployment"},
-            ],
-            "assumptions": ["Fallback estimate — Claude analysis unavailable"],
-            "risks": ["Estimate may not reflect actual project scope"],
-        }
+    # Phase breakdown
+    parts.append(
+        "## Phase Distribution\n\n"
+        "| Phase | % | Hours | Cost |\n"
+        "|-------|---|-------|------|\n"
+    )
+    for p in estimate.phases:
+        parts.append(f"| {p.phase} | {p.pct_of_total}% | {p.hours:,}h | €{p.cost:,.0f} |\n")
+
+    # Assumptions & risks
+    assumptions = analysis.get("assumptions", [])
+    risks = analysis.get("risks", [])
+    if assumptions:
+        parts.append("\n## 📌 Assumptions\n")
+        for a in assumptions:
+            parts.append(f"- {a}\n")
+    if risks:
+        parts.append("\n## ⚠️ Cost Risks\n")
+        for r in risks:
+            parts.append(f"- {r}\n")
+
+    return "".join(parts)
 
 
 # ── Tool: Estimate Full Project ────────────────────────────────────
@@ -125,127 +424,67 @@ async def estimate_project(
     complexity: Complexity = Complexity.MEDIUM,
     discount_tier: DiscountTier = DiscountTier.STANDARD,
     response_format: ResponseFormat = ResponseFormat.MARKDOWN,
+    roles_override: list[RoleHours] | None = None,
 ) -> str:
     """Generate a full project cost estimation.
 
     1. Claude analyzes scope → recommends team + hours
+       (skipped when the caller supplies `roles_override`)
     2. Apply complexity multiplier
     3. Calculate costs per role and phase
     4. Apply discount if applicable
     """
     try:
-        rate_card = _load_rate_card()
-        multiplier = rate_card["complexity_multipliers"].get(complexity.value, 1.0)
-        discount_pct = _get_discount(rate_card, discount_tier)
+        store = _load_store()
+
+        # Step 1: Claude analyzes scope, unless the team is already known
+        if roles_override:
+            analysis = {
+                "roles": [role.model_dump() for role in roles_override],
+                "assumptions": [],
+                "risks": [],
+            }
+        else:
+            analysis = await _analyze_scope_with_claude(project_description)
+        estimate = _build_estimate(store, analysis, duration_weeks, complexity, discount_tier)
 
-        # Step 1: Claude analyzes scope
-        analysis = await _analyze_scope_with_claude(project_description)
-        weeks = duration_weeks or analysis.get("estimated_weeks", 12)
-
-        # Step 2: Build role estimates with complexity multiplier
-        role_estimates = []
-        total_hours = 0
-        total_cost = 0.0
-
-        for role_entry in analysis.get("roles", []):
-            role_id = role_entry["role_id"]
-            base_hours = role_entry["hours"]
-            adjusted_hours = math.ceil(base_hours * multiplier)
-
-            role_info = _get_role(rate_card, role_id)
-            if role_info:
-                rate = role_info["hourly_rate"]
-                title = role_info["title"]
-            else:
-                rate = 80  # default
-                title = role_id.replace("_", " ").title()
-
-            subtotal = adjusted_hours * rate
-            total_hours += adjusted_hours
-            total_cost += subtotal
+        if response_format == ResponseFormat.JSON:
+            return format_json_response(_estimate_to_dict(estimate, analysis))
+        return _format_estimate_markdown(store, estimate, analysis, discount_tier)
 
-            role_estimates.append(RoleEstimate(
-                role_id=role_id,
-                title=title,
-                hours=adjusted_hours,
-                hourly_rate=rate,
-                subtotal=subtotal,
-            ))
+    except Exception as e:
+        return handle_api_error(e)
 
-        # Step 3: Phase breakdown
-        phase_estimates = []
-        for phase_key, phase_info in rate_card.get("phase_distribution", {}).items():
-            pct = phase_info["pct_of_total"]
-            phase_hours = math.ceil(total_hours * pct / 100)
-            phase_cost = total_cost * pct / 100
-
-            phase_estimates.append(PhaseEstimate(
-                phase=phase_key.replace("_", " ").title(),
-                description=phase_info["description"],
-                pct_of_total=pct,
-                hours=phase_hours,
-                cost=round(phase_cost, 2),
-            ))
 
-        # Step 4: Apply discount
-        discount_amount = total_cost * discount_pct / 100
-        cost_after_discount = round(total_cost - discount_amount, 2)
+# ── Tool: Estimate Several Projects ────────────────────────────────
 
-        estimate = ProjectEstimate(
-            total_hours=total_hours,
-            total_cost=round(total_cost, 2),
-            cost_after_discount=cost_after_discount,
-            discount_pct=discount_pct,
-            complexity=complexity.value,
-            duration_weeks=weeks,
-            roles=role_estimates,
-            phases=phase_estimates,
-        )
+async def estimate_projects_batch(
+    project_descriptions: list[str],
+    complexity: Complexity = Complexity.MEDIUM,
+    discount_tier: DiscountTier = DiscountTier.STANDARD,
+    response_format: ResponseFormat = ResponseFormat.MARKDOWN,
+) -> str:
+    """Estimate several projects, analyzing their scopes concurrently."""
+    try:
+        store = _load_store()
+        analyses = await _analyze_scopes(project_descriptions)
+        estimates = [
+            _build_estimate(store, analysis, None, complexity, discount_tier)
+            for analysis in analyses
+        ]
 
         if response_format == ResponseFormat.JSON:
-            result = estimate.model_dump()
-            result["assumptions"] = analysis.get("assumptions", [])
-            result["risks"] = analysis.get("risks", [])
-            return format_json_response(result)
-
-        # Markdown
-        md = "# 💰 Project Cost Estimation\n\n"
-        md += f"**Complexity:** {complexity.value.replace('_', ' ').title()} (×{multiplier})\n"
-        md += f"**Duration:** {weeks} weeks\n"
-        md += f"**Total Hours:** {total_hours:,}h\n\n"
-
-        # Role breakdown table
-        md += "## Team & Cost Breakdown\n\n"
-        md += "| Role | Hours | Rate/h | Subtotal |\n"
-        md += "|------|-------|--------|----------|\n"
-        for r in role_estimates:
-            md += f"| {r.title} | {r.hours:,}h | €{r.hourly_rate} | €{r.subtotal:,.0f} |\n"
-        md += f"| **TOTAL** | **{total_hours:,}h** | | **€{total_cost:,.0f}** |\n\n"
+            return format_json_response({
+                "estimates": [
+                    {"project_description": description, **_estimate_to_dict(estimate, analysis)}
+                    for description, estimate, analysis in zip(project_descriptions, estimates, analyses)
+                ],
+            })
 
-        # Discount
-        if discount_pct > 0:
-            md += f"**Discount ({discount_tier.value}):** -{discount_pct}% → **€{cost_after_discount:,.0f}**\n\n"
-
-        # Phase breakdown
-        md += "## Phase Distribution\n\n"
-        md += "| Phase | % | Hours | Cost |\n"
-        md += "|-------|---|-------|------|\n"
-        for p in phase_estimates:
-            md += f"| {p.phase} | {p.pct_of_total}% | {p.hours:,}h | €{p.cost:,.0f} |\n"
-
-        # Assumptions & risks
-        assumptions = analysis.get("assumptions", [])
-        risks = analysis.get("risks", [])
-        if assumptions:
-            md += "\n## 📌 Assumptions\n"
-            for a in assumptions:
-                md += f"- {a}\n"
-        if risks:
-            md += "\n## ⚠️ Cost Risks\n"
-            for r in risks:
-                md += f"- {r}\n"
-
-        return md
+        return "\n\n---\n\n".join(
+            _format_estimate_markdown(store, estimate, analysis, discount_tier)
+            for estimate, analysis in zip(estimates, analyses)
+        )
 
     except Exception as e:
         return handle_api_error(e)
@@ -260,13 +499,10 @@ async def estimate_from_roles(
 ) -> str:
     """Calculate cost from a manually defined team composition."""
     try:
-        rate_card = _load_rate_card()
-        discount_pct = _get_discount(rate_card, discount_tier)
+        store = _load_store()
+        discount_pct = _get_discount(store.rate_card, discount_tier)
 
         role_estimates = []
-        total_hours = 0
-        total_cost = 0.0
-
         for entry in roles:
             role_id = entry.get("role_id", "custom")
             hours = entry.get("hours", 0)
@@ -275,26 +511,25 @@ async def estimate_from_roles(
                 title = entry.get("title", "Custom Role")
                 rate = entry.get("hourly_rate", 80)
             else:
-                role_info = _get_role(rate_card, role_id)
+                role_info = _get_role(store, role_id)
                 if role_info:
                     title = role_info["title"]
                     rate = role_info["hourly_rate"]
                 else:
-                    title = role_id.replace("_", " ").title()
+                    title = _display_name(role_id)
                     rate = 80
 
-            subtotal = hours * rate
-            total_hours += hours
-            total_cost += subtotal
-
             role_estimates.append(RoleEstimate(
                 role_id=role_id,
                 title=title,
                 hours=hours,
                 hourly_rate=rate,
-                subtotal=subtotal,
+                subtotal=hours * rate,
             ))
 
+        total_hours = sum(r.hours for r in role_estimates)
+        total_cost = sum((r.subtotal for r in role_estimates), 0.0)
+
         discount_amount = total_cost * discount_pct / 100
         cost_after_discount = round(total_cost - discount_amount, 2)
 
@@ -309,17 +544,19 @@ async def estimate_from_roles(
             })
 
         # Markdown
-        md = "# 💰 Custom Team Estimation\n\n"
-        md += "| Role | Hours | Rate/h | Subtotal |\n"
-        md += "|------|-------|--------|----------|\n"
+        parts = [
+            "# 💰 Custom Team Estimation\n\n"
+            "| Role | Hours | Rate/h | Subtotal |\n"
+            "|------|-------|--------|----------|\n"
+        ]
         for r in role_estimates:
-            md += f"| {r.title} | {r.hours:,}h | €{r.hourly_rate} | €{r.subtotal:,.0f} |\n"
-        md += f"| **TOTAL** | **{total_hours:,}h** | | **€{total_cost:,.0f}** |\n\n"
+            parts.append(f"| {r.title} | {r.hours:,}h | €{r.hourly_rate} | €{r.subtotal:,.0f} |\n")
+        parts.append(f"| **TOTAL** | **{total_hours:,}h** | | **€{total_cost:,.0f}** |\n\n")
 
         if discount_pct > 0:
-            md += f"**Discount ({discount_tier.value}):** -{discount_pct}% → **€{cost_after_discount:,.0f}**\n"
+            parts.append(f"**Discount ({discount_tier.value}):** -{discount_pct}% → **€{cost_after_discount:,.0f}**\n")
 
-        return md
+        return "".join(parts)
 
     except Exception as e:
         return handle_api_error(e)
@@ -338,28 +575,33 @@ async def get_rate_card(
             return format_json_response(rate_card)
 
         # Markdown
-        md = "# 📊 Current Rate Card\n\n"
-        md += f"**Currency:** {rate_card['currency']}\n\n"
-
-        md += "## Roles & Rates\n\n"
-        md += "| Role | Rate/h | Typical Allocation | Description |\n"
-        md += "|------|--------|--------------------|-------------|\n"
+        parts = [
+            "# 📊 Current Rate Card\n\n",
+            f"**Currency:** {rate_card['currency']}\n\n",
+            "## Roles & Rates\n\n"
+            "| Role | Rate/h | Typical Allocation | Description |\n"
+            "|------|--------|--------------------|-------------|\n",
+        ]
         for r in rate_card["roles"]:
-            md += f"| {r['title']} | €{r['hourly_rate']} | {r['typical_allocation_pct']}% | {r['description']} |\n"
+            parts.append(f"| {r['title']} | €{r['hourly_rate']} | {r['typical_allocation_pct']}% | {r['description']} |\n")
 
-        md += "\n## Complexity Multipliers\n\n"
-        md += "| Level | Multiplier |\n"
-        md += "|-------|------------|\n"
+        parts.append(
+            "\n## Complexity Multipliers\n\n"
+            "| Level | Multiplier |\n"
+            "|-------|------------|\n"
+        )
         for level, mult in rate_card["complexity_multipliers"].items():
-            md += f"| {level.replace('_', ' ').title()} | ×{mult} |\n"
+            parts.append(f"| {_display_name(level)} | ×{mult} |\n")
 
-        md += "\n## Discount Tiers\n\n"
-        md += "| Tier | Discount |\n"
-        md += "|------|----------|\n"
+        parts.append(
+            "\n## Discount Tiers\n\n"
+            "| Tier | Discount |\n"
+            "|------|----------|\n"
+        )
         for tier, pct in rate_card["discount_tiers"].items():
-            md += f"| {tier.replace('_', ' ').title()} | {pct}% |\n"
+            parts.append(f"| {_display_name(tier)} | {pct}% |\n")
 
-        return md
+        return "".join(parts)
 
     except Exception as e:
         return handle_api_error(e)
\ No newline at end of file
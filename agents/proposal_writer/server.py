@@ -6,11 +6,6 @@ Exposes tools for generating professional proposals:
 - generate_executive_summary: Concise summary from a full proposal
 """
 
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
-
 from mcp.server.fastmcp import FastMCP
 
 from agents.proposal_writer.models import (
@@ -4,15 +4,25 @@ Uses Claude to generate professional proposals based on a structured
 template, client research, and internal project knowledge.
 """
 
-import json
+import asyncio
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 
 from config.settings import settings
-from shared.utils import format_json_response, handle_api_error
+from shared import llm_cache
+from shared.utils import (
+    TokenBucket,
+    backoff_delay,
+    format_json_response,
+    get_http_client,
+    handle_api_error,
+    retry_delay,
+)
 from agents.proposal_writer.models import (
     OutputFormat,
     ProposalLanguage,
@@ -29,16 +39,108 @@ PROPOSAL_TEMPLATE = TEMPLATES_DIR / "proposal_structure.json"
 
 ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
 ANTHROPIC_MODEL = "claude-sonnet-4-20250514"
-ANTHROPIC_TIMEOUT = 120.0
+ANTHROPIC_TIMEOUT = httpx.Timeout(
+    settings.anthropic_timeout, connect=settings.anthropic_connect_timeout
+)
+ANTHROPIC_HEADERS = {
+    "x-api-key": settings.anthropic_api_key,
+    "anthropic-version": "2023-06-01",
+    "content-type": "application/json",
+}
+
+# Proposal sections are generated in parallel, one Claude call each
+SECTION_CONCURRENCY = 4
+
+# Output budgets: a few paragraphs per section, a small JSON timeline, and
+# roughly 2.5 tokens per summary word (enough headroom for Spanish)
+SECTION_MAX_TOKENS = 1200
+TIMELINE_MAX_TOKENS = 1500
+SUMMARY_TOKENS_PER_WORD = 2.5
+
+MAX_RETRIES = 2
+RETRY_BACKOFF_CAP = 30
+
+# One quota shared by the proposal, timeline, and summary tools
+_RATE_LIMITER = TokenBucket(settings.anthropic_rpm, settings.anthropic_tpm)
+
+
+# ── System Prompts ─────────────────────────────────────────────────
+# Only the language is filled in, so each prompt has one byte-identical
+# variant per language for Anthropic prompt caching. Per-request values
+# (durations, word limits) go in the user message instead.
+
+PROPOSAL_PROMPT = """You are a professional proposal writer for a technology consultancy.
+Write one section of a compelling, detailed, and professional proposal in {lang_name}.
+
+IMPORTANT RULES:
+- Write in {lang_name} only
+- Be specific and detailed, avoid generic filler text
+- If client research is provided, reference specific facts about the client
+- If past projects are provided, use them as case studies with real data
+- If pricing info is provided, include it in the Investment section
+- If any info is missing, write reasonable placeholder content marked with [TO COMPLETE]
+- Use a professional but warm tone
+- The section should be substantial (at least 2-3 paragraphs)
+- Stay within the section you are asked for; the other sections are written separately
+
+Respond with the section body only. Do NOT include the section title or any separators."""
+
+TIMELINE_PROMPT = """You are a project planning expert. Generate a detailed project timeline
+in {lang_name}.
+
+Respond ONLY with a valid JSON object:
+{{
+    "total_weeks": <number>,
+    "phases": [
+        {{
+            "phase_number": 1,
+            "name": "Phase name",
+            "description": "What happens in this phase",
+            "duration_weeks": <number>,
+            "deliverables": ["deliverable 1", "deliverable 2"],
+            "dependencies": []
+        }}
+    ]
+}}
+
+Include typical phases: Discovery/Planning, Design, Development (split into sprints if >4 weeks),
+Testing/QA, Deployment, and Post-launch Support.
+Do NOT include markdown backticks. Return ONLY the JSON."""
+
+EXECUTIVE_SUMMARY_PROMPT = """You are an expert at writing executive summaries for technical proposals.
+Write in {lang_name}, within the word limit given in the request.
+
+The summary must:
+- Open with the client's core need
+- Highlight the proposed solution and its key differentiators
+- Mention relevant experience/track record
+- Include expected outcomes or ROI
+- End with a clear call to action
+
+Be compelling and concise. Every sentence must earn its place."""
+
+LANGUAGE_NAMES = {
+    ProposalLanguage.ENGLISH: "English",
+    ProposalLanguage.SPANISH: "Spanish",
+}
+
+
+def _render_prompts(template: str) -> dict[ProposalLanguage, str]:
+    """Fill in the language once per variant at import time."""
+    return {language: template.format(lang_name=name) for language, name in LANGUAGE_NAMES.items()}
+
+
+PROPOSAL_SYSTEM_PROMPTS = _render_prompts(PROPOSAL_PROMPT)
+TIMELINE_SYSTEM_PROMPTS = _render_prompts(TIMELINE_PROMPT)
+EXECUTIVE_SUMMARY_SYSTEM_PROMPTS = _render_prompts(EXECUTIVE_SUMMARY_PROMPT)
 
 
 # ── Helpers ────────────────────────────────────────────────────────
 
-def _load_template() -> list[dict[str, Any]]:
-    """Load the proposal structure template."""
-    with open(PROPOSAL_TEMPLATE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data["sections"]
+@lru_cache(maxsize=1)
+def _load_template() -> tuple[dict[str, Any], ...]:
+    """Load the proposal structure template (read once per process)."""
+    return tuple(orjson.loads(PROPOSAL_TEMPLATE.read_bytes())["sections"])
 
 
 def _get_title(section: dict, language: ProposalLanguage) -> str:
@@ -48,36 +150,59 @@ def _get_title(section: dict, language: ProposalLanguage) -> str:
 
 
 async def _generate_with_claude(system_prompt: str, user_content: str, max_tokens: int = 3000) -> str:
-    """Send content to Claude for generation with retry on rate limits."""
-    max_retries = 5
-    for attempt in range(max_retries):
-        async with httpx.AsyncClient(timeout=ANTHROPIC_TIMEOUT) as client:
+    """Send content to Claude, paced by the shared rate limiter.
+
+    Responses are cached on disk by prompt hash, so identical requests are
+    answered without another API round-trip.
+    """
+    cache_key = llm_cache.make_key(ANTHROPIC_MODEL, system_prompt, user_content, max_tokens)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    client = get_http_client("anthropic", ANTHROPIC_TIMEOUT, http2=True)
+    estimated_tokens = max_tokens + (len(system_prompt) + len(user_content)) // 4
+    # Serialized once so every retry resends the same bytes
+    body = orjson.dumps({
+        "model": ANTHROPIC_MODEL,
+        "max_tokens": max_tokens,
+        "system": [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+        "messages": [{"role": "user", "content": user_content}],
+    })
+    for attempt in range(MAX_RETRIES + 1):
+        last_attempt = attempt == MAX_RETRIES
+        await _RATE_LIMITER.acquire(estimated_tokens)
+        try:
             response = await client.post(
                 ANTHROPIC_API_URL,
-                headers={
-                    "x-api-key": settings.anthropic_api_key,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": ANTHROPIC_MODEL,
-                    "max_tokens": max_tokens,
-                    "system": system_prompt,
-                    "messages": [{"role": "user", "content": user_content}],
-                },
+                headers=ANTHROPIC_HEADERS,
+                # Per request, since the pooled client may belong to another agent
+                timeout=ANTHROPIC_TIMEOUT,
+                content=body,
             )
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+            await asyncio.sleep(backoff_delay(attempt, cap=RETRY_BACKOFF_CAP))
+            continue
 
-            if response.status_code == 429:
-                wait_time = (attempt + 1) * 15
-                import asyncio
-                await asyncio.sleep(wait_time)
-                continue
-
-            response.raise_for_status()
-            data = response.json()
-            return data["content"][0]["text"]
+        # The bucket keeps us under quota, so only retry real transient errors
+        transient = response.status_code == 429 or response.status_code >= 500
+        if transient and not last_attempt:
+            await asyncio.sleep(retry_delay(response, attempt, cap=RETRY_BACKOFF_CAP))
+            continue
 
-    raise RuntimeError("Claude API rate limit exceeded in proposal writer after all retries.")
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        text = data["content"][0]["text"]
+        await llm_cache.store(cache_key, text)
+        return text
 
 
 # ── Tool: Generate Full Proposal ───────────────────────────────────
@@ -98,7 +223,7 @@ async def generate_proposal(
     """
     try:
         template_sections = _load_template()
-        lang_name = "Spanish" if language == ProposalLanguage.SPANISH else "English"
+        lang_name = LANGUAGE_NAMES[language]
 
         # Build context block with all available info
         context_parts = [f"Client: {client_name}", f"Project: {project_description}"]
@@ -111,55 +236,35 @@ async def generate_proposal(
 
         full_context = "\n\n---\n\n".join(context_parts)
 
-        # Generate all sections in one Claude call for coherence
-        sections_instructions = ""
-        for i, section in enumerate(template_sections, 1):
-            title = _get_title(section, language)
-            sections_instructions += (
-                f"\n## Section {i}: {title}\n"
-                f"Instructions: {section['instruction']}\n"
+        # One Claude call per section, run concurrently; the outline keeps
+        # each section aware of what the others cover
+        titles = [_get_title(section, language) for section in template_sections]
+        outline = "\n".join(f"{i}. {title}" for i, title in enumerate(titles, 1))
+        system_prompt = PROPOSAL_SYSTEM_PROMPTS[language]
+        semaphore = asyncio.Semaphore(SECTION_CONCURRENCY)
+
+        async def generate_section(i: int, section: dict[str, Any]) -> str:
+            user_content = (
+                f"Proposal outline:\n{outline}\n\n"
+                f"Write section {i}: {titles[i - 1]}\n"
+                f"Instructions: {section['instruction']}\n\n"
+                f"Using this context:\n\n{full_context}"
             )
+            async with semaphore:
+                return await _generate_with_claude(
+                    system_prompt, user_content, max_tokens=SECTION_MAX_TOKENS
+                )
 
-        system_prompt = f"""You are a professional proposal writer for a technology consultancy.
-Write a compelling, detailed, and professional proposal in {lang_name}.
-
-IMPORTANT RULES:
-- Write in {lang_name} only
-- Be specific and detailed, avoid generic filler text
-- If client research is provided, reference specific facts about the client
-- If past projects are provided, use them as case studies with real data
-- If pricing info is provided, include it in the Investment section
-- If any info is missing, write reasonable placeholder content marked with [TO COMPLETE]
-- Use a professional but warm tone
-- Each section should be substantial (at least 2-3 paragraphs)
-
-Respond with the proposal sections separated by the exact marker: ---SECTION_BREAK---
-Each section should start with its title as a markdown heading (##).
-Do NOT include any other separators or markers."""
-
-        user_content = (
-            f"Generate a proposal with these sections:\n{sections_instructions}\n\n"
-            f"Using this context:\n\n{full_context}"
+        contents = await asyncio.gather(
+            *(generate_section(i, section) for i, section in enumerate(template_sections, 1))
         )
+        # Every field is built here, so skip pydantic validation
+        parsed_sections = [
+            ProposalSection.model_construct(title=title, content=f"## {title}\n\n{content.strip()}", order=i)
+            for i, (title, content) in enumerate(zip(titles, contents), 1)
+        ]
 
-        claude_response = await _generate_with_claude(system_prompt, user_content, max_tokens=6000)
-
-        # Parse sections from response
-        raw_sections = claude_response.split("---SECTION_BREAK---")
-        parsed_sections = []
-        for i, raw in enumerate(raw_sections):
-            content = raw.strip()
-            if not content:
-                continue
-
-            title = _get_title(template_sections[i], language) if i < len(template_sections) else f"Section {i+1}"
-            parsed_sections.append(ProposalSection(
-                title=title,
-                content=content,
-                order=i + 1,
-            ))
-
-        proposal = ProposalDocument(
+        proposal = ProposalDocument.model_construct(
             client_name=client_name,
             project_title=f"Technical Proposal — {client_name}",
             sections=parsed_sections,
@@ -171,13 +276,15 @@ Do NOT include any other separators or markers."""
             return format_json_response(proposal.model_dump())
 
         # Markdown
-        md = f"# 📄 {proposal.project_title}\n\n"
-        md += f"*Generated: {proposal.generated_at[:10]} | Language: {lang_name} | v{proposal.version}*\n\n"
-        md += "---\n\n"
+        parts = [
+            f"# 📄 {proposal.project_title}\n\n",
+            f"*Generated: {proposal.generated_at[:10]} | Language: {lang_name} | v{proposal.version}*\n\n",
+            "---\n\n",
+        ]
         for section in proposal.sections:
-            md += f"{section.content}\n\n---\n\n"
+            parts.append(f"{section.content}\n\n---\n\n")
 
-        return md
+        return "".join(parts)
 
     except Exception as e:
         return handle_api_error(e)
@@ -193,71 +300,54 @@ async def generate_timeline(
 ) -> str:
     """Generate a project timeline with phases, durations, and deliverables."""
     try:
-        lang_name = "Spanish" if language == ProposalLanguage.SPANISH else "English"
         weeks_instruction = (
             f"The total project duration should be approximately {total_weeks} weeks."
             if total_weeks
             else "Estimate a reasonable total duration based on project complexity."
         )
 
-        system_prompt = f"""You are a project planning expert. Generate a detailed project timeline
-in {lang_name}. {weeks_instruction}
-
-Respond ONLY with a valid JSON object:
-{{
-    "total_weeks": <number>,
-    "phases": [
-        {{
-            "phase_number": 1,
-            "name": "Phase name",
-            "description": "What happens in this phase",
-            "duration_weeks": <number>,
-            "deliverables": ["deliverable 1", "deliverable 2"],
-            "dependencies": []
-        }}
-    ]
-}}
-
-Include typical phases: Discovery/Planning, Design, Development (split into sprints if >4 weeks),
-Testing/QA, Deployment, and Post-launch Support.
-Do NOT include markdown backticks. Return ONLY the JSON."""
+        system_prompt = TIMELINE_SYSTEM_PROMPTS[language]
 
         claude_response = await _generate_with_claude(
             system_prompt,
-            f"Generate a timeline for:\n{project_description}",
+            f"{weeks_instruction}\n\nGenerate a timeline for:\n{project_description}",
+            max_tokens=TIMELINE_MAX_TOKENS,
         )
 
-        data = json.loads(claude_response.strip())
-        timeline = ProjectTimeline(**data)
+        data = orjson.loads(claude_response.strip())
+        # Claude's JSON is untrusted, so this one stays validated
+        timeline = ProjectTimeline.model_validate(data)
 
         if output_format == OutputFormat.JSON:
             return format_json_response(timeline.model_dump())
 
         # Markdown Gantt-style
-        md = "# 📅 Project Timeline\n\n"
-        md += f"**Total Duration:** {timeline.total_weeks} weeks\n\n"
-        md += "| Phase | Name | Duration | Deliverables |\n"
-        md += "|-------|------|----------|-------------|\n"
-
+        parts = [
+            "# 📅 Project Timeline\n\n",
+            f"**Total Duration:** {timeline.total_weeks} weeks\n\n",
+            "| Phase | Name | Duration | Deliverables |\n",
+            "|-------|------|----------|-------------|\n",
+        ]
+        details = ["\n"]
+
+        # One pass fills both the Gantt table and the per-phase details
         week_counter = 0
         for phase in timeline.phases:
             week_start = week_counter + 1
             week_end = week_counter + phase.duration_weeks
             week_counter = week_end
             deliverables = ", ".join(phase.deliverables[:3])
-            md += f"| {phase.phase_number} | **{phase.name}** | W{week_start}-W{week_end} ({phase.duration_weeks}w) | {deliverables} |\n"
+            parts.append(f"| {phase.phase_number} | **{phase.name}** | W{week_start}-W{week_end} ({phase.duration_weeks}w) | {deliverables} |\n")
 
-        md += "\n"
-        for phase in timeline.phases:
-            md += f"\n### Phase {phase.phase_number}: {phase.name}\n"
-            md += f"{phase.description}\n\n"
-            md += "**Deliverables:**\n"
-            for d in phase.deliverables:
-                md += f"- {d}\n"
+            details.append(f"\n### Phase {phase.phase_number}: {phase.name}\n")
+            details.append(f"{phase.description}\n\n")
+            details.append("**Deliverables:**\n")
+            details.extend(f"- {d}\n" for d in phase.deliverables)
 
-        return md
+        parts.extend(details)
+        return "".join(parts)
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return format_json_response({
             "error": "Failed to parse timeline",
             "raw_response": claude_response[:500],
@@ -276,24 +366,12 @@ async def generate_executive_summary(
 ) -> str:
     """Generate a concise executive summary from a full proposal."""
     try:
-        lang_name = "Spanish" if language == ProposalLanguage.SPANISH else "English"
-
-        system_prompt = f"""You are an expert at writing executive summaries for technical proposals.
-Write in {lang_name}. Maximum {max_words} words.
-
-The summary must:
-- Open with the client's core need
-- Highlight the proposed solution and its key differentiators
-- Mention relevant experience/track record
-- Include expected outcomes or ROI
-- End with a clear call to action
-
-Be compelling and concise. Every sentence must earn its place."""
+        system_prompt = EXECUTIVE_SUMMARY_SYSTEM_PROMPTS[language]
 
         claude_response = await _generate_with_claude(
             system_prompt,
-            f"Write an executive summary for this proposal:\n\n{full_proposal}",
-            max_tokens=1000,
+            f"Maximum {max_words} words.\n\nWrite an executive summary for this proposal:\n\n{full_proposal}",
+            max_tokens=int(max_words * SUMMARY_TOKENS_PER_WORD),
         )
 
         if output_format == OutputFormat.JSON:
@@ -303,9 +381,7 @@ Be compelling and concise. Every sentence must earn its place."""
                 "word_count": len(claude_response.split()),
             })
 
-        md = "# 📋 Executive Summary\n\n"
-        md += claude_response.strip()
-        return md
+        return f"# 📋 Executive Summary\n\n{claude_response.strip()}"
 
     except Exception as e:
         return handle_api_error(e)
@@ -327,7 +403,9 @@ async def export_proposal_docx(
     try:
         from shared.docx_exporter import export_proposal_to_docx
 
-        output_path = export_proposal_to_docx(
+        # Building and saving the document is blocking work; keep it off the loop
+        output_path = await asyncio.to_thread(
+            export_proposal_to_docx,
             markdown_content=proposal_markdown,
             client_name=client_name,
             project_title=project_title,
@@ -7,15 +7,18 @@ import os
 import re
 import sys
 import logging
-import atexit
+from collections import deque
 
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
 # Ensure project root is on path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from streamlit_helpers.async_bridge import OrchestratorBridge
+from streamlit_helpers.async_bridge import OrchestratorBridge, get_bridge
 from streamlit_helpers.components import render_sidebar, render_chat_history, t
+from config.settings import settings
 from shared.docx_exporter import export_proposal_to_docx
 
 # ── Logging ─────────────────────────────────────────────────────────
@@ -41,7 +44,8 @@ DEFAULTS = {
     "bridge": None,
     "initialized": False,
     "init_error": None,
-    "messages": [],
+    # Bounded, so a long-lived tab's session state stops growing
+    "messages": deque(maxlen=settings.chat_history_max),
     "connected_agents": [],
     "language": "EN",
     "last_docx_path": None,
@@ -53,21 +57,34 @@ for key, val in DEFAULTS.items():
         st.session_state[key] = val
 
 
+# ── Helpers ─────────────────────────────────────────────────────────
+
+DOCX_PATH_RE = re.compile(r"(exports[/\\][^\s\"']+\.docx)")
+
+
+def extract_docx_path(response: str) -> str | None:
+    """Return the exported DOCX path mentioned in a response, if any."""
+    if ".docx" not in response:
+        return None
+    match = DOCX_PATH_RE.search(response)
+    return match.group(1) if match else None
+
+
 # ── Orchestrator Bootstrap ──────────────────────────────────────────
 
 def ensure_orchestrator() -> bool:
-    """Initialize the orchestrator bridge once per session."""
+    """Attach this session to the shared orchestrator bridge."""
     if st.session_state["initialized"]:
         return True
 
     if st.session_state["bridge"] is None:
         try:
-            bridge = OrchestratorBridge()
-            connected = bridge.start()
+            bridge = get_bridge()
             st.session_state["bridge"] = bridge
-            st.session_state["connected_agents"] = connected
+            # Dropped with this session's state, which frees its conversation
+            st.session_state["session_handle"] = bridge.open_session(get_script_run_ctx().session_id)
+            st.session_state["connected_agents"] = bridge.connected_agents
             st.session_state["initialized"] = True
-            atexit.register(bridge.stop)
             return True
         except Exception as e:
             st.session_state["init_error"] = str(e)
@@ -83,6 +100,8 @@ if not st.session_state["initialized"]:
             st.stop()
 
 bridge: OrchestratorBridge = st.session_state["bridge"]
+# Keys this session's conversation on the shared orchestrator
+session_id = get_script_run_ctx().session_id
 
 
 # ── Sidebar ─────────────────────────────────────────────────────────
@@ -90,17 +109,18 @@ bridge: OrchestratorBridge = st.session_state["bridge"]
 sidebar_action = render_sidebar(st.session_state["connected_agents"])
 
 if sidebar_action == "reset":
-    bridge.reset_conversation()
-    st.session_state["messages"] = []
+    bridge.reset_conversation(session_id)
+    st.session_state["messages"] = deque(maxlen=settings.chat_history_max)
     st.session_state["last_docx_path"] = None
     st.session_state["pending_export"] = False
     st.rerun()
 
 if sidebar_action == "export":
-    if bridge.pending_proposal_md:
+    proposal_md, proposal_client = bridge.pending_proposal(session_id)
+    if proposal_md:
         path = export_proposal_to_docx(
-            markdown_content=bridge.pending_proposal_md,
-            client_name=bridge.pending_proposal_client or "Client",
+            markdown_content=proposal_md,
+            client_name=proposal_client or "Client",
         )
         st.session_state["last_docx_path"] = path
         st.session_state["pending_export"] = False
@@ -116,14 +136,18 @@ if not st.session_state["messages"]:
     })
 
 
-# ── Chat History ────────────────────────────────────────────────────
-
-render_chat_history(st.session_state["messages"])
+# ── Chat ────────────────────────────────────────────────────────────
+# A fragment, so a chat turn reruns only the conversation and not the
+# sidebar or bootstrap; the whole app reruns only when export state changes.
 
+@st.fragment
+def chat_fragment() -> None:
+    render_chat_history(st.session_state["messages"])
 
-# ── Chat Input ──────────────────────────────────────────────────────
+    prompt = st.chat_input(t("placeholder"))
+    if not prompt:
+        return
 
-if prompt := st.chat_input(t("placeholder")):
     # Show user message
     st.session_state["messages"].append({"role": "user", "content": prompt})
     with st.chat_message("user", avatar="🧑"):
@@ -132,25 +156,42 @@ if prompt := st.chat_input(t("placeholder")):
     # Get orchestrator response
     with st.chat_message("assistant", avatar="🤖"):
         with st.spinner(t("processing")):
+            # Names the agent tool currently running under the spinner
+            progress = st.empty()
             try:
-                response = bridge.chat(prompt)
+                response = bridge.chat(
+                    prompt,
+                    session_id,
+                    on_progress=lambda tool: progress.caption(f"🔧 `{tool.replace('__', ' › ')}`"),
+                )
             except Exception as e:
                 response = f"**Error:** {e}"
+            progress.empty()
 
         st.markdown(response)
 
     st.session_state["messages"].append({"role": "assistant", "content": response})
 
+    export_state = (st.session_state["last_docx_path"], st.session_state["pending_export"])
+
     # Detect DOCX file path in response
-    docx_match = re.search(r"(exports[/\\][^\s\"']+\.docx)", response)
-    if docx_match:
-        docx_path = docx_match.group(1)
-        if os.path.exists(docx_path):
-            st.session_state["last_docx_path"] = docx_path
-            st.session_state["pending_export"] = False
+    docx_path = extract_docx_path(response)
+    if docx_path and os.path.exists(docx_path):
+        st.session_state["last_docx_path"] = docx_path
+        st.session_state["pending_export"] = False
 
     # If a proposal was generated, enable the export button
-    if bridge.pending_proposal_md and not st.session_state.get("last_docx_path"):
+    if bridge.pending_proposal(session_id)[0] and not st.session_state.get("last_docx_path"):
         st.session_state["pending_export"] = True
 
-    st.rerun()
+    # The sidebar's export buttons only change on a full rerun
+    if export_state != (st.session_state["last_docx_path"], st.session_state["pending_export"]):
+        st.rerun()
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        # Not a fragment rerun (e.g. the script test harness); rerun the app
+        st.rerun()
+
+
+chat_fragment()
@@ -1,22 +1,42 @@
 """Application settings loaded from environment variables or Streamlit secrets."""
 
 import os
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+@lru_cache(maxsize=1)
+def _streamlit_secrets_possible() -> bool:
+    """Whether Streamlit secrets could exist, so agent processes skip importing it."""
+    if "streamlit" in sys.modules:
+        return True
+    candidates = (Path.cwd() / ".streamlit", Path.home() / ".streamlit")
+    return any((folder / "secrets.toml").exists() for folder in candidates)
+
+
+@lru_cache(maxsize=1)
+def _streamlit_secrets() -> dict:
+    """Load Streamlit secrets once; empty when Streamlit or its secrets are unavailable."""
+    if not _streamlit_secrets_possible():
+        return {}
+    try:
+        import streamlit as st
+        return st.secrets.to_dict()
+    except Exception:
+        return {}
+
+
 def _get_secret(key: str, default: str = "") -> str:
     """Read from env vars first, then fall back to Streamlit secrets."""
     value = os.getenv(key, "")
     if value:
         return value
-    try:
-        import streamlit as st
-        return st.secrets.get(key, default)
-    except Exception:
-        return default
+    return str(_streamlit_secrets().get(key, default))
 
 
 @dataclass(frozen=True)
@@ -25,6 +45,10 @@ class Settings:
 
     # Claude API
     anthropic_api_key: str = ""
+    anthropic_rpm: int = 50
+    anthropic_tpm: int = 40000
+    anthropic_timeout: float = 300.0
+    anthropic_connect_timeout: float = 10.0
 
     # Tavily Web Search
     tavily_api_key: str = ""
@@ -37,6 +61,22 @@ class Settings:
     mcp_transport: str = "stdio"
     mcp_port: int = 8000
 
+    # Worker threads for the Streamlit bridge's event loop
+    thread_pool_size: int = 64
+
+    # Chat messages each Streamlit session keeps (and re-renders) per rerun
+    chat_history_max: int = 200
+
+    # LLM response cache
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_days: int = 7
+    llm_cache_mode: str = "enabled"
+    semantic_cache_enabled: bool = False
+    semantic_cache_threshold: float = 0.92
+
+    # Knowledge base: keyword score above which Claude ranking may be skipped
+    semantic_ranking_threshold: float = 0.8
+
     def validate(self) -> list[str]:
         """Return list of missing required keys."""
         missing = []
@@ -49,9 +89,21 @@ class Settings:
 
 settings = Settings(
     anthropic_api_key=_get_secret("ANTHROPIC_API_KEY"),
+    anthropic_rpm=int(_get_secret("ANTHROPIC_RPM", "50")),
+    anthropic_tpm=int(_get_secret("ANTHROPIC_TPM", "40000")),
+    anthropic_timeout=float(_get_secret("ANTHROPIC_TIMEOUT", "300")),
+    anthropic_connect_timeout=float(_get_secret("ANTHROPIC_CONNECT_TIMEOUT", "10")),
     tavily_api_key=_get_secret("TAVILY_API_KEY"),
     linkedin_client_id=_get_secret("LINKEDIN_CLIENT_ID"),
     linkedin_client_secret=_get_secret("LINKEDIN_CLIENT_SECRET"),
     mcp_transport=_get_secret("MCP_TRANSPORT", "stdio"),
     mcp_port=int(_get_secret("MCP_PORT", "8000")),
+    thread_pool_size=int(_get_secret("THREAD_POOL_SIZE", "64")),
+    chat_history_max=int(_get_secret("CHAT_HISTORY_MAX", "200")),
+    llm_cache_enabled=_get_secret("LLM_CACHE_ENABLED", "true").lower() == "true",
+    llm_cache_ttl_days=int(_get_secret("LLM_CACHE_TTL_DAYS", "7")),
+    llm_cache_mode=_get_secret("LLM_CACHE_MODE", "enabled").lower(),
+    semantic_cache_enabled=_get_secret("SEMANTIC_CACHE_ENABLED", "false").lower() == "true",
+    semantic_cache_threshold=float(_get_secret("SEMANTIC_CACHE_THRESHOLD", "0.92")),
+    semantic_ranking_threshold=float(_get_secret("SEMANTIC_RANKING_THRESHOLD", "0.8")),
 )
@@ -4,13 +4,17 @@ Each agent publishes an Agent Card following the A2A protocol pattern,
 declaring what it can do so the orchestrator can discover and route tasks.
 """
 
-from pydantic import BaseModel, Field
+from functools import cached_property
+
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from enum import Enum
 
 
 class AgentSkill(BaseModel):
     """A specific capability of an agent."""
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Skill identifier")
     description: str = Field(..., description="What this skill does")
     mcp_tool_name: str = Field(..., description="Corresponding MCP tool name")
@@ -32,7 +36,10 @@ class AgentCard(BaseModel):
 
     This follows the A2A protocol pattern where each agent publishes
     a card so other agents (or an orchestrator) can discover it.
+    Cards are declared once below and shared, so they are frozen.
     """
+    model_config = ConfigDict(frozen=True)
+
     agent_id: str = Field(..., description="Unique agent identifier")
     name: str = Field(..., description="Human-readable agent name")
     description: str = Field(..., description="What this agent does")
@@ -41,20 +48,21 @@ class AgentCard(BaseModel):
     skills: list[AgentSkill] = Field(default_factory=list)
     mcp_server_command: list[str] = Field(
         ...,
-        description="Command to start the MCP server (e.g., ['python', 'agents/client_research/server.py'])",
+        description="Command to start the MCP server (e.g., ['python', '-m', 'agents.client_research.server'])",
     )
     dependencies: list[str] = Field(
         default_factory=list,
         description="Other agent IDs this agent depends on",
     )
 
-    @property
-    def skill_names(self) -> list[str]:
-        return [s.name for s in self.skills]
+    # Cards are declared once at import, so these are computed on first use
+    @cached_property
+    def skill_names(self) -> tuple[str, ...]:
+        return tuple(s.name for s in self.skills)
 
-    @property
-    def tool_names(self) -> list[str]:
-        return [s.mcp_tool_name for s in self.skills]
+    @cached_property
+    def tool_names(self) -> tuple[str, ...]:
+        return tuple(s.mcp_tool_name for s in self.skills)
 
 
 # ── Agent Registry ─────────────────────────────────────────────────
@@ -100,7 +108,7 @@ CLIENT_RESEARCH_CARD = AgentCard(
             ],
         ),
     ],
-    mcp_server_command=["python", "agents/client_research/server.py"],
+    mcp_server_command=["python", "-m", "agents.client_research.server"],
 )
 
 # Placeholder cards for future agents
@@ -149,8 +157,16 @@ KNOWLEDGE_BASE_CARD = AgentCard(
                 "Show success stories in delivery apps",
             ],
         ),
+        AgentSkill(
+            name="case_studies_batch",
+            description="Retrieve case studies for several sectors at once",
+            mcp_tool_name="get_case_studies_batch",
+            example_queries=[
+                "Case studies in fintech and healthcare",
+            ],
+        ),
     ],
-    mcp_server_command=["python", "agents/knowledge_base/server.py"],
+    mcp_server_command=["python", "-m", "agents.knowledge_base.server"],
 )
 
 PROPOSAL_WRITER_CARD = AgentCard(
@@ -203,7 +219,7 @@ PROPOSAL_WRITER_CARD = AgentCard(
             ],
         ),
     ],
-    mcp_server_command=["python", "agents/proposal_writer/server.py"],
+    mcp_server_command=["python", "-m", "agents.proposal_writer.server"],
     dependencies=["client_research", "knowledge_base"],
 )
 
@@ -226,6 +242,15 @@ PRICING_CARD = AgentCard(
                 "What's the pricing for this scope?",
             ],
         ),
+        AgentSkill(
+            name="batch_estimation",
+            description="Estimate several projects at once",
+            mcp_tool_name="estimate_projects_batch",
+            example_queries=[
+                "Estimate these three project options",
+                "Price each of these scopes",
+            ],
+        ),
         AgentSkill(
             name="custom_estimation",
             description="Calculate cost from a manually defined team and hours",
@@ -246,7 +271,7 @@ PRICING_CARD = AgentCard(
             ],
         ),
     ],
-    mcp_server_command=["python", "agents/pricing/server.py"],
+    mcp_server_command=["python", "-m", "agents.pricing.server"],
 )
 
 
@@ -256,4 +281,16 @@ AGENT_REGISTRY: dict[str, AgentCard] = {
     "knowledge_base": KNOWLEDGE_BASE_CARD,
     "proposal_writer": PROPOSAL_WRITER_CARD,
     "pricing": PRICING_CARD,
-}
\ No newline at end of file
+}
+
+# Reverse indexes: which agent owns a given MCP tool or skill
+TOOL_TO_AGENT: dict[str, str] = {
+    skill.mcp_tool_name: agent_id
+    for agent_id, card in AGENT_REGISTRY.items()
+    for skill in card.skills
+}
+SKILL_TO_AGENT: dict[str, str] = {
+    skill.name: agent_id
+    for agent_id, card in AGENT_REGISTRY.items()
+    for skill in card.skills
+}
@@ -5,249 +5,284 @@ functions in-process. This avoids spawning 4 Python subprocesses, which
 is critical for memory-constrained environments like Streamlit Cloud.
 """
 
-import json
 import logging
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+import orjson
+from pydantic import BaseModel
 
 from orchestrator.agent_cards import AGENT_REGISTRY, AgentStatus
 
 logger = logging.getLogger(__name__)
 
-# ── Tool function imports ────────────────────────────────────────────
-
-from agents.client_research.tools import (
-    search_company_info,
-    analyze_rfp_document,
-    search_linkedin_company,
-)
-from agents.client_research.models import (
-    SearchCompanyInput,
-    AnalyzeRFPInput,
-    SearchLinkedInInput,
-)
-
-from agents.knowledge_base.tools import (
-    search_past_projects,
-    get_project_details,
-    search_tech_stack,
-    get_case_studies,
-)
-from agents.knowledge_base.models import (
-    SearchProjectsInput,
-    GetProjectDetailsInput,
-    SearchTechStackInput,
-    GetCaseStudiesInput,
-)
-
-from agents.proposal_writer.tools import (
-    generate_proposal,
-    generate_timeline,
-    generate_executive_summary,
-    export_proposal_docx,
-)
-from agents.proposal_writer.models import (
-    GenerateProposalInput,
-    GenerateTimelineInput,
-    GenerateExecutiveSummaryInput,
-    ExportProposalDocxInput,
-)
-
-from agents.pricing.tools import (
-    estimate_project,
-    estimate_from_roles,
-    get_rate_card,
-)
-from agents.pricing.models import (
-    EstimateProjectInput,
-    EstimateFromRolesInput,
-    GetRateCardInput,
-)
-
 
 # ── Tool Registry ────────────────────────────────────────────────────
-# Maps (agent_id, tool_name) -> (async_function, PydanticInputModel, description)
+
+def _strip_titles(schema: dict) -> dict:
+    """Drop Pydantic's generated `title` keywords, which Claude doesn't use.
+
+    Only string titles are removed, so a property that happens to be named
+    "title" (whose value is a schema dict) is kept.
+    """
+    stack: list[Any] = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if isinstance(node.get("title"), str):
+                del node["title"]
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return schema
+
+
+def _build_tool_schema(model_class) -> dict:
+    """Generate a JSON Schema from a Pydantic model for Claude's tool API."""
+    # $defs are kept so the orchestrator can inline the enums they describe
+    return _strip_titles(model_class.model_json_schema())
+
+
+@dataclass(frozen=True, slots=True)
+class ToolEntry:
+    """An in-process tool: its function, input model, and Claude-facing definition."""
+    fn: Callable[..., Awaitable[str]]
+    model_class: type[BaseModel]
+    description: str
+    schema: dict[str, Any] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "schema", _build_tool_schema(self.model_class))
+
+
+# Maps agent_id -> loader returning tool_name -> ToolEntry. Each agent's
+# modules are imported (and its schemas built) only when it first connects
+# or is called, so agents that never come online cost nothing.
+# Each input model's fields match its tool function's keyword arguments one to one.
 # Descriptions must match the MCP server docstrings so Claude gets identical context.
 
-_TOOL_REGISTRY: dict[tuple[str, str], tuple[Any, Any, str]] = {
-    # Client Research
-    ("client_research", "search_company_info"): (
-        lambda p: search_company_info(
-            company_name=p.company_name,
-            additional_context=p.additional_context,
-            response_format=p.response_format,
-        ),
+def _client_research_tools() -> dict[str, ToolEntry]:
+    """Client Research agent tools."""
+    from agents.client_research.tools import (
+        search_company_info,
+        analyze_rfp_document,
+        search_linkedin_company,
+    )
+    from agents.client_research.models import (
         SearchCompanyInput,
-        "Research a company by searching the web and analyzing results with AI. "
-        "Searches for company details including sector, size, funding, technologies, "
-        "key people, and recent news. Returns a structured company profile.",
-    ),
-    ("client_research", "analyze_rfp_document"): (
-        lambda p: analyze_rfp_document(
-            rfp_text=p.rfp_text,
-            response_format=p.response_format,
-        ),
         AnalyzeRFPInput,
-        "Analyze an RFP document to extract key requirements and information. "
-        "Uses AI to parse and structure the RFP content, identifying business "
-        "requirements, technical specs, budget indicators, timeline, evaluation "
-        "criteria, and potential risks.",
-    ),
-    ("client_research", "search_linkedin_company"): (
-        lambda p: search_linkedin_company(
-            company_name=p.company_name,
-            find_decision_makers=p.find_decision_makers,
-            response_format=p.response_format,
-        ),
         SearchLinkedInInput,
-        "Search for a company's LinkedIn presence and key decision makers. "
-        "Uses web search to find LinkedIn company pages and profiles of "
-        "executives (CTO, CEO, VP Engineering, Directors).",
-    ),
-    # Knowledge Base
-    ("knowledge_base", "search_past_projects"): (
-        lambda p: search_past_projects(
-            query=p.query,
-            sector=p.sector,
-            max_results=p.max_results,
-            response_format=p.response_format,
+    )
+
+    return {
+        "search_company_info": ToolEntry(
+            search_company_info,
+            SearchCompanyInput,
+            "Research a company by searching the web and analyzing results with AI. "
+            "Searches for company details including sector, size, funding, technologies, "
+            "key people, and recent news. Returns a structured company profile.",
         ),
-        SearchProjectsInput,
-        "Search internal project history by keywords, sector, or requirements. "
-        "Uses keyword matching plus AI-powered semantic ranking to find the "
-        "most relevant past projects. Useful for finding similar work to "
-        "reference in proposals.",
-    ),
-    ("knowledge_base", "get_project_details"): (
-        lambda p: get_project_details(
-            project_id=p.project_id,
-            response_format=p.response_format,
+        "analyze_rfp_document": ToolEntry(
+            analyze_rfp_document,
+            AnalyzeRFPInput,
+            "Analyze an RFP document to extract key requirements and information. "
+            "Uses AI to parse and structure the RFP content, identifying business "
+            "requirements, technical specs, budget indicators, timeline, evaluation "
+            "criteria, and potential risks.",
         ),
-        GetProjectDetailsInput,
-        "Get full details of a specific project by its ID. "
-        "Returns complete information including team size, duration, budget, "
-        "tech stack, features, outcomes, and challenges.",
-    ),
-    ("knowledge_base", "search_tech_stack"): (
-        lambda p: search_tech_stack(
-            technologies=p.technologies,
-            match_all=p.match_all,
-            response_format=p.response_format,
+        "search_linkedin_company": ToolEntry(
+            search_linkedin_company,
+            SearchLinkedInInput,
+            "Search for a company's LinkedIn presence and key decision makers. "
+            "Uses web search to find LinkedIn company pages and profiles of "
+            "executives (CTO, CEO, VP Engineering, Directors).",
         ),
+    }
+
+
+def _knowledge_base_tools() -> dict[str, ToolEntry]:
+    """Knowledge Base agent tools."""
+    from agents.knowledge_base.tools import (
+        search_past_projects,
+        get_project_details,
+        search_tech_stack,
+        get_case_studies,
+        get_case_studies_batch,
+    )
+    from agents.knowledge_base.models import (
+        SearchProjectsInput,
+        GetProjectDetailsInput,
         SearchTechStackInput,
-        "Find projects that use specific technologies. "
-        "Search by one or more technologies to find relevant experience. "
-        "Can match projects using ANY or ALL of the specified technologies.",
-    ),
-    ("knowledge_base", "get_case_studies"): (
-        lambda p: get_case_studies(
-            client_sector=p.client_sector,
-            project_type=p.project_type,
-            response_format=p.response_format,
-        ),
         GetCaseStudiesInput,
-        "Retrieve case studies relevant to a target client's sector and project type. "
-        "Finds completed projects with successful outcomes that serve as "
-        "social proof in proposals.",
-    ),
-    # Proposal Writer
-    ("proposal_writer", "generate_proposal"): (
-        lambda p: generate_proposal(
-            client_name=p.client_name,
-            project_description=p.project_description,
-            client_research=p.client_research,
-            relevant_projects=p.relevant_projects,
-            pricing_info=p.pricing_info,
-            language=p.language,
-            output_format=p.output_format,
+        GetCaseStudiesBatchInput,
+    )
+
+    return {
+        "search_past_projects": ToolEntry(
+            search_past_projects,
+            SearchProjectsInput,
+            "Search internal project history by keywords, sector, or requirements. "
+            "Uses keyword matching plus AI-powered semantic ranking to find the "
+            "most relevant past projects. Useful for finding similar work to "
+            "reference in proposals.",
         ),
-        GenerateProposalInput,
-        "Generate a complete technical/commercial proposal document. "
-        "Combines client research, internal knowledge base, and pricing data "
-        "into a structured, professional proposal with all standard sections: "
-        "Executive Summary, Project Understanding, Solution, Methodology, "
-        "Team, Case Studies, Investment, and Next Steps.",
-    ),
-    ("proposal_writer", "generate_timeline"): (
-        lambda p: generate_timeline(
-            project_description=p.project_description,
-            total_weeks=p.total_weeks,
-            language=p.language,
-            output_format=p.output_format,
+        "get_project_details": ToolEntry(
+            get_project_details,
+            GetProjectDetailsInput,
+            "Get full details of a specific project by its ID. "
+            "Returns complete information including team size, duration, budget, "
+            "tech stack, features, outcomes, and challenges.",
         ),
-        GenerateTimelineInput,
-        "Generate a detailed project timeline with phases and milestones. "
-        "Creates a phase-by-phase breakdown including Discovery, Design, "
-        "Development, Testing, Deployment, and Post-launch support.",
-    ),
-    ("proposal_writer", "generate_executive_summary"): (
-        lambda p: generate_executive_summary(
-            full_proposal=p.full_proposal,
-            max_words=p.max_words,
-            language=p.language,
-            output_format=p.output_format,
+        "search_tech_stack": ToolEntry(
+            search_tech_stack,
+            SearchTechStackInput,
+            "Find projects that use specific technologies. "
+            "Search by one or more technologies to find relevant experience. "
+            "Can match projects using ANY or ALL of the specified technologies.",
         ),
-        GenerateExecutiveSummaryInput,
-        "Generate a concise executive summary from a full proposal. "
-        "Distills the proposal into a compelling summary highlighting "
-        "the client's need, proposed solution, experience, and ROI.",
-    ),
-    ("proposal_writer", "export_proposal_docx"): (
-        lambda p: export_proposal_docx(
-            proposal_markdown=p.proposal_markdown,
-            client_name=p.client_name,
-            project_title=p.project_title,
-            company_name=p.company_name,
+        "get_case_studies": ToolEntry(
+            get_case_studies,
+            GetCaseStudiesInput,
+            "Retrieve case studies relevant to a target client's sector and project type. "
+            "Finds completed projects with successful outcomes that serve as "
+            "social proof in proposals.",
+        ),
+        "get_case_studies_batch": ToolEntry(
+            get_case_studies_batch,
+            GetCaseStudiesBatchInput,
+            "Retrieve case studies for several client sectors in one call. "
+            "Searches all sectors concurrently, which is faster than calling "
+            "get_case_studies once per sector.",
         ),
+    }
+
+
+def _proposal_writer_tools() -> dict[str, ToolEntry]:
+    """Proposal Writer agent tools."""
+    from agents.proposal_writer.tools import (
+        generate_proposal,
+        generate_timeline,
+        generate_executive_summary,
+        export_proposal_docx,
+    )
+    from agents.proposal_writer.models import (
+        GenerateProposalInput,
+        GenerateTimelineInput,
+        GenerateExecutiveSummaryInput,
         ExportProposalDocxInput,
-        "Export a markdown proposal to a professional Word document (.docx). "
-        "Creates a formatted DOCX file with cover page, styled sections, "
-        "tables, headers/footers with page numbers, and company branding. "
-        "The proposal must be in markdown format (output from generate_proposal).",
-    ),
-    # Pricing
-    ("pricing", "estimate_project"): (
-        lambda p: estimate_project(
-            project_description=p.project_description,
-            duration_weeks=p.duration_weeks,
-            complexity=p.complexity,
-            discount_tier=p.discount_tier,
-            response_format=p.response_format,
+    )
+
+    return {
+        "generate_proposal": ToolEntry(
+            generate_proposal,
+            GenerateProposalInput,
+            "Generate a complete technical/commercial proposal document. "
+            "Combines client research, internal knowledge base, and pricing data "
+            "into a structured, professional proposal with all standard sections: "
+            "Executive Summary, Project Understanding, Solution, Methodology, "
+            "Team, Case Studies, Investment, and Next Steps.",
         ),
-        EstimateProjectInput,
-        "Generate a full project cost estimation based on scope analysis. "
-        "Uses AI to analyze the project description, determine the required "
-        "team composition, estimate hours per role, apply complexity multipliers, "
-        "and calculate total cost with phase breakdown.",
-    ),
-    ("pricing", "estimate_from_roles"): (
-        lambda p: estimate_from_roles(
-            roles=p.roles,
-            discount_tier=p.discount_tier,
-            response_format=p.response_format,
+        "generate_timeline": ToolEntry(
+            generate_timeline,
+            GenerateTimelineInput,
+            "Generate a detailed project timeline with phases and milestones. "
+            "Creates a phase-by-phase breakdown including Discovery, Design, "
+            "Development, Testing, Deployment, and Post-launch support.",
         ),
-        EstimateFromRolesInput,
-        "Calculate project cost from a manually defined team composition. "
-        "Useful when you already know the team and hours needed. "
-        "Supports both predefined roles (from rate card) and custom roles.",
-    ),
-    ("pricing", "get_rate_card"): (
-        lambda p: get_rate_card(
-            response_format=p.response_format,
+        "generate_executive_summary": ToolEntry(
+            generate_executive_summary,
+            GenerateExecutiveSummaryInput,
+            "Generate a concise executive summary from a full proposal. "
+            "Distills the proposal into a compelling summary highlighting "
+            "the client's need, proposed solution, experience, and ROI.",
+        ),
+        "export_proposal_docx": ToolEntry(
+            export_proposal_docx,
+            ExportProposalDocxInput,
+            "Export a markdown proposal to a professional Word document (.docx). "
+            "Creates a formatted DOCX file with cover page, styled sections, "
+            "tables, headers/footers with page numbers, and company branding. "
+            "The proposal must be in markdown format (output from generate_proposal).",
         ),
+    }
+
+
+def _pricing_tools() -> dict[str, ToolEntry]:
+    """Pricing agent tools."""
+    from agents.pricing.tools import (
+        estimate_project,
+        estimate_projects_batch,
+        estimate_from_roles,
+        get_rate_card,
+    )
+    from agents.pricing.models import (
+        EstimateProjectInput,
+        EstimateProjectsBatchInput,
+        EstimateFromRolesInput,
         GetRateCardInput,
-        "Retrieve the current rate card with all roles, rates, and pricing rules. "
-        "Returns hourly rates per role, complexity multipliers, discount tiers, "
-        "and phase distribution percentages.",
-    ),
+    )
+
+    return {
+        "estimate_project": ToolEntry(
+            estimate_project,
+            EstimateProjectInput,
+            "Generate a full project cost estimation based on scope analysis. "
+            "Uses AI to analyze the project description, determine the required "
+            "team composition, estimate hours per role, apply complexity multipliers, "
+            "and calculate total cost with phase breakdown.",
+        ),
+        "estimate_projects_batch": ToolEntry(
+            estimate_projects_batch,
+            EstimateProjectsBatchInput,
+            "Estimate several projects at once, e.g. alternative scopes for one client. "
+            "Each project's scope is analyzed in parallel and priced like estimate_project.",
+        ),
+        "estimate_from_roles": ToolEntry(
+            estimate_from_roles,
+            EstimateFromRolesInput,
+            "Calculate project cost from a manually defined team composition. "
+            "Useful when you already know the team and hours needed. "
+            "Supports both predefined roles (from rate card) and custom roles.",
+        ),
+        "get_rate_card": ToolEntry(
+            get_rate_card,
+            GetRateCardInput,
+            "Retrieve the current rate card with all roles, rates, and pricing rules. "
+            "Returns hourly rates per role, complexity multipliers, discount tiers, "
+            "and phase distribution percentages.",
+        ),
+    }
+
+
+_TOOL_LOADERS: dict[str, Callable[[], dict[str, ToolEntry]]] = {
+    "client_research": _client_research_tools,
+    "knowledge_base": _knowledge_base_tools,
+    "proposal_writer": _proposal_writer_tools,
+    "pricing": _pricing_tools,
 }
 
+# Loaded agents: agent_id -> tool_name -> ToolEntry
+_TOOL_REGISTRY: dict[str, dict[str, ToolEntry]] = {}
 
-def _build_tool_schema(model_class) -> dict:
-    """Generate a JSON Schema from a Pydantic model for Claude's tool API."""
-    schema = model_class.model_json_schema()
-    # Remove $defs — Claude doesn't support them
-    schema.pop("$defs", None)
-    return schema
+# Claude-facing tool definitions per loaded agent. Shared by every pool and
+# call, so callers must never modify them (the orchestrator builds new
+# schema dicts when cleaning them up).
+_TOOLS_BY_AGENT: dict[str, tuple[dict[str, Any], ...]] = {}
+
+
+def _agent_tools(agent_id: str) -> dict[str, ToolEntry]:
+    """Return an agent's tool entries, importing its modules on first use."""
+    tools = _TOOL_REGISTRY.get(agent_id)
+    if tools is None:
+        loader = _TOOL_LOADERS.get(agent_id)
+        if loader is None:
+            return {}
+        tools = _TOOL_REGISTRY[agent_id] = loader()
+        _TOOLS_BY_AGENT[agent_id] = tuple(
+            {"name": tool_name, "description": entry.description, "input_schema": entry.schema}
+            for tool_name, entry in tools.items()
+        )
+    return tools
 
 
 # ── InProcessAgentPool ───────────────────────────────────────────────
@@ -255,58 +290,68 @@ def _build_tool_schema(model_class) -> dict:
 class InProcessAgentPool:
     """Drop-in replacement for MCPAgentPool that calls tools directly.
 
-    Same public interface: connect_agent, disconnect_all, get_available_agents,
-    get_all_tools, call_agent_tool.
+    Same public interface: connect_agent, disconnect_all, version,
+    get_available_agents, get_all_tools, call_agent_tool.
     """
 
     def __init__(self):
-        self._connected: list[str] = []
+        # Insertion-ordered set: O(1) membership, no duplicates, and a stable
+        # agent order so Claude's tool list stays byte-identical across turns
+        self._connected: dict[str, None] = {}
+        # get_all_tools result, dropped whenever the connected set changes
+        self._tools_cache: dict[str, tuple[dict[str, Any], ...]] | None = None
+        self._version = 0
 
     async def connect_agent(self, card) -> None:
         """Mark an agent as connected (no subprocess needed)."""
         if card.status == AgentStatus.AVAILABLE:
-            self._connected.append(card.agent_id)
+            _agent_tools(card.agent_id)
+            self._connected[card.agent_id] = None
+            self._tools_cache = None
+            self._version += 1
             logger.info(f"✅ Agent registered (in-process): {card.name}")
 
     async def disconnect_all(self) -> None:
         """Nothing to disconnect in-process."""
         self._connected.clear()
+        self._tools_cache = None
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Bumped whenever the connected agents change, so tool lists can be reused."""
+        return self._version
 
     def get_available_agents(self) -> list[str]:
         return list(self._connected)
 
-    async def get_all_tools(self) -> dict[str, list[dict[str, Any]]]:
+    async def get_all_tools(self) -> dict[str, tuple[dict[str, Any], ...]]:
         """Return tool definitions grouped by agent, with JSON schemas."""
-        all_tools: dict[str, list[dict]] = {}
-        for (agent_id, tool_name), (_, model_class, description) in _TOOL_REGISTRY.items():
-            if agent_id not in self._connected:
-                continue
-            if agent_id not in all_tools:
-                all_tools[agent_id] = []
-
-            all_tools[agent_id].append({
-                "name": tool_name,
-                "description": description,
-                "input_schema": _build_tool_schema(model_class),
-            })
-        return all_tools
+        if self._tools_cache is None:
+            self._tools_cache = {
+                agent_id: _TOOLS_BY_AGENT[agent_id]
+                for agent_id in self._connected
+                if agent_id in _TOOLS_BY_AGENT
+            }
+        return self._tools_cache
 
     async def call_agent_tool(
         self, agent_id: str, tool_name: str, arguments: dict[str, Any]
     ) -> str:
         """Call a tool function directly in-process."""
-        key = (agent_id, tool_name)
-        if key not in _TOOL_REGISTRY:
-            return json.dumps({"error": f"Tool '{tool_name}' not found on agent '{agent_id}'"})
+        entry = _agent_tools(agent_id).get(tool_name)
+        if entry is None:
+            return orjson.dumps({"error": f"Tool '{tool_name}' not found on agent '{agent_id}'"}).decode()
 
-        fn, model_class, _ = _TOOL_REGISTRY[key]
         try:
             # Unwrap "params" wrapper if present — MCP servers expect this
             # format but Pydantic models take flat arguments.
-            args = arguments.get("params", arguments) if "params" in arguments else arguments
-            params = model_class(**args)
-            result = await fn(params)
+            args = arguments.get("params", arguments)
+            # Claude's tool input is not schema-checked, and enums, defaults
+            # and whitespace stripping come from validation, so keep it
+            params = entry.model_class.model_validate(args)
+            result = await entry.fn(**dict(params))
             return result
         except Exception as e:
             logger.error(f"Error calling {agent_id}/{tool_name}: {e}")
-            return json.dumps({"error": f"Tool call failed: {str(e)}"})
\ No newline at end of file
+            return orjson.dumps({"error": f"Tool call failed: {str(e)}"}).decode()
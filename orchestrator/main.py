@@ -12,12 +12,18 @@ import sys
 import os
 import asyncio
 import logging
+import threading
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from orchestrator.orchestrator import Orchestrator
 
+try:
+    import uvloop
+except ImportError:  # optional; not available on Windows
+    uvloop = None
+
 # ── Logging Setup ──────────────────────────────────────────────────
 
 logging.basicConfig(
@@ -45,6 +51,38 @@ WELCOME_BANNER = """
 """
 
 
+async def read_line(prompt: str) -> str:
+    """`input()` without blocking the event loop.
+
+    The read runs in a daemon thread rather than the default executor: the
+    executor is joined when `asyncio.run` exits, so a thread still waiting
+    on stdin (e.g. after Ctrl+C) would keep the process from exiting.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _resolve(line: str | None, error: BaseException | None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line)
+
+    def _read() -> None:
+        try:
+            line, error = input(prompt), None
+        except BaseException as e:
+            line, error = None, e
+        try:
+            loop.call_soon_threadsafe(_resolve, line, error)
+        except RuntimeError:
+            pass  # the loop already closed
+
+    threading.Thread(target=_read, daemon=True, name="cli-input").start()
+    return await future
+
+
 async def main():
     orchestrator = Orchestrator()
 
@@ -69,7 +107,8 @@ async def main():
     try:
         while True:
             try:
-                user_input = input("\n🧑 You: ").strip()
+                # Read in a thread so the event loop keeps running while the user types
+                user_input = (await read_line("\n🧑 You: ")).strip()
             except EOFError:
                 break
 
@@ -106,4 +145,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
@@ -4,11 +4,13 @@ Manages the lifecycle of MCP server connections and provides
 a clean interface for calling tools on remote agents.
 """
 
-import json
+import asyncio
 import logging
 import sys
+from pathlib import Path
 from typing import Any
 
+import orjson
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
@@ -16,6 +18,32 @@ from orchestrator.agent_cards import AgentCard, AgentStatus
 
 logger = logging.getLogger(__name__)
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Launch parameters per agent_id, built on first connect and reused on reconnect
+_SERVER_PARAMS: dict[str, StdioServerParameters] = {}
+
+
+def _server_params(card: AgentCard) -> StdioServerParameters:
+    """Return the stdio launch parameters for an agent's MCP server."""
+    params = _SERVER_PARAMS.get(card.agent_id)
+    if params is None:
+        # Use sys.executable to ensure subprocesses run with the same
+        # Python interpreter (and installed packages) as the main process.
+        # This is critical on Streamlit Cloud where "python" may not
+        # point to the venv with dependencies installed.
+        command, *args = card.mcp_server_command
+        if command == "python":
+            command = sys.executable
+        params = _SERVER_PARAMS[card.agent_id] = StdioServerParameters(
+            command=command,
+            args=args,
+            # Servers start as `python -m agents.<name>.server`, which resolves
+            # from the working directory, so pin it to the project root.
+            cwd=PROJECT_ROOT,
+        )
+    return params
+
 
 class MCPAgentConnection:
     """Manages a connection to a single agent's MCP server."""
@@ -23,8 +51,13 @@ class MCPAgentConnection:
     def __init__(self, card: AgentCard):
         self.card = card
         self._session: ClientSession | None = None
-        self._client_ctx = None
-        self._session_ctx = None
+        # The stdio/session context managers are anyio task groups, which must
+        # be exited by the task that entered them, so one runner task owns them
+        # for the connection's whole life.
+        self._runner: asyncio.Task | None = None
+        self._stop: asyncio.Event | None = None
+        # A server's tools are fixed for the life of its process
+        self._tools_cache: list[dict[str, Any]] | None = None
 
     @property
     def is_connected(self) -> bool:
@@ -36,69 +69,83 @@ class MCPAgentConnection:
             logger.warning(f"Agent '{self.card.agent_id}' is offline, skipping connection.")
             return
 
-        # Use sys.executable to ensure subprocesses run with the same
-        # Python interpreter (and installed packages) as the main process.
-        # This is critical on Streamlit Cloud where "python" may not
-        # point to the venv with dependencies installed.
-        command = self.card.mcp_server_command[0]
-        if command == "python":
-            command = sys.executable
+        server_params = _server_params(self.card)
 
-        server_params = StdioServerParameters(
-            command=command,
-            args=self.card.mcp_server_command[1:],
+        self._tools_cache = None
+        ready = asyncio.get_running_loop().create_future()
+        self._stop = asyncio.Event()
+        self._runner = asyncio.create_task(
+            self._run(server_params, ready), name=f"mcp-{self.card.agent_id}"
         )
-
-        self._client_ctx = stdio_client(server_params)
-        read_stream, write_stream = await self._client_ctx.__aenter__()
-
-        self._session_ctx = ClientSession(read_stream, write_stream)
-        self._session = await self._session_ctx.__aenter__()
-
-        await self._session.initialize()
+        await ready
         logger.info(f"✅ Connected to agent '{self.card.name}'")
 
+    async def _run(self, server_params: StdioServerParameters, ready: asyncio.Future) -> None:
+        """Hold the MCP session open until disconnect() sets the stop event."""
+        try:
+            async with stdio_client(server_params) as (read_stream, write_stream):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    self._session = session
+                    ready.set_result(None)
+                    await self._stop.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.error(f"MCP session for '{self.card.agent_id}' ended with error: {e}")
+        finally:
+            self._session = None
+
     async def disconnect(self) -> None:
         """Close the MCP session and stop the server."""
-        if self._session_ctx:
-            await self._session_ctx.__aexit__(None, None, None)
-        if self._client_ctx:
-            await self._client_ctx.__aexit__(None, None, None)
+        if self._runner:
+            self._stop.set()
+            await self._runner
+            self._runner = None
         self._session = None
+        self._tools_cache = None
         logger.info(f"🔌 Disconnected from agent '{self.card.name}'")
 
     async def list_tools(self) -> list[dict[str, Any]]:
         """List all tools available on this agent's MCP server."""
         if not self._session:
             return []
-        result = await self._session.list_tools()
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.inputSchema,
-            }
-            for tool in result.tools
-        ]
+        if self._tools_cache is None:
+            result = await self._session.list_tools()
+            self._tools_cache = [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "input_schema": tool.inputSchema,
+                }
+                for tool in result.tools
+            ]
+        return self._tools_cache
 
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> str:
         """Call a specific tool on the agent's MCP server."""
         if not self._session:
-            return json.dumps({"error": f"Agent '{self.card.agent_id}' is not connected"})
+            return orjson.dumps({"error": f"Agent '{self.card.agent_id}' is not connected"}).decode()
 
         try:
             result = await self._session.call_tool(tool_name, arguments)
 
-            # Extract text from MCP response content blocks
-            texts = []
-            for block in result.content:
-                if hasattr(block, "text"):
-                    texts.append(block.text)
-            return "\n".join(texts) if texts else json.dumps({"result": "empty response"})
+            # Extract text from MCP response content blocks; tools here
+            # return a single text block, so take that directly
+            content = result.content
+            if len(content) == 1 and hasattr(content[0], "text"):
+                return content[0].text
+            texts = [block.text for block in content if hasattr(block, "text")]
+            return "\n".join(texts) if texts else orjson.dumps({"result": "empty response"}).decode()
 
         except Exception as e:
             logger.error(f"Error calling {tool_name} on {self.card.agent_id}: {e}")
-            return json.dumps({"error": f"Tool call failed: {str(e)}"})
+            return orjson.dumps({"error": f"Tool call failed: {str(e)}"}).decode()
 
 
 class MCPAgentPool:
@@ -106,6 +153,9 @@ class MCPAgentPool:
 
     def __init__(self):
         self._connections: dict[str, MCPAgentConnection] = {}
+        # get_all_tools result, dropped whenever the connections change
+        self._tools_cache: dict[str, list[dict[str, Any]]] | None = None
+        self._version = 0
 
     async def connect_agent(self, card: AgentCard) -> None:
         """Connect to a single agent."""
@@ -113,12 +163,22 @@ class MCPAgentPool:
         await conn.connect()
         if conn.is_connected:
             self._connections[card.agent_id] = conn
+            self._tools_cache = None
+            self._version += 1
 
     async def disconnect_all(self) -> None:
         """Disconnect from all agents."""
-        for conn in self._connections.values():
-            await conn.disconnect()
+        await asyncio.gather(
+            *(conn.disconnect() for conn in self._connections.values()), return_exceptions=True
+        )
         self._connections.clear()
+        self._tools_cache = None
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Bumped whenever the connected agents change, so tool lists can be reused."""
+        return self._version
 
     def get_connection(self, agent_id: str) -> MCPAgentConnection | None:
         """Get a connection by agent ID."""
@@ -130,10 +190,13 @@ class MCPAgentPool:
 
     async def get_all_tools(self) -> dict[str, list[dict[str, Any]]]:
         """Get all tools from all connected agents, grouped by agent_id."""
-        all_tools = {}
-        for agent_id, conn in self._connections.items():
-            all_tools[agent_id] = await conn.list_tools()
-        return all_tools
+        if self._tools_cache is None:
+            agent_ids = list(self._connections)
+            tool_lists = await asyncio.gather(
+                *(self._connections[agent_id].list_tools() for agent_id in agent_ids)
+            )
+            self._tools_cache = dict(zip(agent_ids, tool_lists))
+        return self._tools_cache
 
     async def call_agent_tool(
         self, agent_id: str, tool_name: str, arguments: dict[str, Any]
@@ -141,5 +204,5 @@ class MCPAgentPool:
         """Call a tool on a specific agent."""
         conn = self._connections.get(agent_id)
         if not conn:
-            return json.dumps({"error": f"Agent '{agent_id}' not found or not connected"})
+            return orjson.dumps({"error": f"Agent '{agent_id}' not found or not connected"}).decode()
         return await conn.call_tool(tool_name, arguments)
@@ -8,15 +8,23 @@ Uses Claude as the reasoning engine to:
 5. Synthesize results into a final response
 """
 
-import json
-import copy
 import logging
 import asyncio
-from typing import Any
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
 
 import httpx
+import orjson
 
 from config.settings import settings
+from shared.utils import (
+    backoff_delay,
+    close_http_clients,
+    format_json_response,
+    get_http_client,
+    retry_delay,
+)
 from orchestrator.agent_cards import (
     AGENT_REGISTRY,
     AgentStatus,
@@ -32,11 +40,59 @@ else:
 
 logger = logging.getLogger(__name__)
 
+
+class ClaudeStreamError(RuntimeError):
+    """An error event received in the middle of a streamed Claude response."""
+
 # ── Constants ──────────────────────────────────────────────────────
 
 ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
 ANTHROPIC_MODEL = "claude-sonnet-4-20250514"
+# Greetings and thanks need no tools, so they go to a faster, cheaper model
+ANTHROPIC_MODEL_FAST = "claude-haiku-4-5-20251001"
 ANTHROPIC_TIMEOUT = 120.0
+ANTHROPIC_RETRY_DEADLINE = 300.0  # overall budget for one call, including retries
+ANTHROPIC_HEADERS = {
+    "x-api-key": settings.anthropic_api_key,
+    "anthropic-version": "2023-06-01",
+    "content-type": "application/json",
+}
+
+# First line of a markdown proposal from proposal_writer's generate_proposal
+# ("# 📄 Technical Proposal — <client>"); used to spot one for DOCX export
+PROPOSAL_MARKDOWN_PREFIX = "# 📄 "
+
+# History compaction: once the resent history passes this rough token
+# estimate (~4 chars per token), tool results older than the most recent
+# messages are replaced by a short note. Claude's own replies, which already
+# summarize those results, are kept verbatim.
+HISTORY_TOKEN_BUDGET = 50_000
+HISTORY_KEEP_RECENT = 6
+COMPACTED_RESULT_PREFIX = "[Earlier tool result omitted to save context"
+
+# One orchestrator can serve several UI sessions; the CLI uses the default.
+# Past this many, the least recently used conversation is dropped.
+DEFAULT_SESSION = "default"
+MAX_CONVERSATIONS = 50
+
+# Agent tool calls from one Claude turn run in parallel, this many at a time
+TOOL_CALL_CONCURRENCY = 4
+
+# Words that make up pure small talk. Confirmations like "ok" or "yes" are
+# left out on purpose: they often answer a question about the next step.
+SMALL_TALK_WORDS = frozenset({
+    "hi", "hello", "hey", "there", "thanks", "thank", "you", "very", "much", "so",
+    "good", "morning", "afternoon", "evening", "night", "bye", "goodbye",
+    "hola", "gracias", "muchas", "buenos", "buenas", "días", "dias",
+    "tardes", "noches", "adiós", "adios", "chao",
+})
+SMALL_TALK_MAX_LENGTH = 40
+
+SMALL_TALK_SYSTEM_PROMPT = (
+    "You are the assistant of a Smart RFP/Proposal Agent system that researches "
+    "clients, finds past projects, estimates pricing and writes proposals. "
+    "Reply briefly and warmly, in the same language the user uses."
+)
 
 ORCHESTRATOR_SYSTEM_PROMPT = """You are the orchestrator of a Smart RFP/Proposal Agent system.
 Your job is to coordinate specialized agents to help users create commercial proposals.
@@ -69,14 +125,26 @@ Your job is to coordinate specialized agents to help users create commercial pro
 """
 
 
+@dataclass(slots=True)
+class Conversation:
+    """Per-session chat state: message history and the last generated proposal."""
+    history: list[dict[str, Any]] = field(default_factory=list)
+    pending_proposal_md: str | None = None
+    pending_proposal_client: str | None = None
+
+
 class Orchestrator:
     """A2A Orchestrator using Claude for reasoning and MCP for tool execution."""
 
     def __init__(self):
         self.pool = MCPAgentPool()
-        self._conversation_history: list[dict[str, Any]] = []
-        self._pending_proposal_md: str | None = None
-        self._pending_proposal_client: str | None = None
+        # One conversation per caller session, least recently used first
+        self._conversations: dict[str, Conversation] = {}
+        # Claude-facing tools and system prompt, rebuilt only when the pool's
+        # version changes (it is bumped on every connect/disconnect)
+        self._tools_version = -1
+        self._claude_tools: list[dict] = []
+        self._system_prompt = ""
 
     # ── Lifecycle ──────────────────────────────────────────────────
 
@@ -86,40 +154,50 @@ class Orchestrator:
         if missing:
             raise RuntimeError(f"Missing required config: {', '.join(missing)}")
 
-        for card in AGENT_REGISTRY.values():
-            if card.status == AgentStatus.AVAILABLE:
-                try:
-                    await self.pool.connect_agent(card)
-                    logger.info(f"✅ Agent connected: {card.name}")
-                except Exception as e:
-                    logger.error(f"❌ Failed to connect {card.name}: {e}")
+        # Handshakes overlap; one agent failing doesn't stop the others
+        await asyncio.gather(*(
+            self._connect_one(card)
+            for card in AGENT_REGISTRY.values()
+            if card.status == AgentStatus.AVAILABLE
+        ))
 
         connected = self.pool.get_available_agents()
+        await self._refresh_tools()
         logger.info(f"🚀 Orchestrator ready. Agents online: {connected}")
 
+    async def _connect_one(self, card) -> None:
+        """Connect a single agent, logging (not raising) a failure."""
+        try:
+            await self.pool.connect_agent(card)
+            logger.info(f"✅ Agent connected: {card.name}")
+        except Exception as e:
+            logger.error(f"❌ Failed to connect {card.name}: {e}")
+
     async def stop(self) -> None:
         """Disconnect all agents."""
         await self.pool.disconnect_all()
+        await close_http_clients()
         logger.info("🛑 Orchestrator stopped.")
 
     # ── Agent Discovery (A2A pattern) ──────────────────────────────
 
     def _build_agent_context(self, tools_by_agent: dict[str, list[dict]]) -> str:
         """Build context string describing available agents for Claude."""
-        lines = []
+        blocks = []
         for agent_id, card in AGENT_REGISTRY.items():
             status_icon = "🟢" if card.status == AgentStatus.AVAILABLE else "🔴"
-            lines.append(f"\n### {status_icon} {card.name} (id: {agent_id})")
-            lines.append(f"Description: {card.description}")
+            block = f"\n### {status_icon} {card.name} (id: {agent_id})\nDescription: {card.description}"
 
             if agent_id in tools_by_agent:
-                lines.append("Tools:")
-                for tool in tools_by_agent[agent_id]:
-                    lines.append(f"  - **{tool['name']}**: {tool.get('description', 'N/A')}")
+                block += "\nTools:" + "".join(
+                    f"\n  - **{tool['name']}**: {tool.get('description', 'N/A')}"
+                    for tool in tools_by_agent[agent_id]
+                )
             elif card.status == AgentStatus.OFFLINE:
-                lines.append("Status: OFFLINE — not available yet")
+                block += "\nStatus: OFFLINE — not available yet"
+            blocks.append(block)
 
-        return "\n".join(lines)
+        return "\n".join(blocks)
 
     def _resolve_schema_refs(self, schema: dict) -> dict:
         """Resolve $defs/$ref and anyOf nullables in JSON Schema.
@@ -128,17 +206,32 @@ class Orchestrator:
         and uses anyOf for Optional types. Claude's tool use API doesn't
         support these, so we inline/simplify them.
         """
-        defs = schema.pop("$defs", {})
+        # Works on a shared schema: never mutates it, only builds new dicts.
+        # Each $defs entry is resolved once and then shared by every $ref to it.
+        defs = schema.get("$defs", {})
+        resolved_defs: dict[str, Any] = {}
+
+        def _resolve_ref(ref_name: str):
+            resolved = resolved_defs.get(ref_name)
+            if resolved is None:
+                resolved = resolved_defs[ref_name] = _resolve(defs[ref_name])
+            return resolved
 
         def _resolve(obj):
             if isinstance(obj, dict):
-                # Resolve $ref
+                # Resolve $ref, keeping sibling keys like description/default
                 if "$ref" in obj:
-                    ref_path = obj["$ref"]
-                    ref_name = ref_path.split("/")[-1]
-                    if ref_name in defs:
-                        return _resolve(defs[ref_name])
-                    return obj
+                    ref_name = obj["$ref"].rsplit("/", 1)[-1]
+                    if ref_name not in defs:
+                        return dict(obj)
+                    resolved = _resolve_ref(ref_name)
+                    if len(obj) == 1:
+                        return resolved
+                    siblings = {
+                        k: _resolve(v) for k, v in obj.items()
+                        if k != "$ref" and not (k == "title" and isinstance(v, str))
+                    }
+                    return {**resolved, **siblings}
 
                 # Simplify anyOf with null (Optional types)
                 if "anyOf" in obj:
@@ -146,12 +239,15 @@ class Orchestrator:
                     if len(non_null) == 1:
                         resolved = _resolve(non_null[0])
                         # Preserve description and default if present
-                        for key in ("description", "default", "title"):
-                            if key in obj:
-                                resolved[key] = obj[key]
-                        return resolved
-
-                return {k: _resolve(v) for k, v in obj.items()}
+                        kept = {key: obj[key] for key in ("description", "default") if key in obj}
+                        return {**resolved, **kept} if kept else resolved
+
+                # Drop generated titles (string-valued, unlike a property
+                # named "title") — they only add tokens to every request
+                return {
+                    k: _resolve(v) for k, v in obj.items()
+                    if k != "$defs" and not (k == "title" and isinstance(v, str))
+                }
             if isinstance(obj, list):
                 return [_resolve(item) for item in obj]
             return obj
@@ -161,11 +257,13 @@ class Orchestrator:
     def _build_claude_tools(self, tools_by_agent: dict[str, list[dict]]) -> list[dict]:
         """Convert MCP tools to Claude API tool format."""
         claude_tools = []
-        for agent_id, tools in tools_by_agent.items():
-            for tool in tools:
+        # Registry order, not connect order: agents connect concurrently, and
+        # a stable tool order keeps Claude's cached prompt prefix identical
+        for agent_id in AGENT_REGISTRY:
+            for tool in tools_by_agent.get(agent_id, ()):
                 # Clean up schema: resolve $defs/$ref and anyOf
                 raw_schema = tool.get("input_schema", {"type": "object", "properties": {}})
-                clean_schema = self._resolve_schema_refs(copy.deepcopy(raw_schema))
+                clean_schema = self._resolve_schema_refs(raw_schema)
 
                 claude_tools.append({
                     "name": f"{agent_id}__{tool['name']}",
@@ -174,48 +272,221 @@ class Orchestrator:
                 })
         return claude_tools
 
+    async def _refresh_tools(self) -> None:
+        """Rebuild Claude's tool list and system prompt if the agent tools changed."""
+        version = self.pool.version
+        if version == self._tools_version:
+            return
+        tools_by_agent = await self.pool.get_all_tools()
+        self._claude_tools = self._build_claude_tools(tools_by_agent)
+        self._system_prompt = ORCHESTRATOR_SYSTEM_PROMPT.format(
+            agent_context=self._build_agent_context(tools_by_agent)
+        )
+        self._tools_version = version
+
+    @staticmethod
+    def _compact_history(history: list[dict[str, Any]]) -> None:
+        """Drop the bodies of old tool results once the history gets too large.
+
+        The tool_use/tool_result pairing is kept so the history stays valid;
+        only the result text is replaced. Compacted results are short and
+        stable, so the prompt cache re-warms on the next call.
+        """
+        approx_tokens = len(orjson.dumps(history)) // 4
+        if approx_tokens <= HISTORY_TOKEN_BUDGET:
+            return
+
+        dropped = 0
+        for message in history[:-HISTORY_KEEP_RECENT]:
+            content = message["content"]
+            if message["role"] != "user" or isinstance(content, str):
+                continue
+            for idx, block in enumerate(content):
+                result = block.get("content")
+                if block.get("type") != "tool_result" or not isinstance(result, str):
+                    continue
+                if result.startswith(COMPACTED_RESULT_PREFIX):
+                    continue
+                content[idx] = {
+                    "type": "tool_result",
+                    "tool_use_id": block["tool_use_id"],
+                    "content": f"{COMPACTED_RESULT_PREFIX} ({len(result)} chars); "
+                               f"see the reply that followed it]",
+                }
+                dropped += len(result)
+        if dropped:
+            logger.info(f"🗜️ Compacted history (~{approx_tokens} tokens): dropped {dropped} chars of old tool results")
+
     # ── Execution ──────────────────────────────────────────────────
 
+    @staticmethod
+    def _mark_cache_breakpoint(messages: list[dict]) -> list[dict]:
+        """Return `messages` with a cache breakpoint on the final content block.
+
+        The history is only ever appended to, so caching up to the latest
+        message lets the next loop iteration read everything before it from
+        the prompt cache. The stored history is left untouched so breakpoints
+        don't pile up past the API limit of four.
+        """
+        if not messages:
+            return messages
+        last = messages[-1]
+        content = last["content"]
+        if isinstance(content, str):
+            blocks = [{"type": "text", "text": content}]
+        else:
+            blocks = list(content)
+        if not blocks:
+            return messages
+        blocks[-1] = {**blocks[-1], "cache_control": {"type": "ephemeral"}}
+        return [*messages[:-1], {**last, "content": blocks}]
+
+    @staticmethod
+    async def _read_message_stream(
+        response: httpx.Response, on_tool_use: Callable[[dict], None]
+    ) -> dict:
+        """Assemble a streamed (SSE) Messages API response into a message dict.
+
+        Returns the same shape as the non-streaming endpoint. Each tool_use
+        block is handed to `on_tool_use` as soon as its input is complete,
+        while Claude is still generating the rest of the turn.
+        """
+        message: dict[str, Any] = {}
+        blocks: dict[int, dict] = {}
+        partial_json: dict[int, list[str]] = {}
+
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            event = orjson.loads(line[5:])
+            kind = event.get("type")
+
+            if kind == "content_block_delta":
+                delta = event["delta"]
+                if delta["type"] == "text_delta":
+                    blocks[event["index"]]["text"] += delta["text"]
+                elif delta["type"] == "input_json_delta":
+                    partial_json[event["index"]].append(delta["partial_json"])
+            elif kind == "content_block_start":
+                block = blocks[event["index"]] = dict(event["content_block"])
+                if block["type"] == "tool_use":
+                    partial_json[event["index"]] = []
+            elif kind == "content_block_stop":
+                block = blocks[event["index"]]
+                if block["type"] == "tool_use":
+                    raw_input = "".join(partial_json.pop(event["index"]))
+                    block["input"] = orjson.loads(raw_input) if raw_input else {}
+                    on_tool_use(block)
+            elif kind == "message_start":
+                message = event["message"]
+            elif kind == "message_delta":
+                message.update(event.get("delta", {}))
+                message.setdefault("usage", {}).update(event.get("usage", {}))
+            elif kind == "message_stop":
+                break
+            elif kind == "error":
+                raise ClaudeStreamError(event.get("error", {}).get("message", "stream error"))
+
+        message["content"] = [blocks[i] for i in sorted(blocks)]
+        return message
+
     async def _call_claude(
         self,
         system_prompt: str,
         messages: list[dict],
         tools: list[dict],
         max_retries: int = 5,
+        model: str = ANTHROPIC_MODEL,
+        on_tool_use: Callable[[dict], None] | None = None,
     ) -> dict:
-        """Make a request to Claude API with tool use and retry on rate limits."""
+        """Make a request to Claude API with tool use and retry on rate limits.
+
+        With `on_tool_use` the response is streamed and each tool_use block is
+        passed to it as soon as it is complete. A call that has already handed
+        out a tool_use is never retried, so no tool runs twice.
+        """
+        # Pooled keep-alive client, so loop iterations reuse one connection
+        client = get_http_client("anthropic", ANTHROPIC_TIMEOUT, http2=True)
+        payload = {
+            "model": model,
+            "max_tokens": 4096,
+            # Tools, system prompt and history are cached as one
+            # growing prefix across the agentic loop
+            "system": [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+            "messages": self._mark_cache_breakpoint(messages),
+            "tools": (
+                [*tools[:-1], {**tools[-1], "cache_control": {"type": "ephemeral"}}]
+                if tools else []
+            ),
+        }
+        if on_tool_use is not None:
+            payload["stream"] = True
+        # Serialized once so every retry resends the same bytes
+        body = orjson.dumps(payload)
+
+        tools_started = 0
+
+        def _dispatch(block: dict) -> None:
+            nonlocal tools_started
+            tools_started += 1
+            on_tool_use(block)
+
+        deadline = time.monotonic() + ANTHROPIC_RETRY_DEADLINE
         for attempt in range(max_retries):
-            async with httpx.AsyncClient(timeout=ANTHROPIC_TIMEOUT) as client:
-                response = await client.post(
+            delay = backoff_delay(attempt)
+            retrying = False
+            try:
+                async with client.stream(
+                    "POST",
                     ANTHROPIC_API_URL,
-                    headers={
-                        "x-api-key": settings.anthropic_api_key,
-                        "anthropic-version": "2023-06-01",
-                        "content-type": "application/json",
-                    },
-                    json={
-                        "model": ANTHROPIC_MODEL,
-                        "max_tokens": 4096,
-                        "system": system_prompt,
-                        "messages": messages,
-                        "tools": tools if tools else [],
-                    },
-                )
-
-                if response.status_code == 429:
-                    wait_time = (attempt + 1) * 15  # 15s, 30s, 45s, 60s, 75s
-                    logger.warning(f"⏳ Rate limited. Retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(wait_time)
-                    continue
-
-                if response.status_code >= 400:
-                    logger.error(f"❌ Claude API error {response.status_code}: {response.text}")
-
-                response.raise_for_status()
-                return response.json()
-
-        # Last attempt failed
-        raise RuntimeError("Claude API rate limit exceeded after all retries. Wait a minute and try again.")
+                    headers=ANTHROPIC_HEADERS,
+                    content=body,
+                    timeout=ANTHROPIC_TIMEOUT,
+                ) as response:
+                    if response.status_code >= 400:
+                        await response.aread()
+
+                    # 429 and 5xx (incl. 529 overloaded) are transient; honour Retry-After
+                    if response.status_code == 429 or response.status_code >= 500:
+                        delay = retry_delay(response, attempt)
+                        if attempt < max_retries - 1 and time.monotonic() + delay < deadline:
+                            source = "Retry-After" if "retry-after" in response.headers else "backoff"
+                            logger.warning(f"⏳ Claude API {response.status_code}. Retrying in {delay:.1f}s ({source})... (attempt {attempt + 1}/{max_retries})")
+                            retrying = True
+                        elif response.status_code == 429:
+                            raise RuntimeError("Claude API rate limit exceeded after all retries. Wait a minute and try again.")
+
+                    if not retrying:
+                        if response.status_code >= 400:
+                            logger.error(f"❌ Claude API error {response.status_code}: {response.text}")
+                        response.raise_for_status()
+                        if on_tool_use is None:
+                            data = orjson.loads(await response.aread())
+                        else:
+                            data = await self._read_message_stream(response, _dispatch)
+            except (httpx.TransportError, ClaudeStreamError) as e:
+                if tools_started or attempt == max_retries - 1 or time.monotonic() + delay > deadline:
+                    raise
+                logger.warning(f"⏳ Claude API failed ({type(e).__name__}: {e}). Retrying in {delay:.1f}s... (attempt {attempt + 1}/{max_retries})")
+                retrying = True
+
+            if retrying:
+                await asyncio.sleep(delay)
+                continue
+
+            usage = data.get("usage", {})
+            logger.info(
+                f"🧮 Tokens: {usage.get('input_tokens', 0)} in, "
+                f"{usage.get('cache_read_input_tokens', 0)} cache read, "
+                f"{usage.get('cache_creation_input_tokens', 0)} cache write"
+            )
+            return data
 
     async def _execute_tool_call(self, tool_name: str, tool_input: dict) -> str:
         """Route a Claude tool call to the correct agent MCP server.
@@ -224,7 +495,7 @@ class Orchestrator:
         """
         parts = tool_name.split("__", 1)
         if len(parts) != 2:
-            return json.dumps({"error": f"Invalid tool name format: {tool_name}"})
+            return orjson.dumps({"error": f"Invalid tool name format: {tool_name}"}).decode()
 
         agent_id, mcp_tool_name = parts
         logger.info(f"🔧 Calling tool '{mcp_tool_name}' on agent '{agent_id}'")
@@ -232,27 +503,75 @@ class Orchestrator:
         result = await self.pool.call_agent_tool(agent_id, mcp_tool_name, tool_input)
         return result
 
+    @staticmethod
+    def _is_small_talk(user_message: str) -> bool:
+        """True for short greetings/thanks that can't need any agent tool."""
+        if len(user_message) > SMALL_TALK_MAX_LENGTH:
+            return False
+        words = "".join(c if c.isalpha() else " " for c in user_message.lower()).split()
+        return bool(words) and all(word in SMALL_TALK_WORDS for word in words)
+
     # ── Main Chat Loop ─────────────────────────────────────────────
 
-    async def chat(self, user_message: str) -> str:
+    def conversation(self, session_id: str = DEFAULT_SESSION) -> Conversation:
+        """Return the session's conversation, creating it on first use."""
+        conversation = self._conversations.pop(session_id, None) or Conversation()
+        self._conversations[session_id] = conversation
+        while len(self._conversations) > MAX_CONVERSATIONS:
+            evicted = next(iter(self._conversations))
+            del self._conversations[evicted]
+            logger.info(f"🧹 Dropped idle conversation {evicted}")
+        return conversation
+
+    async def chat(
+        self,
+        user_message: str,
+        session_id: str = DEFAULT_SESSION,
+        on_progress: Callable[[str], None] | None = None,
+    ) -> str:
         """Process a user message through the full A2A orchestration loop.
 
         1. Discover available tools from connected agents
         2. Send user message + tools to Claude
         3. If Claude wants to use tools → execute them → send results back
         4. Repeat until Claude produces a final text response
-        """
-        # Step 1: Discover tools from connected agents
-        tools_by_agent = await self.pool.get_all_tools()
-        agent_context = self._build_agent_context(tools_by_agent)
-        claude_tools = self._build_claude_tools(tools_by_agent)
-        system_prompt = ORCHESTRATOR_SYSTEM_PROMPT.format(agent_context=agent_context)
 
-        # Step 2: Add user message to conversation
-        self._conversation_history.append({"role": "user", "content": user_message})
+        `on_progress`, if given, receives the agent tool name ('agent__tool')
+        as each tool call starts.
+        """
+        # Step 1: Discover tools from connected agents (cached per session)
+        await self._refresh_tools()
+        claude_tools = self._claude_tools
+        system_prompt = self._system_prompt
+
+        # Step 2: Add user message to conversation, compacting old turns first
+        conversation = self.conversation(session_id)
+        history = conversation.history
+        self._compact_history(history)
+        history.append({"role": "user", "content": user_message})
+
+        # Small talk: one fast-model call on just this message. The history
+        # is left out because it may hold tool blocks, which the API only
+        # accepts alongside the tool catalog.
+        if self._is_small_talk(user_message):
+            logger.info("💬 Small talk — answering with the fast model")
+            response = await self._call_claude(
+                system_prompt=SMALL_TALK_SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": user_message}],
+                tools=[],
+                model=ANTHROPIC_MODEL_FAST,
+            )
+            content_blocks = response.get("content", [])
+            history.append({"role": "assistant", "content": content_blocks})
+            return "".join(block["text"] for block in content_blocks if block.get("type") == "text")
 
         # Step 3: Agentic loop — keep calling Claude until it stops using tools
         max_iterations = 10
+        semaphore = asyncio.Semaphore(TOOL_CALL_CONCURRENCY)
+
+        async def run_tool_call(tool_name: str, tool_input: dict) -> str:
+            async with semaphore:
+                return await self._execute_tool_call(tool_name, tool_input)
 
         logger.info(f"📋 Sending {len(claude_tools)} tools to Claude")
         for t in claude_tools:
@@ -260,20 +579,40 @@ class Orchestrator:
         for iteration in range(max_iterations):
             logger.info(f"🔄 Orchestrator iteration {iteration + 1}")
 
-            response = await self._call_claude(
-                system_prompt=system_prompt,
-                messages=self._conversation_history,
-                tools=claude_tools,
-            )
+            # Tool calls start while Claude is still streaming the rest of the turn
+            started: dict[str, asyncio.Task] = {}
+
+            def start_tool_call(block: dict) -> None:
+                logger.info(f"📨 Tool call: {block['name']} with input: {orjson.dumps(block['input'])[:200].decode(errors='replace')}")
+                started[block["id"]] = asyncio.create_task(
+                    run_tool_call(block["name"], block["input"])
+                )
+                if on_progress is not None:
+                    on_progress(block["name"])
+
+            try:
+                response = await self._call_claude(
+                    system_prompt=system_prompt,
+                    messages=history,
+                    tools=claude_tools,
+                    on_tool_use=start_tool_call,
+                )
+            except BaseException:
+                for task in started.values():
+                    task.cancel()
+                raise
 
             stop_reason = response.get("stop_reason")
             content_blocks = response.get("content", [])
 
             # Add assistant response to history
-            self._conversation_history.append({"role": "assistant", "content": content_blocks})
+            history.append({"role": "assistant", "content": content_blocks})
 
             # If Claude is done (no more tool calls), extract final text
             if stop_reason == "end_turn" or stop_reason != "tool_use":
+                # Tools only run for a tool_use turn (e.g. not one cut off by max_tokens)
+                for task in started.values():
+                    task.cancel()
                 final_text = ""
                 for block in content_blocks:
                     if block.get("type") == "text":
@@ -281,60 +620,66 @@ class Orchestrator:
 
                 # Auto-export: if proposal was generated and user wanted DOCX
                 wants_docx = any(kw in user_message.lower() for kw in ["docx", "word", "exporta", "documento"])
-                if self._pending_proposal_md and self._pending_proposal_client and wants_docx:
-                    logger.info(f"📄 Auto-exporting proposal to DOCX for {self._pending_proposal_client}...")
+                if conversation.pending_proposal_md and conversation.pending_proposal_client and wants_docx:
+                    logger.info(f"📄 Auto-exporting proposal to DOCX for {conversation.pending_proposal_client}...")
                     try:
                         export_result = await self._execute_tool_call(
                             "proposal_writer__export_proposal_docx",
                             {"params": {
-                                "proposal_markdown": self._pending_proposal_md,
-                                "client_name": self._pending_proposal_client,
-                                "project_title": f"Technical Proposal — {self._pending_proposal_client}",
+                                "proposal_markdown": conversation.pending_proposal_md,
+                                "client_name": conversation.pending_proposal_client,
+                                "project_title": f"Technical Proposal — {conversation.pending_proposal_client}",
                             }},
                         )
                         logger.info(f"📄 DOCX export result: {export_result[:300]}...")
                         final_text += f"\n\n---\n📄 **Documento DOCX generado automáticamente.**\n{export_result}"
                         # Clear after successful export
-                        self._pending_proposal_md = None
-                        self._pending_proposal_client = None
+                        conversation.pending_proposal_md = None
+                        conversation.pending_proposal_client = None
                     except Exception as e:
                         logger.error(f"❌ Auto-export failed: {e}")
                         final_text += f"\n\n⚠️ No se pudo exportar a DOCX automáticamente: {e}"
 
                 return final_text
 
-            # Step 4: Execute tool calls and collect results
-            tool_results = []
-
-            for block in content_blocks:
-                if block.get("type") == "tool_use":
-                    tool_id = block["id"]
-                    tool_name = block["name"]
-                    tool_input = block["input"]
+            # Step 4: Collect the (already running, concurrent) tool call results
+            tool_calls = [block for block in content_blocks if block.get("type") == "tool_use"]
+            for block in tool_calls:
+                if block["id"] not in started:
+                    start_tool_call(block)
 
-                    logger.info(f"📨 Tool call: {tool_name} with input: {json.dumps(tool_input)[:200]}")
-                    result = await self._execute_tool_call(tool_name, tool_input)
-                    logger.info(f"📬 Tool result preview: {result[:200]}...")
+            results = await asyncio.gather(
+                *(started[block["id"]] for block in tool_calls),
+                return_exceptions=True,
+            )
 
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": tool_id,
-                        "content": result,
-                    })
+            tool_results = []
+            for block, result in zip(tool_calls, results):
+                tool_name = block["name"]
+                tool_input = block["input"]
+                if isinstance(result, BaseException):
+                    logger.error(f"❌ Tool {tool_name} failed: {result}")
+                    result = format_json_response({"error": f"Tool call failed: {result}"})
+                logger.info(f"📬 Tool result preview: {result[:200]}...")
+
+                tool_results.append({
+                    "type": "tool_result",
+                    "tool_use_id": block["id"],
+                    "content": result,
+                })
 
-                    # Track proposal generation for auto-export
-                    if tool_name == "proposal_writer__generate_proposal" and "📄 Technical Proposal" in result:
-                        self._pending_proposal_md = result
-                        params = tool_input.get("params", tool_input)
-                        self._pending_proposal_client = params.get("client_name", "Client")
+                # Track proposal generation for auto-export (markdown output only;
+                # errors and JSON output don't start with the proposal heading)
+                if tool_name == "proposal_writer__generate_proposal" and result.startswith(PROPOSAL_MARKDOWN_PREFIX):
+                    conversation.pending_proposal_md = result
+                    params = tool_input.get("params", tool_input)
+                    conversation.pending_proposal_client = params.get("client_name", "Client")
 
             # Add tool results to conversation for next iteration
-            self._conversation_history.append({"role": "user", "content": tool_results})
+            history.append({"role": "user", "content": tool_results})
 
         return "⚠️ Maximum orchestration iterations reached. Partial results may be available."
 
-    def reset_conversation(self) -> None:
+    def reset_conversation(self, session_id: str = DEFAULT_SESSION) -> None:
         """Clear conversation history for a new session."""
-        self._conversation_history.clear()
-        self._pending_proposal_md = None
-        self._pending_proposal_client = None
\ No newline at end of file
+        self._conversations.pop(session_id, None)
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""On-disk cache for Claude responses, keyed by a SHA-256 of the prompt.
+
+Identical (model, system prompt, user content) requests return the stored
+text instead of making another API round-trip. Backed by SQLite in WAL mode
+so concurrent agent processes can read while one writes.
+
+`LLM_CACHE_MODE` selects the policy: `enabled` reads and writes, `readonly`
+never writes, `writeonly` always calls the API but records the answer,
+`replay` raises `CacheMiss` instead of calling the API, and `disabled`
+bypasses the cache entirely.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from config.settings import settings
+
+CACHE_PATH = Path(__file__).parent.parent / ".cache" / "llm_cache.sqlite3"
+
+READ_MODES = frozenset({"enabled", "readonly", "replay"})
+WRITE_MODES = frozenset({"enabled", "writeonly"})
+
+_conn: sqlite3.Connection | None = None
+_lock = threading.Lock()
+
+
+class CacheMiss(LookupError):
+    """Raised in `replay` mode when a request has no cached response."""
+
+
+def _mode() -> str:
+    """Effective cache policy; LLM_CACHE_ENABLED=false always wins."""
+    return settings.llm_cache_mode if settings.llm_cache_enabled else "disabled"
+
+
+def _connection() -> sqlite3.Connection:
+    """Open the cache database once per process."""
+    global _conn
+    if _conn is None:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(CACHE_PATH, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        _conn = conn
+    return _conn
+
+
+def make_key(model: str, system_prompt: str, user_content: str, max_tokens: int | None = None) -> str:
+    """Hash the parts of a request that determine Claude's answer."""
+    raw = f"{model}\x00{system_prompt}\x00{user_content}"
+    if max_tokens is not None:
+        raw += f"\x00{max_tokens}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def get(prompt_hash: str) -> str | None:
+    """Return a cached response, or None on a miss or expired entry.
+
+    In `replay` mode a miss raises `CacheMiss` so no API call is made.
+    """
+    mode = _mode()
+    if mode not in READ_MODES:
+        return None
+    min_created = time.time() - settings.llm_cache_ttl_days * 86400
+    with _lock:
+        row = _connection().execute(
+            "SELECT response FROM responses WHERE key = ? AND created_at >= ?",
+            (prompt_hash, min_created),
+        ).fetchone()
+    if row:
+        return row[0]
+    if mode == "replay":
+        raise CacheMiss(f"No cached Claude response for {prompt_hash[:12]} (LLM_CACHE_MODE=replay)")
+    return None
+
+
+def _write(prompt_hash: str, response: str) -> None:
+    """Insert or replace one row (blocking; called from a worker thread)."""
+    with _lock:
+        _connection().execute(
+            "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+            (prompt_hash, response, time.time()),
+        )
+
+
+async def store(prompt_hash: str, response: str) -> None:
+    """Store a response, replacing any previous entry for the same key.
+
+    The SQLite write runs in a worker thread so it never blocks the event loop.
+    """
+    if _mode() not in WRITE_MODES:
+        return
+    await asyncio.to_thread(_write, prompt_hash, response)
@@ -1,13 +1,151 @@
 """Shared utilities for all agents."""
 
-import json
+import asyncio
+import importlib.util
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import httpx
+import orjson
 from typing import Any
 
 
+# ── HTTP Client Pool ───────────────────────────────────────────────
+
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# httpx only speaks HTTP/2 when the optional `h2` package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# httpx connection pools are bound to the event loop that opened them, so
+# clients are cached per running loop, then by (name, timeout, http2).
+_HTTP_CLIENTS: dict[asyncio.AbstractEventLoop, dict[tuple, httpx.AsyncClient]] = {}
+
+
+def _timeout_key(timeout: float | httpx.Timeout) -> Any:
+    """Hashable form of a timeout (httpx.Timeout itself is unhashable)."""
+    if isinstance(timeout, httpx.Timeout):
+        return tuple(sorted(timeout.as_dict().items()))
+    return timeout
+
+
+def get_http_client(name: str, timeout: float | httpx.Timeout, http2: bool = False) -> httpx.AsyncClient:
+    """Return a keep-alive AsyncClient shared by every call on this event loop.
+
+    Callers that share a `name` but ask for a different timeout get their
+    own client, so each one's timeout is the one it declared. With
+    `http2=True` concurrent requests are multiplexed over one connection
+    when `h2` is installed; otherwise the client falls back to HTTP/1.1.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _HTTP_CLIENTS.get(loop)
+    if clients is None:
+        # Forget loops that were closed without close_http_clients()
+        for stale in [other for other in _HTTP_CLIENTS if other.is_closed()]:
+            del _HTTP_CLIENTS[stale]
+        clients = _HTTP_CLIENTS[loop] = {}
+    key = (name, _timeout_key(timeout), http2)
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=HTTP_LIMITS,
+            http2=http2 and HTTP2_AVAILABLE,
+        )
+        clients[key] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close every pooled client opened on the running event loop."""
+    clients = _HTTP_CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
+
+# ── Retries ────────────────────────────────────────────────────────
+
+def backoff_delay(attempt: int, cap: float = 60.0) -> float:
+    """Exponential backoff with jitter for retry `attempt` (0-based)."""
+    return min(cap, 2 ** attempt) + random.uniform(0, 1)
+
+
+def retry_delay(response: httpx.Response, attempt: int, cap: float = 60.0) -> float:
+    """Delay before retrying `response`, honouring its Retry-After header.
+
+    Retry-After may be a number of seconds or an HTTP date; without a usable
+    value this falls back to `backoff_delay`.
+    """
+    retry_after = response.headers.get("retry-after")
+    if retry_after:
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            try:
+                seconds = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                seconds = None
+        if seconds is not None:
+            return min(cap, max(0.0, seconds)) + random.uniform(0, 1)
+    return backoff_delay(attempt, cap)
+
+
+# ── Rate Limiting ──────────────────────────────────────────────────
+
+class TokenBucket:
+    """Client-side pacing for an API quota of requests and tokens per minute.
+
+    Both buckets start full and refill continuously. `acquire` waits until
+    one request and the estimated tokens are available, so bursts are paced
+    before the API has to answer them with 429s. A limit of 0 disables that
+    bucket. State is guarded by a thread lock rather than an asyncio one, so
+    a single bucket can be shared across event loops.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self._capacity = (float(requests_per_minute), float(tokens_per_minute))
+        self._levels = list(self._capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        """Take one request and `tokens` if available; else return the wait."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed, self._updated = now - self._updated, now
+            needs = (1.0, float(tokens))
+            wait = 0.0
+            for i, capacity in enumerate(self._capacity):
+                if not capacity:
+                    continue
+                self._levels[i] = min(capacity, self._levels[i] + elapsed * capacity / 60)
+                need = min(needs[i], capacity)
+                if self._levels[i] < need:
+                    wait = max(wait, (need - self._levels[i]) * 60 / capacity)
+            if wait:
+                return wait
+            for i, capacity in enumerate(self._capacity):
+                if capacity:
+                    self._levels[i] -= min(needs[i], capacity)
+            return 0.0
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until a request estimated at `tokens` tokens may be sent."""
+        while (wait := self._reserve(tokens)) > 0:
+            await asyncio.sleep(wait)
+
+
+# ── Responses ──────────────────────────────────────────────────────
+
 def format_json_response(data: dict[str, Any]) -> str:
     """Format a dictionary as a JSON string for MCP tool responses."""
-    return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+    return orjson.dumps(
+        data,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    ).decode()
 
 
 def handle_api_error(e: Exception) -> str:
@@ -2,48 +2,184 @@
 
 Creates a dedicated daemon thread running a persistent asyncio event loop.
 The Orchestrator and its MCP subprocess connections live entirely on that
-loop, surviving Streamlit's page reruns.
+loop, surviving Streamlit's page reruns. One bridge is shared by every
+browser session (`get_bridge`); conversations are kept apart by session id.
 """
 
 import asyncio
+import atexit
+import queue
+import sys
 import threading
-from typing import Optional
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Optional
 
-from orchestrator.orchestrator import Orchestrator
+from config.settings import settings
+
+try:
+    import uvloop
+except ImportError:  # optional; not available on Windows
+    uvloop = None
+
+
+class SessionHandle:
+    """Ties a caller session's lifetime to its orchestrator conversation."""
+    __slots__ = ("session_id", "__weakref__")
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+
+
+# How often a chat waiting on the loop checks for progress updates (seconds)
+PROGRESS_POLL_INTERVAL = 0.1
 
 
 class OrchestratorBridge:
-    """Wraps the async Orchestrator for synchronous Streamlit calls."""
+    """Wraps the async Orchestrator for synchronous Streamlit calls.
+
+    Only start/chat/stop run coroutines on the loop (`_run_async`). Reads of
+    loop-owned state hop onto the loop thread with a plain callback
+    (`_run_fast`); the agent snapshot is a plain memory read.
+    """
 
     def __init__(self):
+        # Imported here so importing this module doesn't load the agent stack
+        from orchestrator.orchestrator import Orchestrator
+
         self._orchestrator = Orchestrator()
-        self._loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        # asyncio.to_thread work (reranking, semantic cache lookups) from all
+        # agents shares this pool instead of the small cpu_count-based default
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.thread_pool_size, thread_name_prefix="orchestrator-io"
+        )
+        # The loop is created on its own thread; wait until it is running
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._ready = threading.Event()
+        self._connected_agents: tuple[str, ...] = ()
         self._thread = threading.Thread(
             target=self._run_loop, daemon=True, name="orchestrator-loop"
         )
         self._thread.start()
+        self._ready.wait()
 
     def _run_loop(self):
-        asyncio.set_event_loop(self._loop)
-        self._loop.run_forever()
+        # uvloop when installed; only this thread's loop, not a global policy
+        loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        loop.set_default_executor(self._executor)
+        # Python 3.12+: tasks run synchronously until their first real
+        # suspension, so ones that finish straight away never hit the scheduler
+        if sys.version_info >= (3, 12):
+            loop.set_task_factory(asyncio.eager_task_factory)
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        loop.call_soon(self._ready.set)
+        loop.run_forever()
+
+    def _submit(self, coro) -> Future:
+        """Schedule a coroutine on the background loop from another thread."""
+        if threading.get_ident() == self._thread.ident:
+            # Blocking the loop's own thread on its future would deadlock;
+            # code already on the loop schedules work with asyncio.create_task
+            coro.close()
+            raise RuntimeError("_run_async called from the orchestrator loop; use asyncio.create_task")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
 
     def _run_async(self, coro, timeout: float = 180.0):
         """Submit a coroutine to the background loop and block until done."""
-        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
-        return future.result(timeout=timeout)
+        return self._submit(coro).result(timeout=timeout)
+
+    def _run_fast(self, fn: Callable, *args, timeout: float = 5.0):
+        """Run a quick synchronous call on the loop thread and return its result.
+
+        For reads of loop-owned state: a callback plus an Event is cheaper than
+        wrapping the call in a coroutine and a concurrent Future.
+        """
+        if threading.get_ident() == self._thread.ident:
+            return fn(*args)
+        done = threading.Event()
+        outcome: list = []
+
+        def _call():
+            try:
+                outcome.append((True, fn(*args)))
+            except BaseException as e:
+                outcome.append((False, e))
+            finally:
+                done.set()
+
+        self._loop.call_soon_threadsafe(_call)
+        if not done.wait(timeout):
+            raise TimeoutError(f"{getattr(fn, '__name__', fn)} did not run on the orchestrator loop within {timeout}s")
+        ok, value = outcome[0]
+        if not ok:
+            raise value
+        return value
 
     def start(self) -> list[str]:
         """Start orchestrator and connect agents. Returns connected agent IDs."""
         self._run_async(self._orchestrator.start(), timeout=60.0)
-        return self._orchestrator.pool.get_available_agents()
+        # Snapshot taken once the loop is done connecting, so readers on the
+        # Streamlit thread never iterate the pool while the loop mutates it
+        self._connected_agents = tuple(self._orchestrator.pool.get_available_agents())
+        return list(self._connected_agents)
+
+    def chat(
+        self,
+        message: str,
+        session_id: str,
+        on_progress: Callable[[str], None] | None = None,
+        timeout: float = 300.0,
+    ) -> str:
+        """Send a message and block until response is ready (up to 5 min).
 
-    def chat(self, message: str) -> str:
-        """Send a message and block until response is ready (up to 5 min)."""
-        return self._run_async(self._orchestrator.chat(message), timeout=300.0)
+        With `on_progress`, the wait polls instead: each tool call the
+        orchestrator starts is passed to `on_progress` on the calling thread,
+        so the UI can show it. If `on_progress` raises (e.g. Streamlit
+        interrupting the script), the turn still runs to completion so the
+        conversation history stays consistent, and the error is re-raised.
+        """
+        if on_progress is None:
+            return self._run_async(self._orchestrator.chat(message, session_id), timeout=timeout)
 
-    def reset_conversation(self):
+        progress: queue.SimpleQueue[str] = queue.SimpleQueue()
+        future = self._submit(self._orchestrator.chat(message, session_id, on_progress=progress.put))
+        deadline = time.monotonic() + timeout
+        interrupted: BaseException | None = None
+        done = False
+        while not done:
+            try:
+                result = future.result(timeout=min(PROGRESS_POLL_INTERVAL, max(0.0, deadline - time.monotonic())))
+                done = True
+            except FutureTimeoutError:  # not the builtin TimeoutError before 3.11
+                if time.monotonic() >= deadline:
+                    raise
+            while interrupted is None and not progress.empty():
+                try:
+                    on_progress(progress.get_nowait())
+                except BaseException as e:
+                    interrupted = e
+        if interrupted is not None:
+            raise interrupted
+        return result
+
+    def reset_conversation(self, session_id: str):
         """Clear conversation history for a new session."""
-        self._orchestrator.reset_conversation()
+        self._loop.call_soon_threadsafe(self._orchestrator.reset_conversation, session_id)
+
+    def open_session(self, session_id: str) -> "SessionHandle":
+        """Return a handle for the caller to keep in its session state.
+
+        Streamlit never says when a tab closes, but it does drop the closed
+        session's state; once the handle is garbage collected, the session's
+        conversation is dropped from the orchestrator too.
+        """
+        handle = SessionHandle(session_id)
+        finalizer = weakref.finalize(handle, self.reset_conversation, session_id)
+        finalizer.atexit = False  # the whole bridge is stopped at exit anyway
+        return handle
 
     def stop(self):
         """Disconnect agents and stop the background loop."""
@@ -51,15 +187,47 @@ class OrchestratorBridge:
             self._run_async(self._orchestrator.stop(), timeout=30.0)
         finally:
             self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5.0)
+            self._executor.shutdown(wait=False)
 
-    @property
-    def pending_proposal_md(self) -> Optional[str]:
-        return self._orchestrator._pending_proposal_md
+    def pending_proposal(self, session_id: str) -> tuple[Optional[str], Optional[str]]:
+        """The session's last generated proposal markdown and client name."""
+        return self._run_fast(self._read_pending_proposal, session_id)
 
-    @property
-    def pending_proposal_client(self) -> Optional[str]:
-        return self._orchestrator._pending_proposal_client
+    def _read_pending_proposal(self, session_id: str) -> tuple[Optional[str], Optional[str]]:
+        # Runs on the loop thread, which owns the conversations dict
+        conversation = self._orchestrator._conversations.get(session_id)
+        if conversation is None:
+            return None, None
+        return conversation.pending_proposal_md, conversation.pending_proposal_client
 
     @property
     def connected_agents(self) -> list[str]:
-        return self._orchestrator.pool.get_available_agents()
+        return list(self._connected_agents)
+
+
+# ── Shared Instance ────────────────────────────────────────────────
+
+_BRIDGE: OrchestratorBridge | None = None
+_BRIDGE_LOCK = threading.Lock()
+
+
+def get_bridge() -> OrchestratorBridge:
+    """Return the process-wide bridge, starting it on first use.
+
+    Every Streamlit session shares its loop, agent connections and HTTP
+    clients. If startup fails the bridge is torn down and the error raised,
+    so the next session retries.
+    """
+    global _BRIDGE
+    with _BRIDGE_LOCK:
+        if _BRIDGE is None:
+            bridge = OrchestratorBridge()
+            try:
+                bridge.start()
+            except BaseException:
+                bridge.stop()
+                raise
+            atexit.register(bridge.stop)
+            _BRIDGE = bridge
+        return _BRIDGE
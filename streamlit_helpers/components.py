@@ -1,10 +1,11 @@
 """Streamlit UI components for the Smart RFP Agent."""
 
 import os
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Iterable
 import streamlit as st
 
-from orchestrator.agent_cards import AGENT_REGISTRY
-
 
 # ── Translations ────────────────────────────────────────────────────
 
@@ -60,16 +61,64 @@ STRINGS = {
 }
 
 
+# String table for the current script run, bound once by the render
+# functions so each `t()` call skips the session state lookup
+_CURRENT_STRINGS: ContextVar[dict[str, str] | None] = ContextVar("current_strings", default=None)
+
+
+def _bind_language() -> str:
+    """Resolve the session's language table for the rest of this run; returns the language."""
+    lang = st.session_state.get("language", "EN")
+    _CURRENT_STRINGS.set(STRINGS.get(lang, STRINGS["EN"]))
+    return lang
+
+
 def t(key: str) -> str:
     """Get translated string for current language."""
-    lang = st.session_state.get("language", "EN")
-    return STRINGS.get(lang, STRINGS["EN"]).get(key, key)
+    strings = _CURRENT_STRINGS.get()
+    if strings is None:
+        lang = st.session_state.get("language", "EN")
+        strings = STRINGS.get(lang, STRINGS["EN"])
+    return strings.get(key, key)
 
 
 # ── Sidebar ─────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
+def _agent_cards() -> tuple[tuple[str, str, str, str], ...]:
+    """(agent_id, name, description markdown, skills markdown) per agent, built on first render.
+
+    Agent cards are static, so each skill list is rendered to markdown once;
+    the registry is imported here so importing this module stays cheap.
+    """
+    from orchestrator.agent_cards import AGENT_REGISTRY
+
+    return tuple(
+        (
+            agent_id,
+            card.name,
+            f":gray[_{card.description}_]",
+            "\n".join(f"- `{skill.mcp_tool_name}` — {skill.description}" for skill in card.skills),
+        )
+        for agent_id, card in AGENT_REGISTRY.items()
+    )
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _load_docx_bytes(path: str, mtime: float) -> bytes:
+    """Read an exported DOCX once per (path, mtime) instead of every rerun."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _set_language():
+    """Selectbox callback: store the chosen language."""
+    st.session_state["language"] = st.session_state["lang_selector"]
+
+
 def render_sidebar(connected_agents: list[str]) -> str | None:
     """Render sidebar with controls and agent cards. Returns action string or None."""
+    lang = _bind_language()
     with st.sidebar:
         st.markdown(
             "<h1 style='text-align: center;'>Smart RFP Agent</h1>",
@@ -80,16 +129,16 @@ def render_sidebar(connected_agents: list[str]) -> str | None:
 
         # Language selector
         lang_options = ["EN", "ES"]
-        current_idx = lang_options.index(st.session_state.get("language", "EN"))
-        lang = st.selectbox(
+        current_idx = lang_options.index(lang)
+        # The callback runs before the rerun the change triggers, so that
+        # single pass already renders in the new language
+        st.selectbox(
             t("language"),
             options=lang_options,
             index=current_idx,
             key="lang_selector",
+            on_change=_set_language,
         )
-        if lang != st.session_state.get("language"):
-            st.session_state["language"] = lang
-            st.rerun()
 
         # New conversation
         if st.button(t("new_chat"), use_container_width=True, type="primary"):
@@ -102,38 +151,41 @@ def render_sidebar(connected_agents: list[str]) -> str | None:
 
         # Download button for generated DOCX
         docx_path = st.session_state.get("last_docx_path")
-        if docx_path and os.path.exists(docx_path):
-            with open(docx_path, "rb") as f:
-                st.download_button(
-                    label=t("export_docx"),
-                    data=f.read(),
-                    file_name=os.path.basename(docx_path),
-                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    use_container_width=True,
-                )
+        # One stat both checks the file is there and keys the bytes cache
+        try:
+            docx_mtime = os.stat(docx_path).st_mtime if docx_path else None
+        except OSError:
+            docx_mtime = None
+        if docx_mtime is not None:
+            st.download_button(
+                label=t("export_docx"),
+                data=_load_docx_bytes(docx_path, docx_mtime),
+                file_name=os.path.basename(docx_path),
+                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                use_container_width=True,
+            )
 
         st.divider()
 
         # Agent status cards
         st.subheader(t("agents_header"))
-        for agent_id, card in AGENT_REGISTRY.items():
+        for agent_id, name, description, skills_md in _agent_cards():
             is_connected = agent_id in connected_agents
             status_dot = "🟢" if is_connected else "🔴"
             status_text = t("connected") if is_connected else t("disconnected")
 
-            with st.expander(f"{status_dot} {card.name}", expanded=False):
-                st.caption(f"_{card.description}_")
-                st.markdown(f"**{t('skills')}:**")
-                for skill in card.skills:
-                    st.markdown(f"- `{skill.mcp_tool_name}` — {skill.description}")
+            with st.expander(f"{status_dot} {name}", expanded=False):
+                # One element per card: description, then the skill list
+                st.markdown(f"{description}\n\n**{t('skills')}:**\n\n{skills_md}")
 
     return None
 
 
 # ── Chat ────────────────────────────────────────────────────────────
 
-def render_chat_history(messages: list[dict]):
+def render_chat_history(messages: Iterable[dict]):
     """Render all chat messages in the main area."""
+    _bind_language()
     for msg in messages:
         role = msg["role"]
         with st.chat_message(role, avatar="🧑" if role == "user" else "🤖"):